@@ -0,0 +1,70 @@
+import argparse
+import os
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+from src.data_prep import functions
+from benchmarks.bench_teammate_points import build_session_results
+
+
+def loop_constructor_points(session_results, session_type, one_car_points=2, both_cars_points=5):
+    """Reference per-team loop plus separate aggregation the single grouped pass replaced."""
+    finished_counts = session_results[session_results['Status'] != 'Retired'].groupby('TeamId').size()
+    session_results[f'Constructor{session_type}FinishingPoints'] = 0
+    for team, count in finished_counts.items():
+        if count == 1:
+            session_results.loc[session_results['TeamId'] == team, f'Constructor{session_type}FinishingPoints'] = one_car_points
+        elif count >= 2:
+            session_results.loc[session_results['TeamId'] == team, f'Constructor{session_type}FinishingPoints'] = both_cars_points
+    finishing_df = session_results[['TeamId', f'Constructor{session_type}FinishingPoints']].drop_duplicates('TeamId')
+
+    aggregated = session_results.groupby('TeamId').agg({'Points': 'sum', f'PlacesGained{session_type}Floor': 'sum'}).reset_index()
+    aggregated.columns = ['TeamId', f'Total{session_type}Points', f'PlacesGained{session_type}Points']
+    aggregated[f'Constructor{session_type}Points'] = aggregated[f'Total{session_type}Points'] + aggregated[f'PlacesGained{session_type}Points']
+
+    constructor_points = finishing_df.merge(aggregated, on='TeamId', how='left')
+    constructor_points[f'TotalConstructor{session_type}Points'] = (constructor_points[f'Constructor{session_type}FinishingPoints'] +
+                                                                  constructor_points[f'Constructor{session_type}Points'])
+    return constructor_points.sort_values('TeamId').reset_index(drop=True)
+
+
+def build_race_results(n_teams, drivers_per_team=2, retired_share=0.2, seed=0):
+    """Synthetic driver-scored race results: points, floored places gained and random retirements."""
+    rng = np.random.default_rng(seed)
+    session_results = build_session_results(n_teams, drivers_per_team=drivers_per_team, seed=seed)
+    session_results['Points'] = rng.integers(0, 26, len(session_results)).astype(float)
+    session_results['Status'] = np.where(rng.random(len(session_results)) < retired_share, 'Retired', 'Finished')
+    session_results['PlacesGainedRaceFloor'] = (session_results['GridPosition'] - session_results['Position']).clip(lower=0)
+    return session_results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark grouped constructor points against the per-team loop.")
+    parser.add_argument('--teams', type=int, nargs='+', default=[10, 100, 1000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'teams':>6} {'rows':>6} {'loop_ms':>10} {'grouped_ms':>11} {'speedup':>8}")
+    for n_teams in args.teams:
+        session_results = build_race_results(n_teams)
+
+        loop_result = loop_constructor_points(session_results.copy(), 'Race')
+        grouped_result = functions.calculate_constructor_points(session_results.copy(), 'Race')
+        pd.testing.assert_frame_equal(loop_result, grouped_result[loop_result.columns], check_dtype=False)
+
+        loop_seconds = min(timeit.repeat(lambda: loop_constructor_points(session_results.copy(), 'Race'),
+                                         number=1, repeat=args.repeat))
+        grouped_seconds = min(timeit.repeat(lambda: functions.calculate_constructor_points(session_results.copy(), 'Race'),
+                                            number=1, repeat=args.repeat))
+
+        print(f"{n_teams:>6} {len(session_results):>6} {loop_seconds * 1000:>10.2f} "
+              f"{grouped_seconds * 1000:>11.2f} {loop_seconds / grouped_seconds:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Entry point module -> (import-time budget in milliseconds, whether it may import fastf1)
+IMPORT_BUDGETS = {
+    'src.data_prep.functions': (800, False),
+    'src.data_prep.scoring_rules': (800, False),
+    'src.data_prep.combine_event_points': (800, False),
+    'src.data_prep.get_most_recent_event_points': (800, False),
+    'src.data_prep.get_past_event_points': (800, False),
+    # The pipeline runner decides freshness before importing pandas, so a no-op run stays well under a second
+    'src.data_prep.run_pipeline': (150, False),
+}
+
+
+def measure_import(module_name):
+    """
+    Import ``module_name`` in a fresh interpreter with ``-X importtime``.
+    Returns:
+        tuple: Cumulative import time of the module in milliseconds, and the set of imported top-level packages.
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module_name}'],
+        cwd=project_root, capture_output=True, text=True, check=True,
+    )
+    cumulative_us = None
+    top_level_packages = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line.removeprefix('import time:').split('|'))
+        top_level_packages.add(name.split('.')[0])
+        if name == module_name:
+            cumulative_us = int(cumulative)
+    return cumulative_us / 1000, top_level_packages
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure entry point import times against their budgets.")
+    parser.add_argument('--runs', type=int, default=5, help="Fresh interpreters per entry point; the median is reported.")
+    args = parser.parse_args()
+
+    over_budget = []
+    print(f"{'entry point':<45} {'median_ms':>10} {'budget_ms':>10} {'fastf1':>7}")
+    for module_name, (budget_ms, allows_fastf1) in IMPORT_BUDGETS.items():
+        measurements = [measure_import(module_name) for _ in range(args.runs)]
+        median_ms = statistics.median(milliseconds for milliseconds, _ in measurements)
+        imports_fastf1 = 'fastf1' in measurements[0][1]
+        print(f"{module_name:<45} {median_ms:>10.1f} {budget_ms:>10} {str(imports_fastf1):>7}")
+        if median_ms > budget_ms or (imports_fastf1 and not allows_fastf1):
+            over_budget.append(module_name)
+
+    if over_budget:
+        print(f"Over budget: {', '.join(over_budget)}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,52 @@
+import argparse
+import glob
+import os
+import re
+import sys
+import tempfile
+
+import pandas as pd
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+from src.data_prep.points_schema import apply_points_schema, memory_usage_bytes
+
+DATA_DIR = os.path.join(project_root, 'data')
+
+
+def load_current_standings(entity_type, data_dir=DATA_DIR):
+    """Stack every season's _current standings for an entity type, tagged with the season year."""
+    frames = []
+    for path in sorted(glob.glob(os.path.join(data_dir, f'{entity_type}_points_*_current.csv'))):
+        year = int(re.search(r'_(\d{4})_current\.csv$', path).group(1))
+        frames.append(pd.read_csv(path).assign(Year=year))
+    return pd.concat(frames, ignore_index=True)
+
+
+def file_sizes(points_df):
+    """Return the CSV and Parquet sizes in bytes of a frame."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        csv_path = os.path.join(temp_dir, 'points.csv')
+        parquet_path = os.path.join(temp_dir, 'points.parquet')
+        points_df.to_csv(csv_path, index=False)
+        points_df.to_parquet(parquet_path, index=False)
+        return os.path.getsize(csv_path), os.path.getsize(parquet_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report memory and file-size savings of the compact points schema.")
+    parser.add_argument('--data-dir', default=DATA_DIR)
+    args = parser.parse_args()
+
+    print(f"{'entity':<12} {'rows':>6} {'mem_kb':>8} {'typed_kb':>9} {'csv_kb':>7} {'typed_csv_kb':>13} {'parquet_kb':>11} {'typed_parquet_kb':>17}")
+    for entity_type in ('driver', 'constructor'):
+        untyped = load_current_standings(entity_type, args.data_dir)
+        typed = apply_points_schema(untyped)
+        csv_size, parquet_size = file_sizes(untyped)
+        typed_csv_size, typed_parquet_size = file_sizes(typed)
+        print(f"{entity_type:<12} {len(untyped):>6} {memory_usage_bytes(untyped) / 1024:>8.1f} {memory_usage_bytes(typed) / 1024:>9.1f} "
+              f"{csv_size / 1024:>7.1f} {typed_csv_size / 1024:>13.1f} {parquet_size / 1024:>11.1f} {typed_parquet_size / 1024:>17.1f}")
+
+
+if __name__ == '__main__':
+    main()
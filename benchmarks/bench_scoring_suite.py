@@ -0,0 +1,190 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import timeit
+
+import pandas as pd
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+from src.data_prep import combine_event_points, functions
+from src.data_prep.scoring_rules import DEFAULT_SCORING_RULES
+from src.data_prep.synthetic_season import generate_season, stack_season_results
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+DEFAULT_TOLERANCE = 0.25
+# Best of 15 runs keeps scheduler noise out of the ~30 ms cases; slowdowns under 5 ms are noise at any ratio
+DEFAULT_REPEAT = 15
+DEFAULT_MIN_DELTA_SECONDS = 0.005
+
+
+def _driver_scored_sessions(events):
+    return [
+        {session_type: functions.calculate_intermediate_driver_points(session_results.copy(), session_type)
+         for session_type, session_results in event['sessions'].items()}
+        for event in events
+    ]
+
+
+def build_cases(events):
+    """
+    Build the benchmark cases for one synthetic season. Inputs of each case are prepared
+    up front so a case only times its own stage.
+    Returns:
+        dict: Case name -> zero-argument callable that runs the stage over every event.
+    """
+    scored_sessions = _driver_scored_sessions(events)
+    merged_drivers  = [functions.merge_points_dataframes(sessions, merge_key='DriverId') for sessions in scored_sessions]
+    season_results  = stack_season_results(events)
+    scoring_plan    = DEFAULT_SCORING_RULES.compile()
+
+    def intermediate_driver_points():
+        for event in events:
+            for session_type, session_results in event['sessions'].items():
+                functions.calculate_intermediate_driver_points(session_results.copy(), session_type)
+
+    def constructor_points():
+        for sessions in scored_sessions:
+            for session_type in ('Sprint', 'Race'):
+                if session_type in sessions:
+                    functions.calculate_constructor_points(sessions[session_type], session_type)
+
+    def merge_points():
+        for sessions in scored_sessions:
+            functions.merge_points_dataframes(sessions, merge_key='DriverId')
+
+    def final_driver_points():
+        for event, merged in zip(events, merged_drivers):
+            functions.calculate_final_driver_points(merged.copy(), event['EventFormat'])
+
+    def score_season():
+        scoring_plan.score_season(season_results)
+
+    return {
+        'intermediate_driver_points': intermediate_driver_points,
+        'constructor_points': constructor_points,
+        'merge_points_dataframes': merge_points,
+        'final_driver_points': final_driver_points,
+        'score_season': score_season,
+    }
+
+
+def build_combine_case(events, data_dir, year=2000):
+    """Write the season's per-event point files into ``data_dir`` and return a full-combine callable."""
+    driver_points, constructor_points = DEFAULT_SCORING_RULES.compile().score_season(stack_season_results(events))
+    for event in events:
+        event_round, event_name, event_format = event['RoundNumber'], event['EventName'], event['EventFormat']
+        driver_slim = functions.slim_driver_points_df(driver_points[driver_points['RoundNumber'] == event_round], event_format)
+        constructor_slim = functions.slim_constructor_points_df(
+            constructor_points[constructor_points['RoundNumber'] == event_round].copy(), event_format)
+        for entity_type, points_df in (('driver', driver_slim), ('constructor', constructor_slim)):
+            points_df.assign(EventName=event_name).to_csv(
+                combine_event_points.get_event_points_path(entity_type, year, event_round, event_name, data_dir), index=False)
+
+    season_events = [(event['RoundNumber'], event['EventName']) for event in events]
+
+    def combine():
+        combine_event_points.combine_points(year, season_events, data_dir=data_dir, export_csv=True, verbose=False)
+    return combine
+
+
+def run_suite(n_events=24, n_teams=10, drivers_per_team=2, sprint_ratio=0.25, repeat=DEFAULT_REPEAT, seed=0):
+    """
+    Time every case over one synthetic season.
+    Returns:
+        dict: The season configuration and the best-of-``repeat`` seconds per case.
+    """
+    config = {'events': n_events, 'teams': n_teams, 'drivers_per_team': drivers_per_team,
+              'sprint_ratio': sprint_ratio, 'repeat': repeat, 'seed': seed}
+    events = generate_season(n_events, n_teams, drivers_per_team, sprint_ratio, seed=seed)
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        cases = build_cases(events)
+        cases['combine'] = build_combine_case(events, data_dir)
+        results = {name: round(min(timeit.repeat(case, number=1, repeat=repeat)), 6) for name, case in cases.items()}
+
+    return {
+        'config': config,
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'results': results,
+    }
+
+
+def _season_config(config):
+    # The repeat count changes how reliably a case is timed, not what is timed
+    return {key: value for key, value in config.items() if key != 'repeat'}
+
+
+def compare_to_baseline(current, baseline, tolerance=DEFAULT_TOLERANCE, min_delta=DEFAULT_MIN_DELTA_SECONDS):
+    """
+    Compare a suite run against a stored baseline.
+    Args:
+        tolerance (float): Allowed relative slowdown, e.g. 0.25 for 25%.
+        min_delta (float): Slowdowns of at most this many seconds never count as regressions.
+    Returns:
+        list: (case, baseline seconds, current seconds, ratio, regressed) for every case in both runs.
+    """
+    if _season_config(current['config']) != _season_config(baseline['config']):
+        raise ValueError(f"Baseline was recorded with {baseline['config']}, not {current['config']}. Re-run with the same options.")
+    comparison = []
+    for name, baseline_seconds in baseline['results'].items():
+        if name not in current['results']:
+            continue
+        current_seconds = current['results'][name]
+        ratio = current_seconds / baseline_seconds if baseline_seconds else float('inf')
+        regressed = ratio > 1 + tolerance and current_seconds - baseline_seconds > min_delta
+        comparison.append((name, baseline_seconds, current_seconds, ratio, regressed))
+    return comparison
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the scoring helpers and combine step on a synthetic season.")
+    parser.add_argument('--events', type=int, default=24)
+    parser.add_argument('--teams', type=int, default=10)
+    parser.add_argument('--drivers-per-team', type=int, default=2)
+    parser.add_argument('--sprint-ratio', type=float, default=0.25)
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help="Runs per case; the fastest one counts.")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--baseline', default=BASELINE_PATH, help="Baseline JSON file to save to or compare against.")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--save-baseline', action='store_true', help="Store this run as the baseline.")
+    mode.add_argument('--compare', action='store_true', help="Compare this run against the baseline; exit 1 on a regression.")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help="Allowed slowdown before a case counts as regressed (0.25 = 25%%).")
+    parser.add_argument('--min-delta-ms', type=float, default=DEFAULT_MIN_DELTA_SECONDS * 1000,
+                        help="Ignore slowdowns of at most this many milliseconds, whatever the ratio.")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    current = run_suite(args.events, args.teams, args.drivers_per_team, args.sprint_ratio, args.repeat, args.seed)
+
+    if args.compare:
+        with open(args.baseline, 'r', encoding='utf-8') as file:
+            baseline = json.load(file)
+        comparison = compare_to_baseline(current, baseline, args.tolerance, args.min_delta_ms / 1000)
+        print(f"{'case':<28} {'baseline_ms':>12} {'current_ms':>11} {'ratio':>7}")
+        for name, baseline_seconds, current_seconds, ratio, regressed in comparison:
+            flag = '  ❌ regressed' if regressed else ''
+            print(f"{name:<28} {baseline_seconds * 1000:>12.2f} {current_seconds * 1000:>11.2f} {ratio:>6.2f}x{flag}")
+        return 1 if any(regressed for *_, regressed in comparison) else 0
+
+    print(f"{'case':<28} {'ms':>10}")
+    for name, seconds in current['results'].items():
+        print(f"{name:<28} {seconds * 1000:>10.2f}")
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as file:
+            json.dump(current, file, indent=2, sort_keys=True)
+            file.write("\n")
+        print(f"💾 Saved baseline to {args.baseline}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
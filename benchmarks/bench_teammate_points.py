@@ -0,0 +1,66 @@
+import argparse
+import os
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+from src.data_prep import functions
+
+
+def loop_teammate_points(session_results, position_column, points_column):
+    """Reference iterrows implementation the vectorized teammate stage replaced."""
+    session_results[points_column] = 0
+
+    for index, row in session_results.iterrows():
+        teammate_row = session_results.loc[(session_results['DriverId'] != row['DriverId']) & (session_results['TeamId'] == row['TeamId'])]
+        if not teammate_row.empty:
+            if row[position_column] < teammate_row.iloc[0][position_column]:
+                session_results.at[index, points_column] = 5
+
+    return session_results
+
+
+def build_session_results(n_teams, drivers_per_team=2, seed=0):
+    """Build a shuffled synthetic session results frame with ``n_teams * drivers_per_team`` rows."""
+    rng = np.random.default_rng(seed)
+    n_drivers = n_teams * drivers_per_team
+    session_results = pd.DataFrame({
+        'DriverId': [f'driver_{i}' for i in range(n_drivers)],
+        'TeamId': [f'team_{i // drivers_per_team}' for i in range(n_drivers)],
+        'Position': rng.permutation(n_drivers).astype(float) + 1,
+        'GridPosition': rng.permutation(n_drivers).astype(float) + 1,
+    })
+    return session_results.sample(frac=1, random_state=seed).reset_index(drop=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark vectorized teammate points against the iterrows loop.")
+    parser.add_argument('--teams', type=int, nargs='+', default=[10, 100, 500])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'teams':>6} {'rows':>6} {'loop_ms':>10} {'vectorized_ms':>14} {'speedup':>8}")
+    for n_teams in args.teams:
+        session_results = build_session_results(n_teams)
+
+        loop_result = loop_teammate_points(session_results.copy(), 'Position', 'TeammateRacePoints')
+        vectorized_result = functions.calculate_teammate_race_points(session_results.copy(), 'Race')
+        pd.testing.assert_series_equal(loop_result['TeammateRacePoints'], vectorized_result['TeammateRacePoints'], check_dtype=False)
+
+        loop_seconds = min(timeit.repeat(
+            lambda: loop_teammate_points(session_results.copy(), 'Position', 'TeammateRacePoints'),
+            number=1, repeat=args.repeat))
+        vectorized_seconds = min(timeit.repeat(
+            lambda: functions.calculate_teammate_race_points(session_results.copy(), 'Race'),
+            number=1, repeat=args.repeat))
+
+        print(f"{n_teams:>6} {len(session_results):>6} {loop_seconds * 1000:>10.2f} "
+              f"{vectorized_seconds * 1000:>14.2f} {loop_seconds / vectorized_seconds:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
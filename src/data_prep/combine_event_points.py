@@ -1,3 +1,5 @@
+import argparse
+import json
 import pandas as pd
 import datetime
 import os
@@ -5,68 +7,224 @@ import sys
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 sys.path.insert(0, project_root)
 from src.data_prep import functions
+from src.data_prep.data_paths import ENTITY_TYPES, file_sha256, get_event_points_path
+from src.data_prep.points_schema import apply_points_schema, read_points_csv
+from src.data_prep.run_report import recorded_run, stage
+from src.data_prep.season_schedule import get_data_dir
+from src.data_prep.season_store import SeasonPointsStore, csv_export_enabled, get_season_store_dir
 
-def main():
-    # Get past event names
-    past_event_names = functions.get_past_race_event_names()
-    print(f"🏁 Found {len(past_event_names)} past events: {list(past_event_names)}")
-    
-    # Prepare accumulators
-    driver_points_df = pd.DataFrame()
-    constructor_points_df = pd.DataFrame()
-    YEAR = functions.resolve_season_year(require_past_races=True)
 
-    if len(past_event_names) == 0:
-        print(f"No past race events found for {YEAR}. Skipping current standings file generation.")
-        return
-    
-    for past_event_name in past_event_names:
-        SELECTED_EVENT_ROUND = functions.get_round_number_from_event_name(past_event_name, year=YEAR)
-        driver_csv_path = os.path.join(os.path.dirname(__file__), '..', '..', 'data', f'driver_points_{YEAR}_{SELECTED_EVENT_ROUND}_{past_event_name}.csv')
-        print(f"🔍 Looking for driver file: {driver_csv_path}")
-        try:
-            driver_points_df_slim = pd.read_csv(driver_csv_path)
-            if not driver_points_df_slim.empty:
-                driver_points_df = pd.concat([driver_points_df, driver_points_df_slim], ignore_index=True)
-                print(f"✅ Loaded {len(driver_points_df_slim)} driver records from {past_event_name}")
-            else:
-                print(f"⚠️  Driver file for {past_event_name} is empty")
-        except FileNotFoundError:
-            print(f"❌ Driver file not found: {driver_csv_path}")
+def get_current_points_path(entity_type, year, data_dir=None):
+    return os.path.join(data_dir or get_data_dir(), f'{entity_type}_points_{year}_current.csv')
+
+
+def get_manifest_path(year, data_dir=None):
+    return os.path.join(data_dir or get_data_dir(), f'combine_manifest_{year}.json')
+
+
+def load_manifest(year, data_dir=None):
+    """Return the per-entity {event name: {'round', 'sha256'}} entries merged by the last combine."""
+    manifest_path = get_manifest_path(year, data_dir)
+    if not os.path.exists(manifest_path):
+        return {entity_type: {} for entity_type in ENTITY_TYPES}
+    with open(manifest_path, 'r', encoding='utf-8') as file:
+        manifest = json.load(file)
+    return {entity_type: manifest.get(entity_type, {}) for entity_type in ENTITY_TYPES}
+
+
+def save_manifest(year, manifest, data_dir=None):
+    with open(get_manifest_path(year, data_dir), 'w', encoding='utf-8') as file:
+        json.dump(manifest, file, ensure_ascii=False, indent=2, sort_keys=True)
+        file.write("\n")
+
+
+def _report(message, verbose):
+    if verbose:
+        print(message)
+
+
+def find_event_files(year, events, data_dir=None, verbose=True):
+    """
+    Locate and hash the per-event point files that belong in the current standings.
+
+    Rounds in the season store are read from their Parquet file; events scored before
+    the store existed fall back to their per-event CSV.
+    Args:
+        events (list): (round, event name) pairs in schedule order.
+        verbose (bool): Print every lookup and missing file.
+    Returns:
+        dict: Per entity type, {event name: {'round', 'path', 'sha256'}} in schedule order. As in the
+            full combine, an event without a driver file is left out for both entity types.
+    """
+    data_dir    = data_dir or get_data_dir()
+    store       = SeasonPointsStore(get_season_store_dir(data_dir))
+    event_files = {entity_type: {} for entity_type in ENTITY_TYPES}
+    for event_round, event_name in events:
+        event_paths = {}
+        for entity_type in ENTITY_TYPES:
+            store_path = store.path_for(entity_type, year, event_round)
+            event_paths[entity_type] = store_path if os.path.exists(store_path) else get_event_points_path(entity_type, year, event_round, event_name, data_dir)
+
+        driver_path = event_paths['driver']
+        _report(f"🔍 Looking for driver file: {driver_path}", verbose)
+        if not os.path.exists(driver_path):
+            _report(f"❌ Driver file not found: {driver_path}", verbose)
             continue
 
-        constructor_csv_path = os.path.join(os.path.dirname(__file__), '..', '..', 'data', f'constructor_points_{YEAR}_{SELECTED_EVENT_ROUND}_{past_event_name}.csv')
-        print(f"🔍 Looking for constructor file: {constructor_csv_path}")
-        try:
-            constructor_points_df_slim = pd.read_csv(constructor_csv_path)
-            if not constructor_points_df_slim.empty:
-                constructor_points_df = pd.concat([constructor_points_df, constructor_points_df_slim], ignore_index=True)
-                print(f"✅ Loaded {len(constructor_points_df_slim)} constructor records from {past_event_name}")
+        for entity_type in ENTITY_TYPES:
+            event_path = event_paths[entity_type]
+            if not os.path.exists(event_path):
+                _report(f"❌ {entity_type.capitalize()} file not found: {event_path}", verbose)
+                continue
+            event_files[entity_type][event_name] = {
+                'round': int(event_round),
+                'path': event_path,
+                'sha256': file_sha256(event_path),
+            }
+    return event_files
+
+
+def read_event_points(entity_type, event_name, event_file, verbose=True):
+    if event_file['path'].endswith('.parquet'):
+        # The round is the store's partition key; the standings files carry only the slim columns
+        points_df = pd.read_parquet(event_file['path']).drop(columns=['RoundNumber'], errors='ignore')
+    else:
+        points_df = read_points_csv(event_file['path'])
+    if points_df.empty:
+        _report(f"⚠️  {entity_type.capitalize()} file for {event_name} is empty", verbose)
+    else:
+        _report(f"✅ Loaded {len(points_df)} {entity_type} records from {event_name}", verbose)
+    return points_df
+
+
+def combine_full(entity_type, year, event_files, data_dir=None, verbose=True):
+    """Rebuild the current standings for one entity type from every per-event file."""
+    frames = [read_event_points(entity_type, event_name, event_file, verbose) for event_name, event_file in event_files.items()]
+    frames = [frame for frame in frames if not frame.empty]
+    points_df = apply_points_schema(pd.concat(frames, ignore_index=True)) if frames else pd.DataFrame()
+    _report(f"📊 Final {entity_type} DataFrame has {len(points_df)} records", verbose)
+    if not points_df.empty:
+        points_df.to_csv(get_current_points_path(entity_type, year, data_dir), index=False)
+    return points_df
+
+
+def combine_incremental(entity_type, year, event_files, merged_entries, data_dir=None, verbose=True):
+    """
+    Bring the current standings for one entity type up to date with the per-event files.
+
+    New events that land after every merged event are appended to the current file
+    without reading it. When an already merged event file changed (or disappeared),
+    only that event's rows are replaced. Anything else falls back to a full rebuild.
+    """
+    current_path = get_current_points_path(entity_type, year, data_dir)
+    if not merged_entries or not os.path.exists(current_path):
+        _report(f"🧱 No previous {entity_type} combine recorded; rebuilding {current_path}", verbose)
+        combine_full(entity_type, year, event_files, data_dir, verbose)
+        return
+
+    changed_events = [event_name for event_name, event_file in event_files.items()
+                      if merged_entries.get(event_name, {}).get('sha256') != event_file['sha256']]
+    removed_events = [event_name for event_name in merged_entries if event_name not in event_files]
+    if not changed_events and not removed_events:
+        _report(f"✅ {entity_type.capitalize()} standings already include every event file", verbose)
+        return
+
+    event_order     = list(event_files)
+    last_merged     = max((event_order.index(event_name) for event_name in merged_entries if event_name in event_files), default=-1)
+    appended_only   = not removed_events and all(
+        event_name not in merged_entries and event_order.index(event_name) > last_merged for event_name in changed_events)
+    new_frames      = {event_name: read_event_points(entity_type, event_name, event_files[event_name], verbose) for event_name in changed_events}
+
+    current_columns = pd.read_csv(current_path, nrows=0).columns
+    if appended_only and all(set(frame.columns) <= set(current_columns) for frame in new_frames.values()):
+        appended = apply_points_schema(pd.concat([frame.reindex(columns=current_columns) for frame in new_frames.values()], ignore_index=True))
+        appended.to_csv(current_path, mode='a', header=False, index=False)
+        _report(f"➕ Appended {len(appended)} {entity_type} records for {', '.join(changed_events)}", verbose)
+        return
+
+    current_df = read_points_csv(current_path)
+    kept_df    = current_df[~current_df['EventName'].isin(changed_events + removed_events)]
+    points_df  = pd.concat([kept_df] + [frame for frame in new_frames.values() if not frame.empty], ignore_index=True)
+
+    # Restore schedule order so the result matches a full rebuild
+    event_position = points_df['EventName'].map({event_name: position for position, event_name in enumerate(event_order)})
+    points_df = apply_points_schema(points_df.iloc[event_position.argsort(kind='stable')].reset_index(drop=True))
+    points_df.to_csv(current_path, index=False)
+    _report(f"🔁 Rebuilt {entity_type} rows for {', '.join(changed_events + removed_events)}", verbose)
+
+
+def combine_points(year, events, incremental=False, data_dir=None, export_csv=None, verbose=True):
+    """
+    Combine per-event point files into the season's current standings files.
+    Args:
+        year (int): The season year.
+        events (list): (round, event name) pairs in schedule order.
+        incremental (bool): Only merge event files that changed since the last combine.
+        export_csv (bool): Write the _current CSV files. Default is F1_POINTS_EXPORT_CSV (on); when off,
+            the season store is the only copy of the standings and nothing is written.
+        data_dir (str): Optional data directory. Default is the pipeline data directory (F1_POINTS_DATA_DIR),
+            resolved on every call.
+        verbose (bool): Print progress for every event file. Default is on, as for the scripts.
+    Returns:
+        bool: False when no event point files were available.
+    """
+    data_dir    = data_dir or get_data_dir()
+    event_files = find_event_files(year, events, data_dir, verbose)
+    if not event_files['driver'] and not event_files['constructor']:
+        print(f"No event point files were available for {year}. Skipping current standings file generation.")
+        return False
+
+    if not csv_export_enabled(export_csv):
+        _report(f"📦 CSV export is off; skipping the {year} current standings files.", verbose)
+        return True
+
+    merged_manifest = load_manifest(year, data_dir)
+    for entity_type in ENTITY_TYPES:
+        with stage('combine', entity_type=entity_type, year=int(year), incremental=incremental):
+            if incremental:
+                combine_incremental(entity_type, year, event_files[entity_type], merged_manifest[entity_type], data_dir, verbose)
             else:
-                print(f"⚠️  Constructor file for {past_event_name} is empty")
-        except FileNotFoundError:
-            print(f"❌ Constructor file not found: {constructor_csv_path}")
-            continue
-            
-    driver_points_df.reset_index(drop=True, inplace=True)
-    constructor_points_df.reset_index(drop=True, inplace=True)
-    
-    print(f"📊 Final driver DataFrame has {len(driver_points_df)} records")
-    print(f"📊 Final constructor DataFrame has {len(constructor_points_df)} records")
-    
-    # Save to data directory relative to project root
-    driver_output_path = os.path.join(os.path.dirname(__file__), '..', '..', 'data', f'driver_points_{YEAR}_current.csv')
-    constructor_output_path = os.path.join(os.path.dirname(__file__), '..', '..', 'data', f'constructor_points_{YEAR}_current.csv')
-
-    if driver_points_df.empty and constructor_points_df.empty:
-        print(f"No event point files were available for {YEAR}. Skipping current standings file generation.")
+                combine_full(entity_type, year, event_files[entity_type], data_dir, verbose)
+        _report(f"💾 Saved {entity_type} data to: {get_current_points_path(entity_type, year, data_dir)}", verbose)
+
+    save_manifest(year, {
+        entity_type: {event_name: {'round': event_file['round'], 'sha256': event_file['sha256']}
+                      for event_name, event_file in event_files[entity_type].items()}
+        for entity_type in ENTITY_TYPES
+    }, data_dir)
+    return True
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Combine per-event point files into the season's current standings.")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Append new events and rebuild only changed events, based on the combine manifest.")
+    parser.add_argument('--no-csv', dest='export_csv', action='store_false', default=None,
+                        help="Skip the _current CSV export and rely on the columnar season store.")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    with recorded_run('combine_event_points'):
+        run_combine(args)
+
+
+def run_combine(args):
+    with stage('schedule_resolve'):
+        # Get past event names
+        past_event_names = functions.get_past_race_event_names()
+        print(f"🏁 Found {len(past_event_names)} past events: {list(past_event_names)}")
+
+        YEAR = functions.resolve_season_year(require_past_races=True)
+
+    if len(past_event_names) == 0:
+        print(f"No past race events found for {YEAR}. Skipping current standings file generation.")
         return
 
-    driver_points_df.to_csv(driver_output_path, index=False)
-    constructor_points_df.to_csv(constructor_output_path, index=False)
-    
-    print(f"💾 Saved driver data to: {driver_output_path}")
-    print(f"💾 Saved constructor data to: {constructor_output_path}")
+    events = [(functions.get_round_number_from_event_name(past_event_name, year=YEAR), past_event_name)
+              for past_event_name in past_event_names]
+    combine_points(YEAR, events, incremental=args.incremental, export_csv=args.export_csv)
 
 if __name__ == '__main__':
     main()
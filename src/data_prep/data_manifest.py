@@ -0,0 +1,173 @@
+import datetime
+import json
+import os
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+# Standard library only: functions.resolve_season_year, the pipeline runner's freshness
+# checks and index.html all resolve the season from this file without pandas.
+from src.data_prep.data_paths import SESSIONS_FILE_PATTERN, file_sha256, find_event_paths, get_data_dir, get_sessions_path, race_is_past, read_races
+
+MANIFEST_FILE_NAME = 'manifest.json'
+MANIFEST_FORMAT_VERSION = 1
+# Bookkeeping that changes on every run stays out of the file listing
+UNLISTED_FILE_NAMES = {MANIFEST_FILE_NAME, 'pipeline_state.json'}
+
+
+def get_manifest_path(data_dir=None):
+    return os.path.join(data_dir or get_data_dir(), MANIFEST_FILE_NAME)
+
+
+def list_data_files(data_dir=None):
+    """{path relative to the data dir, with '/' separators: {'sha256', 'size'}} for every data file."""
+    data_dir = data_dir or get_data_dir()
+    files = {}
+    for root, dir_names, file_names in os.walk(data_dir):
+        dir_names[:] = sorted(name for name in dir_names if not name.startswith('.'))
+        for file_name in sorted(file_names):
+            if file_name in UNLISTED_FILE_NAMES or file_name.startswith('.') or file_name.endswith('.tmp'):
+                continue
+            path = os.path.join(root, file_name)
+            files[os.path.relpath(path, data_dir).replace(os.sep, '/')] = {'sha256': file_sha256(path), 'size': os.path.getsize(path)}
+    return files
+
+
+def build_manifest(data_dir=None, now=None):
+    """
+    Describe the data directory.
+    Args:
+        data_dir (str): Optional data directory. Default is the pipeline data directory.
+        now (datetime.datetime): Optional time the manifest is built for. Default is now (UTC).
+    Returns:
+        dict: Every season with a sessions file (its races, the rounds completed and scored,
+            the latest scored round and its page files), the season the pipeline would pick,
+            and the hash and size of every data file.
+    """
+    data_dir = data_dir or get_data_dir()
+    now      = now or datetime.datetime.now(datetime.timezone.utc)
+    files    = list_data_files(data_dir)
+    seasons  = {}
+    for file_name in files:
+        match = SESSIONS_FILE_PATTERN.match(file_name)
+        if not match:
+            continue
+        year   = int(match.group(1))
+        races  = read_races(get_sessions_path(year, data_dir))
+        events = [(race['round'], race['event_name']) for race in races]
+        scored_paths  = find_event_paths(year, events, data_dir)
+        scored_rounds = sorted({race['round'] for race in races if f"driver/{race['round']}/{race['event_name']}" in scored_paths})
+        latest_scored = max((race for race in races if race['round'] in scored_rounds), key=lambda race: race['round'], default=None)
+        page_files = {
+            'driver_most_recent': f'driver_points_{year}_most_recent.csv',
+            'constructor_most_recent': f'constructor_points_{year}_most_recent.csv',
+            'bundle': f'season_bundle_{year}.json',
+        }
+        seasons[str(year)] = {
+            'races': [{'RoundNumber': race['round'], 'EventName': race['event_name'], 'EventDate': race['event_date']} for race in races],
+            'completed_rounds': [race['round'] for race in races if race_is_past(race['event_date'], now)],
+            'scored_rounds': scored_rounds,
+            'latest_scored_round': None if latest_scored is None else {'RoundNumber': latest_scored['round'], 'EventName': latest_scored['event_name']},
+            **{key: (file_name if file_name in files else None) for key, file_name in page_files.items()},
+        }
+
+    return {
+        'format_version': MANIFEST_FORMAT_VERSION,
+        'generated_at_utc': now.isoformat(),
+        'latest_season': resolve_season_year(seasons, now),
+        'seasons': seasons,
+        'files': files,
+    }
+
+
+def load_manifest(data_dir=None):
+    """Return the data directory's manifest, or None when it is missing or from another format version."""
+    manifest_path = get_manifest_path(data_dir)
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as file:
+            manifest = json.load(file)
+    except (OSError, ValueError):
+        return None
+    return manifest if manifest.get('format_version') == MANIFEST_FORMAT_VERSION else None
+
+
+def load_current_manifest(data_dir=None):
+    """
+    Return the data directory's manifest while it still describes the sessions files on disk,
+    or None. A sessions file that was added, removed, resized or modified after the manifest
+    was last written or confirmed (manifest.json's mtime) makes it stale.
+    """
+    data_dir = data_dir or get_data_dir()
+    manifest = load_manifest(data_dir)
+    if manifest is None:
+        return None
+    listed = {file_name: entry['size'] for file_name, entry in manifest['files'].items() if SESSIONS_FILE_PATTERN.match(file_name)}
+    try:
+        manifest_mtime = os.stat(get_manifest_path(data_dir)).st_mtime_ns
+        with os.scandir(data_dir) as entries:
+            on_disk = {entry.name: entry.stat() for entry in entries if SESSIONS_FILE_PATTERN.match(entry.name)}
+    except OSError:
+        return None
+    if on_disk.keys() != listed.keys():
+        return None
+    if any(stat.st_size != listed[file_name] or stat.st_mtime_ns > manifest_mtime for file_name, stat in on_disk.items()):
+        return None
+    return manifest
+
+
+def write_manifest(manifest, data_dir=None):
+    """
+    Write the manifest atomically. A manifest that differs from the file only in its
+    generation time is not rewritten, so runs that change nothing leave no diff behind;
+    the file is only touched, which marks it as checked against the files on disk.
+    Returns:
+        bool: Whether the file was written.
+    """
+    previous = load_manifest(data_dir)
+    manifest_path = get_manifest_path(data_dir)
+    if previous is not None and {**previous, 'generated_at_utc': None} == {**manifest, 'generated_at_utc': None}:
+        os.utime(manifest_path)
+        return False
+    os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+    temp_path = f'{manifest_path}.{os.getpid()}.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as file:
+        json.dump(manifest, file, ensure_ascii=False, indent=2)
+        file.write("\n")
+    os.replace(temp_path, manifest_path)
+    return True
+
+
+def refresh_manifest(data_dir=None, now=None):
+    """Rebuild data/manifest.json from the files on disk; returns the manifest."""
+    manifest = build_manifest(data_dir, now)
+    write_manifest(manifest, data_dir)
+    return manifest
+
+
+def season_years(seasons):
+    return sorted((int(year) for year in seasons), reverse=True)
+
+
+def has_past_races(seasons, year, today):
+    season = seasons.get(str(year))
+    return season is not None and any(race_is_past(race['EventDate'], today) for race in season['races'])
+
+
+def resolve_season_year(seasons, today, year=None, require_past_races=True):
+    """
+    functions.resolve_season_year over a manifest's seasons: the requested year, then the
+    year of ``today``, then the latest season, keeping only seasons with a sessions file
+    (and with a race before ``today`` when ``require_past_races``). None when none qualifies.
+    """
+    candidate_years = [year if year is not None else today.year, today.year] + season_years(seasons)
+    for season_year in dict.fromkeys(candidate_years):
+        if str(season_year) not in seasons:
+            continue
+        if require_past_races and not has_past_races(seasons, season_year, today):
+            continue
+        return season_year
+    return None
+
+
+if __name__ == '__main__':
+    manifest = refresh_manifest()
+    print(f"🗂️  Manifest lists {len(manifest['files'])} files and seasons {', '.join(map(str, season_years(manifest['seasons'])))}")
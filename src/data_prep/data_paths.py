@@ -0,0 +1,129 @@
+import csv
+import datetime
+import hashlib
+import os
+import re
+# Standard library only: the pipeline runner's freshness checks and the data manifest locate
+# files through these helpers without importing pandas.
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'data')
+DATA_DIR_ENV = 'F1_POINTS_DATA_DIR'
+SEASON_STORE_DIR_ENV = 'F1_POINTS_SEASON_STORE_DIR'
+EXPORT_CSV_ENV = 'F1_POINTS_EXPORT_CSV'
+ENTITY_TYPES = ['driver', 'constructor']
+
+REGISTRY_FILE_NAME = 'entity_registry.json'
+# One combined driver and constructor price file per FantasyGP scrape (get_fantasygp_prices.save_prices)
+CURRENT_PRICES_FILE_NAME = 'fantasygp_prices_current.csv'
+PRICE_SNAPSHOT_PATTERN = re.compile(r'^fantasygp_prices_(\d{4}-\d{2}-\d{2})\.csv$')
+# Per-event, _most_recent and _current point files; the entity registry collects FastF1 ids from them
+POINTS_FILE_PATTERN = re.compile(r'^(driver|constructor)_points_\d{4}_.+\.csv$')
+SESSIONS_FILE_PATTERN = re.compile(r'^sessions_(\d{4})\.csv$')
+
+
+def get_data_dir():
+    """Get the pipeline data directory (F1_POINTS_DATA_DIR, or the repository data/ directory)."""
+    return os.environ.get(DATA_DIR_ENV, DATA_DIR)
+
+
+def get_season_store_dir(data_dir=None):
+    """Get the season store directory (F1_POINTS_SEASON_STORE_DIR, or season_store under data/)."""
+    return os.environ.get(SEASON_STORE_DIR_ENV, os.path.join(data_dir or get_data_dir(), 'season_store'))
+
+
+def get_season_store_path(entity_type, year, event_round, root=None):
+    """The Parquet file of one round in the season store (``{year}/{entity_type}/round_{NN}.parquet``)."""
+    return os.path.join(root or get_season_store_dir(), str(year), entity_type, f'round_{int(event_round):02d}.parquet')
+
+
+def csv_export_enabled(export_csv=None):
+    """Resolve whether the per-event CSV copies should be written (F1_POINTS_EXPORT_CSV, on by default)."""
+    if export_csv is not None:
+        return export_csv
+    return os.environ.get(EXPORT_CSV_ENV, '1').strip().lower() not in ('0', 'false', 'no', 'off')
+
+
+def get_sessions_path(year, data_dir=None):
+    return os.path.join(data_dir or get_data_dir(), f'sessions_{year}.csv')
+
+
+def get_event_points_path(entity_type, year, event_round, event_name, data_dir=None):
+    return os.path.join(data_dir or get_data_dir(), f'{entity_type}_points_{year}_{event_round}_{event_name}.csv')
+
+
+def get_registry_path(data_dir=None):
+    return os.path.join(data_dir or get_data_dir(), REGISTRY_FILE_NAME)
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def list_price_snapshots(data_dir=None):
+    """(snapshot date, path) of every dated FantasyGP price file in the data dir, oldest first."""
+    data_dir = data_dir or get_data_dir()
+    if not os.path.isdir(data_dir):
+        return []
+    snapshots = []
+    for file_name in os.listdir(data_dir):
+        match = PRICE_SNAPSHOT_PATTERN.match(file_name)
+        if match:
+            snapshots.append((match.group(1), os.path.join(data_dir, file_name)))
+    return sorted(snapshots)
+
+
+def find_event_paths(year, events, data_dir=None):
+    """
+    Point file of each (round, event name) and entity, keyed 'entity/round/event'; events without one are left out.
+    Same preference as combine_event_points.find_event_files: the season store Parquet first, then the per-event CSV.
+    """
+    data_dir   = data_dir or get_data_dir()
+    store_root = get_season_store_dir(data_dir)
+    event_paths = {}
+    for event_round, event_name in events:
+        for entity_type in ENTITY_TYPES:
+            store_path = get_season_store_path(entity_type, year, event_round, store_root)
+            event_path = store_path if os.path.exists(store_path) else get_event_points_path(entity_type, year, event_round, event_name, data_dir)
+            if os.path.exists(event_path):
+                event_paths[f'{entity_type}/{event_round}/{event_name}'] = event_path
+    return event_paths
+
+
+def _parse_utc(value):
+    try:
+        parsed = datetime.datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+    return parsed.replace(tzinfo=datetime.timezone.utc) if parsed.tzinfo is None else parsed.astimezone(datetime.timezone.utc)
+
+
+def _utc_date(today):
+    # Naive times are UTC wall-clock times, as in season_schedule
+    return (today.replace(tzinfo=datetime.timezone.utc) if today.tzinfo is None else today.astimezone(datetime.timezone.utc)).date()
+
+
+def read_races(path):
+    """Race sessions of a sessions_<year>.csv as dicts with round, event name, event date and session time, in file order."""
+    races = []
+    if not os.path.exists(path):
+        return races
+    with open(path, 'r', encoding='utf-8', newline='') as file:
+        for row in csv.DictReader(file):
+            if row.get('SessionName') != 'Race':
+                continue
+            races.append({
+                'round': int(float(row['RoundNumber'])),
+                'event_name': row['EventName'],
+                'event_date': (row.get('EventDate') or '')[:10],
+                'session_utc': _parse_utc(row.get('SessionDateUtc')),
+            })
+    return races
+
+
+def race_is_past(event_date, today):
+    """A race counts as past from the end of its event day (UTC), as in SeasonSchedule."""
+    return bool(event_date) and event_date < _utc_date(today).isoformat()
@@ -0,0 +1,213 @@
+import argparse
+import glob
+import json
+import os
+import re
+import sys
+
+import pandas as pd
+
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+from src.data_prep.data_paths import CURRENT_PRICES_FILE_NAME, POINTS_FILE_PATTERN, get_registry_path, list_price_snapshots
+from src.data_prep.run_report import recorded_run, stage
+from src.data_prep.season_schedule import get_data_dir
+from src.data_prep.season_store import get_season_store_dir
+
+REGISTRY_FORMAT_VERSION = 1
+ENTITY_TYPES = ['driver', 'constructor']
+ID_COLUMNS = {'driver': 'DriverId', 'constructor': 'TeamId'}
+
+# FastF1 ids whose FantasyGP name differs beyond the last-name rule, most likely first
+ENTITY_ALIASES = {
+    'constructor': {
+        'rb': ['racing_bulls', 'visa_cash_app_rb'],
+        'racing_bulls': ['rb', 'visa_cash_app_rb'],
+        'visa_cash_app_rb': ['rb', 'racing_bulls'],
+        'red_bull_racing': ['red_bull'],
+        'mercedes_amg_petronas': ['mercedes'],
+        'mclaren_formula_1_team': ['mclaren'],
+        'aston_martin_aramco': ['aston_martin'],
+        'stake_f1_team_kick_sauber': ['sauber', 'audi'],
+        'alpine_renault': ['alpine'],
+    },
+    'driver': {
+        'max_verstappen': ['verstappen'],
+        'arvid_lindblad': ['lindblad', 'arvid_lindlblad'],
+    },
+}
+
+
+def normalize_name_key(name):
+    # Same rule as get_fantasygp_prices._normalize_name_key, without importing the scraper
+    return re.sub(r'[^a-z0-9]+', '_', str(name).strip().lower()).strip('_')
+
+
+def price_key_candidates(entity_type, entity_id):
+    """FantasyGP NameKeys that may price a FastF1 DriverId/TeamId, most specific first."""
+    entity_key = normalize_name_key(entity_id)
+    candidates = [entity_key, *ENTITY_ALIASES[entity_type].get(entity_key, [])]
+    if entity_type == 'driver' and '_' in entity_key:
+        # FantasyGP lists most drivers by last name only
+        candidates.append(entity_key.split('_')[-1])
+    return list(dict.fromkeys(candidate for candidate in candidates if candidate))
+
+
+class EntityRegistry:
+    """
+    One canonical id per driver and constructor, with a hash index from every known alias to it.
+
+    FastF1 identifies entities by ``DriverId``/``TeamId`` (``max_verstappen``, ``rb``) and
+    FantasyGP by ``NameKey`` (``verstappen``, ``racing_bulls``). A priced entity's canonical
+    id is its FantasyGP key, and every FastF1 id matched to it is an alias. An entity seen
+    on one side only keeps its own id and is listed as unmatched. Matching runs once, when
+    the registry is built; after that, resolving an id is one dictionary lookup, and
+    ``canonical_ids`` resolves a whole column with one vectorized merge.
+    """
+
+    def __init__(self, entities, unmatched):
+        self.entities  = entities
+        self.unmatched = unmatched
+        self.index = {(entity_type, alias): canonical_id
+                      for entity_type, by_id in entities.items()
+                      for canonical_id, entity in by_id.items()
+                      for alias in [canonical_id, *entity['fastf1_ids']]}
+        self._index_frame = pd.DataFrame(
+            [(entity_type, alias, canonical_id) for (entity_type, alias), canonical_id in self.index.items()],
+            columns=['EntityType', 'Alias', 'CanonicalId'])
+
+    @classmethod
+    def build(cls, fastf1_ids, prices):
+        """
+        Match FastF1 ids to FantasyGP price keys.
+        Args:
+            fastf1_ids (dict): Entity type -> iterable of DriverIds or TeamIds.
+            prices (pd.DataFrame): EntityType, Name and NameKey of every known price row.
+        Returns:
+            EntityRegistry: The registry.
+        """
+        entities  = {entity_type: {} for entity_type in ENTITY_TYPES}
+        unmatched = {entity_type: {'fastf1_ids': [], 'price_keys': []} for entity_type in ENTITY_TYPES}
+        name_keys = prices['NameKey'].fillna(prices['Name']) if 'Name' in prices.columns else prices['NameKey']
+        for entity_type, price_key, name in zip(prices['EntityType'], name_keys.map(normalize_name_key, na_action='ignore'),
+                                                prices.get('Name', name_keys)):
+            if entity_type in entities and isinstance(price_key, str) and price_key:
+                entities[entity_type].setdefault(price_key, {'name': name, 'price_key': price_key, 'fastf1_ids': []})
+
+        for entity_type in ENTITY_TYPES:
+            for fastf1_id in sorted({normalize_name_key(fastf1_id) for fastf1_id in fastf1_ids.get(entity_type, [])} - {''}):
+                price_key = next((key for key in price_key_candidates(entity_type, fastf1_id) if key in entities[entity_type]
+                                  and entities[entity_type][key]['price_key'] is not None), None)
+                if price_key is None:
+                    entities[entity_type].setdefault(fastf1_id, {'name': None, 'price_key': None, 'fastf1_ids': [fastf1_id]})
+                    unmatched[entity_type]['fastf1_ids'].append(fastf1_id)
+                elif fastf1_id != price_key:
+                    entities[entity_type][price_key]['fastf1_ids'].append(fastf1_id)
+                else:
+                    entities[entity_type][price_key]['fastf1_ids'].insert(0, fastf1_id)
+            unmatched[entity_type]['price_keys'] = sorted(
+                canonical_id for canonical_id, entity in entities[entity_type].items()
+                if entity['price_key'] is not None and not entity['fastf1_ids'])
+            entities[entity_type] = dict(sorted(entities[entity_type].items()))
+        return cls(entities, unmatched)
+
+    def canonical_id(self, entity_type, entity_id):
+        """The canonical id of one DriverId, TeamId or NameKey, or None when it is not registered."""
+        return self.index.get((entity_type, normalize_name_key(entity_id)))
+
+    def canonical_ids(self, frame, id_column):
+        """
+        Resolve a column of DriverIds, TeamIds or NameKeys with one merge.
+        Args:
+            frame (pd.DataFrame): EntityType and ``id_column`` columns.
+            id_column (str): The column to resolve.
+        Returns:
+            pd.Series: CanonicalId per row of ``frame`` (NaN for unregistered ids).
+        """
+        aliases = pd.DataFrame({'EntityType': frame['EntityType'].to_numpy(),
+                                'Alias': frame[id_column].map(normalize_name_key, na_action='ignore').to_numpy()})
+        resolved = aliases.merge(self._index_frame, on=['EntityType', 'Alias'], how='left')
+        return pd.Series(resolved['CanonicalId'].to_numpy(), index=frame.index, name='CanonicalId')
+
+    def to_dict(self):
+        return {'format_version': REGISTRY_FORMAT_VERSION, 'entities': self.entities, 'unmatched': self.unmatched}
+
+    @classmethod
+    def from_dict(cls, registry_dict):
+        return cls(registry_dict['entities'], registry_dict['unmatched'])
+
+
+def collect_fastf1_ids(data_dir=None):
+    """Every DriverId and TeamId in the per-event, _most_recent and _current point files and the season store."""
+    data_dir = data_dir or get_data_dir()
+    fastf1_ids = {entity_type: set() for entity_type in ENTITY_TYPES}
+    for file_name in sorted(os.listdir(data_dir)) if os.path.isdir(data_dir) else []:
+        match = POINTS_FILE_PATTERN.match(file_name)
+        if match:
+            entity_type = match.group(1)
+            fastf1_ids[entity_type].update(pd.read_csv(os.path.join(data_dir, file_name), usecols=[ID_COLUMNS[entity_type]]).iloc[:, 0].dropna())
+    for entity_type in ENTITY_TYPES:
+        for path in glob.glob(os.path.join(get_season_store_dir(data_dir), '*', entity_type, 'round_*.parquet')):
+            fastf1_ids[entity_type].update(pd.read_parquet(path, columns=[ID_COLUMNS[entity_type]]).iloc[:, 0].dropna())
+    return fastf1_ids
+
+
+def collect_price_rows(data_dir=None):
+    """EntityType, Name and NameKey of every dated FantasyGP snapshot and the current prices."""
+    data_dir = data_dir or get_data_dir()
+    paths = [path for _, path in list_price_snapshots(data_dir)] + [os.path.join(data_dir, CURRENT_PRICES_FILE_NAME)]
+    frames = [pd.read_csv(path).reindex(columns=['EntityType', 'Name', 'NameKey']) for path in paths if os.path.exists(path)]
+    if not frames:
+        return pd.DataFrame(columns=['EntityType', 'Name', 'NameKey'])
+    # Later snapshots win, so the registry carries the latest display names
+    return pd.concat(frames[::-1], ignore_index=True)
+
+
+def build_entity_registry(data_dir=None):
+    return EntityRegistry.build(collect_fastf1_ids(data_dir), collect_price_rows(data_dir))
+
+
+def load_entity_registry(data_dir=None):
+    """The registry stored in data/entity_registry.json, or one built from the data dir when none is stored."""
+    registry_path = get_registry_path(data_dir)
+    if os.path.exists(registry_path):
+        with open(registry_path, 'r', encoding='utf-8') as file:
+            registry_dict = json.load(file)
+        if registry_dict.get('format_version') == REGISTRY_FORMAT_VERSION:
+            return EntityRegistry.from_dict(registry_dict)
+    return build_entity_registry(data_dir)
+
+
+def write_entity_registry(data_dir=None):
+    """Build the registry from the data dir and store it as data/entity_registry.json (atomically)."""
+    with stage('entity_registry'):
+        registry = build_entity_registry(data_dir)
+        registry_path = get_registry_path(data_dir)
+        temp_path = f'{registry_path}.{os.getpid()}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump(registry.to_dict(), file, ensure_ascii=False, indent=2)
+            file.write("\n")
+        os.replace(temp_path, registry_path)
+
+    counts = ', '.join(f"{len(registry.entities[entity_type])} {entity_type}s" for entity_type in ENTITY_TYPES)
+    print(f"🪪 Wrote entity registry with {counts} to {registry_path}")
+    for entity_type in ENTITY_TYPES:
+        for side, ids in registry.unmatched[entity_type].items():
+            if ids:
+                print(f"⚠️  Unmatched {entity_type} {side.replace('_', ' ')}: {', '.join(ids)}")
+    return registry
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Match FastF1 driver and team ids to FantasyGP price keys and store the registry.")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    parse_args(argv)
+    with recorded_run('entity_registry'):
+        write_entity_registry()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,356 @@
+import argparse
+import datetime
+import io
+import json
+import os
+import re
+import shutil
+import sys
+import tarfile
+import threading
+import time
+
+import pandas as pd
+
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+from src.data_prep.functions import get_fastf1_cache_path
+
+CACHE_MAX_BYTES_ENV = 'F1_POINTS_CACHE_MAX_BYTES'
+INDEX_FILE_NAME = 'cache_index.json'
+ARCHIVE_MANIFEST_NAME = 'cache_archive.json'
+ARCHIVE_FORMAT_VERSION = 1
+
+_SIZE_UNITS = {'': 1, 'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+
+
+def parse_size(size):
+    """Parse a byte size such as ``1073741824``, ``512M`` or ``2G``."""
+    if size is None or size == '':
+        return None
+    match = re.fullmatch(r'\s*(\d+(?:\.\d+)?)\s*([KMG]?)B?\s*', str(size).upper())
+    if match is None:
+        raise ValueError(f"Invalid cache size '{size}'. Use bytes or a K/M/G suffix, e.g. 512M.")
+    return int(float(match.group(1)) * _SIZE_UNITS[match.group(2)])
+
+
+def _dir_bytes(path):
+    total = 0
+    for dir_path, _, file_names in os.walk(path):
+        for file_name in file_names:
+            try:
+                total += os.path.getsize(os.path.join(dir_path, file_name))
+            except OSError:
+                pass
+    return total
+
+
+class FastF1CacheManager:
+    """
+    Size-bounded, LRU-evicted view over one FastF1 cache scope.
+
+    FastF1 keeps each session in ``<cache>/<year>/<event>/<session>/``. The manager tracks
+    the last use of every session directory and hit/miss counters in ``cache_index.json``
+    at the cache root, and evicts the least recently used sessions once the session directories
+    grow past ``max_bytes`` (F1_POINTS_CACHE_MAX_BYTES). FastF1's http cache and the index are
+    not evictable, so they do not count towards the cap. The index is rewritten atomically;
+    concurrent processes may drop each other's last-use updates, which only makes the
+    LRU order approximate.
+    """
+
+    def __init__(self, cache_scope='event_points', max_bytes=None, root=None):
+        self.cache_scope = cache_scope
+        self.root = root or get_fastf1_cache_path(cache_scope)
+        self.max_bytes = max_bytes if max_bytes is not None else parse_size(os.environ.get(CACHE_MAX_BYTES_ENV))
+        self._lock = threading.Lock()
+
+    @property
+    def index_path(self):
+        return os.path.join(self.root, INDEX_FILE_NAME)
+
+    def session_key(self, api_path):
+        """Cache-relative session directory for a FastF1 ``Session.api_path`` ('/static/<year>/<event>/<session>/')."""
+        return api_path.removeprefix('/static/').strip('/')
+
+    def is_cached(self, session_key):
+        session_dir = os.path.join(self.root, session_key)
+        return os.path.isdir(session_dir) and any(name.endswith('.ff1pkl') for name in os.listdir(session_dir))
+
+    def load_index(self):
+        if not os.path.exists(self.index_path):
+            return {'sessions': {}, 'stats': {'hits': 0, 'misses': 0, 'evictions': 0}}
+        with open(self.index_path, 'r', encoding='utf-8') as file:
+            index = json.load(file)
+        index.setdefault('sessions', {})
+        index.setdefault('stats', {})
+        for counter in ('hits', 'misses', 'evictions'):
+            index['stats'].setdefault(counter, 0)
+        return index
+
+    def _save_index(self, index):
+        os.makedirs(self.root, exist_ok=True)
+        temp_path = f'{self.index_path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump(index, file, ensure_ascii=False, indent=2, sort_keys=True)
+            file.write("\n")
+        os.replace(temp_path, self.index_path)
+
+    def record_access(self, session_key, hit):
+        """Mark a session as just used, count the hit or miss, and evict down to the size cap."""
+        with self._lock:
+            index = self.load_index()
+            index['sessions'][session_key] = {'last_used': time.time()}
+            index['stats']['hits' if hit else 'misses'] += 1
+            self._save_index(index)
+        if self.max_bytes is not None:
+            self.evict(keep={session_key})
+
+    def session_dirs(self):
+        """Return {session key: bytes} for every session directory in the cache."""
+        sessions = {}
+        if not os.path.isdir(self.root):
+            return sessions
+        for year in os.listdir(self.root):
+            year_dir = os.path.join(self.root, year)
+            if not (year.isdigit() and os.path.isdir(year_dir)):
+                continue
+            for event in os.listdir(year_dir):
+                event_dir = os.path.join(year_dir, event)
+                if not os.path.isdir(event_dir):
+                    continue
+                for session in os.listdir(event_dir):
+                    session_dir = os.path.join(event_dir, session)
+                    if os.path.isdir(session_dir):
+                        sessions[f'{year}/{event}/{session}'] = _dir_bytes(session_dir)
+        return sessions
+
+    def evict(self, max_bytes=None, keep=()):
+        """
+        Remove least recently used sessions until the session directories fit in ``max_bytes``.
+        Args:
+            max_bytes (int): Size cap. Default is the manager's cap.
+            keep (set): Session keys that must not be evicted (e.g. the one being loaded).
+        Returns:
+            list: Evicted session keys, oldest first.
+        """
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        if max_bytes is None:
+            return []
+
+        with self._lock:
+            index       = self.load_index()
+            sessions    = self.session_dirs()
+            total_bytes = sum(sessions.values())
+
+            def last_used(session_key):
+                # Sessions cached before the index existed fall back to their directory mtime
+                entry = index['sessions'].get(session_key)
+                return entry['last_used'] if entry else os.path.getmtime(os.path.join(self.root, session_key))
+
+            evicted = []
+            for session_key in sorted(sessions, key=last_used):
+                if total_bytes <= max_bytes:
+                    break
+                if session_key in keep:
+                    continue
+                shutil.rmtree(os.path.join(self.root, session_key), ignore_errors=True)
+                total_bytes -= sessions[session_key]
+                index['sessions'].pop(session_key, None)
+                evicted.append(session_key)
+
+            if evicted:
+                index['stats']['evictions'] += len(evicted)
+                self._save_index(index)
+        return evicted
+
+    def stats(self):
+        """
+        Summarize the cache.
+        Returns:
+            dict: Cumulative hits, misses and evictions, the hit rate, session count, total bytes and the size cap.
+        """
+        index    = self.load_index()
+        sessions = self.session_dirs()
+        lookups  = index['stats']['hits'] + index['stats']['misses']
+        return {
+            'cache_dir': self.root,
+            **index['stats'],
+            'hit_rate': round(index['stats']['hits'] / lookups, 4) if lookups else None,
+            'sessions': len(sessions),
+            'session_bytes': sum(sessions.values()),
+            'bytes': _dir_bytes(self.root) if os.path.isdir(self.root) else 0,
+            'max_bytes': self.max_bytes,
+        }
+
+    def archive(self, archive_path):
+        """
+        Pack the cache into a portable ``.tar.gz`` with a ``cache_archive.json`` manifest.
+
+        Paths in the archive are relative to the cache root, so it restores into any
+        checkout or runner. Fast gzip level 1 keeps archiving and restoring quick.
+        Returns:
+            dict: The archive manifest.
+        """
+        manifest = {
+            'format_version': ARCHIVE_FORMAT_VERSION,
+            'cache_scope': self.cache_scope,
+            'created_at_utc': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            'sessions': sorted(self.session_dirs()),
+        }
+        parent_dir = os.path.dirname(archive_path)
+        if parent_dir:
+            os.makedirs(parent_dir, exist_ok=True)
+
+        temp_path = f'{archive_path}.{os.getpid()}.tmp'
+        with tarfile.open(temp_path, 'w:gz', compresslevel=1) as archive:
+            manifest_bytes = json.dumps(manifest, indent=2, sort_keys=True).encode('utf-8')
+            manifest_info = tarfile.TarInfo(ARCHIVE_MANIFEST_NAME)
+            manifest_info.size = len(manifest_bytes)
+            archive.addfile(manifest_info, io.BytesIO(manifest_bytes))
+            if os.path.isdir(self.root):
+                for entry in sorted(os.listdir(self.root)):
+                    archive.add(os.path.join(self.root, entry), arcname=entry)
+        os.replace(temp_path, archive_path)
+        return manifest
+
+    def restore(self, archive_path):
+        """
+        Unpack an archive made by ``archive`` into the cache root, then apply the size cap.
+        Returns:
+            dict: The archive manifest.
+        Raises:
+            ValueError: If the file is not a cache archive of this scope and format.
+        """
+        with tarfile.open(archive_path, 'r:*') as archive:
+            try:
+                manifest = json.load(archive.extractfile(ARCHIVE_MANIFEST_NAME))
+            except KeyError as exc:
+                raise ValueError(f"{archive_path} is not a FastF1 cache archive (no {ARCHIVE_MANIFEST_NAME}).") from exc
+            if manifest.get('format_version') != ARCHIVE_FORMAT_VERSION:
+                raise ValueError(f"Unsupported cache archive format {manifest.get('format_version')} in {archive_path}.")
+            if manifest.get('cache_scope') != self.cache_scope:
+                raise ValueError(f"{archive_path} holds the '{manifest.get('cache_scope')}' cache, not '{self.cache_scope}'.")
+
+            members = [member for member in archive.getmembers() if member.name != ARCHIVE_MANIFEST_NAME]
+            os.makedirs(self.root, exist_ok=True)
+            archive.extractall(self.root, members=members, filter='data')
+        self.evict()
+        return manifest
+
+
+_cache_managers = {}
+
+
+def get_cache_manager(cache_scope='event_points'):
+    """Get the process-wide cache manager of a scope, so concurrent session loads share one lock."""
+    if cache_scope not in _cache_managers:
+        _cache_managers[cache_scope] = FastF1CacheManager(cache_scope)
+    return _cache_managers[cache_scope]
+
+
+def _as_utc_timestamp(today):
+    today_utc = pd.Timestamp(today)
+    return today_utc.tz_localize('UTC') if today_utc.tzinfo is None else today_utc.tz_convert('UTC')
+
+
+def next_weekend_sessions(sessions_df, today):
+    """
+    Pick the scoring sessions of the race weekend to prewarm.
+
+    That is the weekend whose Race is the first one still ahead of ``today`` minus two days,
+    so a run on Monday still targets the weekend that just finished.
+    Returns:
+        pd.DataFrame: The weekend's Sprint, Qualifying and Race sessions.
+    """
+    today_utc = _as_utc_timestamp(today)
+
+    sessions = sessions_df.copy()
+    sessions['SessionDateUtc'] = pd.to_datetime(sessions['SessionDateUtc'], errors='coerce', utc=True)
+    races = sessions[(sessions['SessionName'] == 'Race') & (sessions['SessionDateUtc'] >= today_utc - pd.Timedelta(days=2))]
+    if races.empty:
+        return sessions.head(0)
+    event_round = races.sort_values('SessionDateUtc').iloc[0]['RoundNumber']
+    weekend = sessions[(sessions['RoundNumber'] == event_round) & sessions['SessionName'].isin(['Sprint', 'Qualifying', 'Race'])]
+    return weekend.sort_values('SessionDateUtc')
+
+
+def prewarm(year=None, today=None, session_finished_after=datetime.timedelta(hours=3)):
+    """
+    Fill the event_points cache for the next race weekend in sessions_<year>.csv.
+
+    The season's event schedule is fetched either way. Weekend sessions that have
+    finished (started at least ``session_finished_after`` ago) are loaded through the
+    session provider; later ones are reported as pending.
+    Returns:
+        dict: Session name -> 'loaded', 'pending' or the load error.
+    """
+    import fastf1
+
+    from src.data_prep import functions
+    from src.data_prep.season_schedule import load_season_schedule
+
+    today = today or datetime.datetime.now(datetime.timezone.utc)
+    year = functions.resolve_season_year(year=year, today=today)
+    today_utc = _as_utc_timestamp(today)
+    functions.ensure_fastf1_cache('event_points')
+    fastf1.get_event_schedule(year)
+
+    weekend = next_weekend_sessions(load_season_schedule(year).sessions, today)
+    outcome = {}
+    for session in weekend.itertuples(index=False):
+        if session.SessionDateUtc + session_finished_after > today_utc:
+            outcome[session.SessionName] = 'pending'
+            continue
+        try:
+            functions.load_session_results(year, session.EventName, session.SessionName)
+            outcome[session.SessionName] = 'loaded'
+        except ValueError as exc:
+            outcome[session.SessionName] = f"failed: {exc}"
+    if not weekend.empty:
+        print(f"🔥 Prewarmed {weekend['EventName'].iloc[0]} ({year}): {outcome}")
+    else:
+        print(f"No upcoming race weekend found in sessions_{year}.csv.")
+    return outcome
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Manage the FastF1 cache: stats, eviction, prewarm and archives.")
+    parser.add_argument('--scope', default='event_points', help="Cache scope under the cache dir. Default is event_points.")
+    parser.add_argument('--max-bytes', default=None, help="Size cap, e.g. 512M. Default is F1_POINTS_CACHE_MAX_BYTES.")
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('stats', help="Print hits, misses, evictions and size as JSON.")
+    commands.add_parser('evict', help="Evict least recently used sessions down to the size cap.")
+    prewarm_parser = commands.add_parser('prewarm', help="Load the next race weekend's finished sessions into the cache.")
+    prewarm_parser.add_argument('--year', type=int, default=None)
+    archive_parser = commands.add_parser('archive', help="Pack the cache into a portable .tar.gz.")
+    archive_parser.add_argument('path')
+    restore_parser = commands.add_parser('restore', help="Unpack a cache archive; a missing archive is not an error.")
+    restore_parser.add_argument('path')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    manager = FastF1CacheManager(args.scope, max_bytes=parse_size(args.max_bytes))
+
+    if args.command == 'stats':
+        print(json.dumps(manager.stats(), indent=2, sort_keys=True))
+    elif args.command == 'evict':
+        evicted = manager.evict()
+        print(f"🧹 Evicted {len(evicted)} sessions from {manager.root}")
+    elif args.command == 'prewarm':
+        prewarm(year=args.year)
+    elif args.command == 'archive':
+        manifest = manager.archive(args.path)
+        print(f"📦 Archived {len(manifest['sessions'])} sessions to {args.path} ({os.path.getsize(args.path)} bytes)")
+    elif args.command == 'restore':
+        if not os.path.exists(args.path):
+            print(f"No cache archive at {args.path}; starting with a cold cache.")
+            return 0
+        manifest = manager.restore(args.path)
+        print(f"📦 Restored {len(manifest['sessions'])} sessions from {args.path} into {manager.root}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,19 +1,39 @@
-import fastf1
+import numpy as np
 import pandas as pd
+import abc
 import datetime
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.data_prep.data_manifest import get_manifest_path, load_current_manifest
+from src.data_prep.data_manifest import resolve_season_year as resolve_manifest_season_year
+from src.data_prep.session_results_store import SESSION_RESULT_COLUMNS, SessionResultsStore
+from src.data_prep.points_schema import apply_points_schema
+from src.data_prep.run_report import stage
+from src.data_prep.season_schedule import SessionTimeIndex, get_data_dir, get_sessions_path, load_season_schedule
+from src.data_prep.season_store import SeasonPointsStore, csv_export_enabled
 
 
 PROJECT_ROOT = os.path.join(os.path.dirname(__file__), '..', '..')
 
 
-def ensure_fastf1_cache(cache_scope):
-    """Create and enable a deterministic FastF1 cache directory."""
+def get_fastf1_cache_path(cache_scope):
+    """Get the deterministic FastF1 cache directory for a scope without importing FastF1."""
     base_cache_dir = os.environ.get(
         'F1_POINTS_CACHE_DIR',
         os.path.join(PROJECT_ROOT, '.cache')
     )
-    cache_path = os.path.join(base_cache_dir, cache_scope)
+    return os.path.join(base_cache_dir, cache_scope)
+
+
+def ensure_fastf1_cache(cache_scope):
+    """Create and enable a deterministic FastF1 cache directory."""
+    # fastf1 is imported lazily so entry points that only read CSVs never pay its import cost
+    import fastf1
+
+    cache_path = get_fastf1_cache_path(cache_scope)
     os.makedirs(cache_path, exist_ok=True)
     fastf1.Cache.enable_cache(cache_path)
     return cache_path
@@ -30,29 +50,29 @@ def resolve_season_year(year=None, today=None, require_past_races=False):
 
     If require_past_races=True, only return years where at least one race has already
     occurred before ``today``.
+
+    The seasons and their race dates come from data/manifest.json in one read when the
+    pipeline has written it and the sessions files still match it; otherwise data/ is
+    listed and each candidate sessions file is parsed.
     """
     if today is None:
         today = datetime.datetime.now(datetime.timezone.utc)
 
-    data_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'data')
+    data_dir = get_data_dir()
+    manifest = load_current_manifest(data_dir)
+    if manifest is not None:
+        season_year = resolve_manifest_season_year(manifest['seasons'], today, year=year, require_past_races=require_past_races)
+        if season_year is None:
+            raise FileNotFoundError(f"No eligible season in {get_manifest_path(data_dir)}.")
+        return season_year
 
     def sessions_path(season_year):
-        return os.path.join(data_dir, f'sessions_{season_year}.csv')
+        return get_sessions_path(season_year, data_dir)
 
     def has_past_races(season_year):
-        path = sessions_path(season_year)
-        if not os.path.exists(path):
+        if not os.path.exists(sessions_path(season_year)):
             return False
-
-        sessions_df = pd.read_csv(path)
-        races_df = sessions_df[sessions_df['SessionName'] == 'Race'].copy()
-        if races_df.empty:
-            return False
-
-        races_df['EventDateUtc'] = pd.to_datetime(races_df['EventDate'], errors='coerce', utc=True)
-        races_df['EventDateUtc'] = races_df['EventDateUtc'].dt.normalize() + pd.Timedelta(days=1) - pd.Timedelta(microseconds=1)
-        races_df = races_df.dropna(subset=['EventDateUtc'])
-        return (races_df['EventDateUtc'] < today).any()
+        return load_season_schedule(season_year, data_dir).has_past_races(today)
 
     requested_year = year if year is not None else today.year
     candidate_years = []
@@ -85,33 +105,22 @@ def resolve_season_year(year=None, today=None, require_past_races=False):
         f"No eligible sessions_<year>.csv file found in {data_dir}."
     )
 
-def get_past_race_event_names(today=datetime.datetime.now(datetime.timezone.utc)):
+def get_past_race_event_names(today=None, year=None):
     """
-    Get all past event names from the FastF1 cache.
+    Get all past event names from the local season schedule.
     Args:
         today (datetime): The current date and time. Default is the current UTC time.
+        year (int): Optional season year. Default is the latest season with past races.
     Returns:
         pd.Series: Series containing all past event names.    """
-    # Set cache path relative to project root
-    ensure_fastf1_cache('event_points')
-
-    # Get all events from the cache
-    season_year = resolve_season_year(today=today, require_past_races=True)
-    sessions_path = os.path.join(os.path.dirname(__file__), '..', '..', 'data', f'sessions_{season_year}.csv')
-    sessions_df = pd.read_csv(sessions_path)
-    races_df    = sessions_df[sessions_df['SessionName'] == 'Race'].copy()
-
-    # Convert EventDate to EventDateUtc
-    races_df['EventDateUtc'] = pd.to_datetime(races_df['EventDate'], errors='coerce', utc=True)
-
-    # Set to end of day (23:59:59.999999)
-    races_df['EventDateUtc'] = races_df['EventDateUtc'].dt.normalize() + pd.Timedelta(days=1) - pd.Timedelta(microseconds=1)
+    if today is None:
+        today = datetime.datetime.now(datetime.timezone.utc)
 
-    # Filter out future events
-    races_df['EventDateUtc'] = pd.to_datetime(races_df['EventDateUtc'], errors='coerce', utc=True)
-    races_df = races_df[races_df['EventDateUtc'] < today]
+    # Get all events from the schedule
+    season_year = resolve_season_year(year=year, today=today, require_past_races=True)
 
-    return races_df['EventName'].unique()
+    # Filter out future events (races count as past from the end of their event day)
+    return load_season_schedule(season_year).past_race_event_names(today)
 
 def get_round_number_from_event_name(event_name, year=None):
     """
@@ -123,56 +132,39 @@ def get_round_number_from_event_name(event_name, year=None):
     """
     # Get all events from the cache
     season_year = resolve_season_year(year=year)
-    sessions_path = os.path.join(os.path.dirname(__file__), '..', '..', 'data', f'sessions_{season_year}.csv')
-    sessions_df = pd.read_csv(sessions_path)
-    races_df    = sessions_df[sessions_df['SessionName'] == 'Race'].copy()
-
-    # Get the round number from the event name
-    round_number = races_df[races_df['EventName'] == event_name]['RoundNumber']
 
-    # If not, return None or raise an error
-    if not round_number.empty:
-        return round_number.values[0]
-    else:
-        raise ValueError(f"Could not extract round number from event name: {event_name}")
+    # Get the round number from the event name, raising ValueError if it is not a race event
+    return load_season_schedule(season_year).get_round_number(event_name)
 
 
-def get_most_recent_session_df(sessions, session_type="Race", today=datetime.datetime.now(datetime.timezone.utc), year=datetime.datetime.now(datetime.timezone.utc).year):
+def get_most_recent_session_df(sessions, session_type="Race", today=None, year=None):
     """
     Get the most recent session of a given type (e.g Race, Sprint, Qualifying, etc.).
     Args:
-        sessions (pd.DataFrame): DataFrame containing session information retrieved using .
+        sessions (pd.DataFrame or SessionTimeIndex): DataFrame containing session information retrieved using .
+            Pass a prebuilt SessionTimeIndex (e.g. SeasonSchedule.session_time_index) to skip re-indexing in loops.
         session_type (str): The type of session to retrieve. Options include 'Practice 1', 'Practice 2', 'Practice 3', 'Sprint', 'Sprint Shootout', 'Sprint Qualifying', 'Qualifying', 'Race'. Note that the old 'sprint' event format from 2021 and 2022 originally used the name 'Sprint Qualifying' before renaming these sessions to just 'Sprint'. The official schedule for 2021 now lists all these sessions as 'Sprint' and FastF1 will therefore return all these session as 'Sprint'. When querying for a specific session, FastF1 will also accept the 'Sprint Qualifying'/'SQ' identifier instead of only 'Sprint'/'S' for backwards compatibility.
         today (datetime): The current date and time. Default is the current UTC time.
         year (int): The current year. Default is the current year.
     """
-    sessions_limited = sessions[sessions['SessionName']==session_type].copy()
-    # Convert 'SessionDateUtc' to datetime objects, handling potential errors by setting invalid parsing to NaT
-    sessions_limited['SessionDateUtc'] = pd.to_datetime(sessions_limited['SessionDateUtc'], errors='coerce', utc=True)
-
-    # Filter out any rows where SessionDateUtc could not be parsed (NaT)
-    sessions_limited = sessions_limited.dropna(subset=['SessionDateUtc'])
-
-    # Ensure 'today' is timezone-aware (UTC) to match 'SessionDateUtc'
-    today_utc = today.replace(tzinfo=datetime.timezone.utc)
+    if today is None:
+        today = datetime.datetime.now(datetime.timezone.utc)
+    if year is None:
+        year = today.year
 
-    # Filter sessions that have already occurred
-    past_sessions = sessions_limited[sessions_limited['SessionDateUtc'] < today_utc]
+    # Build (or reuse) the sorted per-session-type timestamp index and binary search it
+    time_index = sessions if isinstance(sessions, SessionTimeIndex) else SessionTimeIndex(sessions)
+    most_recent_session_df = time_index.latest_before(session_type, today)
 
-    # Get the most recent session from the past sessions
-    if not past_sessions.empty:
-        # Select the most recent row as a DataFrame (not Series)
-        most_recent_idx = past_sessions['SessionDateUtc'].idxmax()
-        most_recent_session_df = past_sessions.loc[[most_recent_idx]]
+    if not most_recent_session_df.empty:
         print(f"Most recent {session_type} session:")
         print(most_recent_session_df)
     else:
         print(f"No {session_type} sessions for year {year} found before today.")
-        return sessions_limited.head(0).copy()
 
     return most_recent_session_df
 
-def get_session_df(sessions, event_name=None, session_type="Race", today=datetime.datetime.now(datetime.timezone.utc), year=datetime.datetime.now(datetime.timezone.utc).year):
+def get_session_df(sessions, event_name=None, session_type="Race", today=None, year=None):
     """
     Get the most recent session of a given type (e.g Race, Sprint, Qualifying, etc.).
     Args:
@@ -182,6 +174,8 @@ def get_session_df(sessions, event_name=None, session_type="Race", today=datetim
         year (int): The current year. Default is the current year.
     """
     if event_name is not None:
+        if isinstance(sessions, SessionTimeIndex):
+            sessions = sessions.sessions
         sessions_limited    = sessions[sessions['SessionName']==session_type].copy()
         selected_session_df = sessions_limited[sessions_limited['EventName'] == event_name].copy()
     elif event_name is None:
@@ -198,42 +192,48 @@ def get_session_types_list(event_format):
     else:
         raise ValueError(f"Event format '{event_format}' is not supported. Supported formats are 'conventional' and 'sprint_qualifying'.")
 
-def calculate_teammate_race_points(session_results, session_type):
-    session_results[f'Teammate{session_type}Points'] = 0
+def get_teammate_positions(session_results, position_column='Position', group_columns='TeamId'):
+    """
+    Get the position of each driver's teammate in a single grouped pass by TeamId.
+    Args:
+        session_results (pd.DataFrame): DataFrame containing session results.
+        position_column (str): The position column to compare. Options include 'Position' or 'GridPosition'.
+        group_columns (str or list): Columns identifying a team. Default is 'TeamId'; pass e.g.
+            ['RoundNumber', 'SessionType', 'TeamId'] to pair teammates across many stacked sessions.
+    Returns:
+        pd.Series: Teammate position aligned to ``session_results``; NaN when the driver has no teammate.
+
+    The teammate of a driver is the first other entry of the same team in frame order,
+    so teams with three or more entries (reserve drivers, mid-season swaps) compare
+    the first entry against the second and every other entry against the first.
+    """
+    group_keys  = [session_results[col] for col in _as_list(group_columns)]
+    team_order  = session_results.groupby(group_keys, sort=False).cumcount()
+    positions   = session_results[position_column]
 
-    for index, row in session_results.iterrows():
-        driver_id = row['DriverId']
-        team_id = row['TeamId']
-        
-        # Get the teammate's position
-        teammate_row = session_results.loc[(session_results['DriverId'] != driver_id) & (session_results['TeamId'] == team_id)]
-        
-        if not teammate_row.empty:
-            teammate_position = teammate_row.iloc[0]['Position']
-            
-            # If the current driver outqualifies their teammate, assign 5 points
-            if row['Position'] < teammate_position:
-                session_results.at[index, f'Teammate{session_type}Points'] = 5
+    # Each team has exactly one first and one second entry, so max() just broadcasts it (NaN stays NaN)
+    first_positions  = positions.where(team_order == 0).groupby(group_keys, sort=False).transform('max')
+    second_positions = positions.where(team_order == 1).groupby(group_keys, sort=False).transform('max')
 
-    return session_results
+    return first_positions.where(team_order != 0, second_positions)
 
-def calculate_teammate_quali_points(session_results):
-    session_results[f'TeammateQualiPoints'] = 0
 
-    for index, row in session_results.iterrows():
-        driver_id = row['DriverId']
-        team_id = row['TeamId']
-        
-        # Get the teammate's position
-        teammate_row = session_results.loc[(session_results['DriverId'] != driver_id) & (session_results['TeamId'] == team_id)]
-        
-        if not teammate_row.empty:
-            teammate_position = teammate_row.iloc[0]['GridPosition']
-            
-            # If the current driver outqualifies their teammate, assign 5 points
-            if row['GridPosition'] < teammate_position:
-                session_results.at[index, f'TeammateQualiPoints'] = 5
+def _as_list(columns):
+    return [columns] if isinstance(columns, str) else list(columns)
+
 
+def calculate_teammate_race_points(session_results, session_type, points=5):
+    teammate_positions = get_teammate_positions(session_results, 'Position')
+
+    # If the current driver finishes ahead of their teammate, assign 5 points
+    session_results[f'Teammate{session_type}Points'] = np.where(session_results['Position'] < teammate_positions, points, 0)
+    return session_results
+
+def calculate_teammate_quali_points(session_results, points=5):
+    teammate_positions = get_teammate_positions(session_results, 'GridPosition')
+
+    # If the current driver outqualifies their teammate, assign 5 points
+    session_results['TeammateQualiPoints'] = np.where(session_results['GridPosition'] < teammate_positions, points, 0)
     return session_results
 
 
@@ -250,27 +250,24 @@ def calculate_places_gained_points(session_results, session_type, multiplier=2):
     return session_results
 
 
-def calculate_pole_points(session_results):
+def calculate_pole_points(session_results, points=10):
     session_results['PolePoints'] = 0
-    session_results.loc[session_results['Position'] == 1.0, 'PolePoints'] = 10
+    session_results.loc[session_results['Position'] == 1.0, 'PolePoints'] = points
     return session_results
 
 
-def calculate_intermediate_driver_points(session_results, session_type):
-    if session_type == "Sprint":
-        session_results[f"{session_type}Points"] = session_results["Points"]
-        session_results = calculate_places_gained_points(session_results, session_type, 1)
-        session_results = calculate_teammate_race_points(session_results, session_type)
-    elif session_type == "Qualifying":
-        session_results = calculate_pole_points(session_results)
-    elif session_type == "Race":
-        session_results[f"{session_type}Points"] = session_results["Points"]
-        session_results = calculate_places_gained_points(session_results, session_type, 2)
-        session_results = calculate_teammate_race_points(session_results, session_type)
-        session_results = calculate_teammate_quali_points(session_results) # This adds points for beating your teammate in qualifying
-    else:
-        raise ValueError(f"Session type '{session_type}' is not supported for point calculation in session provided.")
-    return session_results
+def calculate_intermediate_driver_points(session_results, session_type, scoring_rules=None):
+    """
+    Calculate the driver points for one session.
+    Args:
+        session_results (pd.DataFrame): DataFrame containing session results.
+        session_type (str): The type of session. Options include 'Sprint', 'Qualifying' or 'Race'.
+        scoring_rules (ScoringRuleSet): Optional scoring rules. Default is the standard rule set.
+    """
+    from src.data_prep.scoring_rules import load_scoring_rules
+
+    scoring_rules = scoring_rules or load_scoring_rules()
+    return scoring_rules.compile().score_driver_session(session_results, session_type)
 
 
 def merge_points_dataframes(dictionary_of_dfs, merge_key='DriverId'):
@@ -377,39 +374,47 @@ def slim_driver_points_df(session_results, event_format):
     else:
         raise ValueError(f"Event format '{event_format}' is not supported for point calculation in session provided.")
 
-def calculate_constructor_finishing_points(session_results, session_type):
-    """Calculate the constructor finishing points based on the session type. If one car finishes the race, the constructor gets 2 points. If both cars finish the race, the constructor gets 5 points."""
-    session_results[f'Constructor{session_type}FinishingPoints'] = 0
-    if session_type == "Sprint":
-        
-        # Group by TeamId and count how many cars finished
-        finished_counts = session_results[session_results['Status'] != 'Retired'].groupby('TeamId').size()
-        
-        for team_id, count in finished_counts.items():
-            if count == 1:
-                session_results.loc[session_results['TeamId'] == team_id, 'ConstructorSprintFinishingPoints'] = 2
-            elif count >= 2:
-                session_results.loc[session_results['TeamId'] == team_id, 'ConstructorSprintFinishingPoints'] = 5
+def aggregate_team_points(session_results, places_gained_column, group_columns='TeamId', one_car_points=2, both_cars_points=5, sort=True):
+    """
+    Aggregate driver results into team points in a single grouped pass.
+    Args:
+        session_results (pd.DataFrame): DataFrame containing session results with Points, Status and the places gained column.
+        places_gained_column (str): Column holding each driver's floored places gained, e.g. 'PlacesGainedRaceFloor'.
+        group_columns (str or list): Columns identifying a team. Default is 'TeamId'.
+        one_car_points (int): Finishing points when one car finishes. Default is 2.
+        both_cars_points (int): Finishing points when two or more cars finish. Default is 5.
+        sort (bool): Sort teams by the group columns. Default is True.
+    Returns:
+        pd.DataFrame: One row per team with FinishedCount, FinishingPoints, TotalPoints, PlacesGainedPoints,
+            ConstructorPoints (points plus places gained) and TotalConstructorPoints (all of the above).
+    """
+    # One plain column sum is several times cheaper than named aggregation on small sessions
+    team_points = session_results.assign(FinishedCount=session_results['Status'] != 'Retired').groupby(group_columns, sort=sort)[
+        ['FinishedCount', 'Points', places_gained_column]].sum()
+    team_points = team_points.rename(columns={'Points': 'TotalPoints', places_gained_column: 'PlacesGainedPoints'}).reset_index()
 
-        # Get unique constructor finishing points by team
-        constructor_finishing_df = session_results.groupby('TeamId')['ConstructorSprintFinishingPoints'].first().reset_index()
+    finished_count = team_points['FinishedCount']
+    team_points['FinishingPoints']          = np.select([finished_count >= 2, finished_count == 1], [both_cars_points, one_car_points], 0)
+    team_points['ConstructorPoints']        = team_points['TotalPoints'] + team_points['PlacesGainedPoints']
+    team_points['TotalConstructorPoints']   = team_points['FinishingPoints'] + team_points['ConstructorPoints']
+    return team_points
 
-    elif session_type == "Race":
-        # Group by TeamId and count how many cars finished
-        finished_counts = session_results[session_results['Status'] != 'Retired'].groupby('TeamId').size()
 
-        for team_id, count in finished_counts.items():
-            if count == 1:
-                session_results.loc[session_results['TeamId'] == team_id, 'ConstructorRaceFinishingPoints'] = 2
-            elif count >= 2:
-                session_results.loc[session_results['TeamId'] == team_id, 'ConstructorRaceFinishingPoints'] = 5
+def calculate_constructor_finishing_points(session_results, session_type, one_car_points=2, both_cars_points=5):
+    """Calculate the constructor finishing points based on the session type. If one car finishes the race, the constructor gets 2 points. If both cars finish the race, the constructor gets 5 points."""
+    if session_type not in ["Sprint", "Race"]:
+        raise ValueError(f"Session type '{session_type}' is not supported for constructor finishing point calculation.")
 
-        # Get unique constructor finishing points by team
-        constructor_finishing_df = session_results.groupby('TeamId')['ConstructorRaceFinishingPoints'].first().reset_index()
+    finished_counts = (session_results['Status'] != 'Retired').groupby(session_results['TeamId']).sum()
+    finishing_points = pd.Series(
+        np.select([finished_counts >= 2, finished_counts == 1], [both_cars_points, one_car_points], 0),
+        index=finished_counts.index,
+        name=f'Constructor{session_type}FinishingPoints',
+    )
+    session_results[f'Constructor{session_type}FinishingPoints'] = session_results['TeamId'].map(finishing_points).fillna(0).astype(int)
 
-    else:
-        raise ValueError(f"Session type '{session_type}' is not supported for constructor finishing point calculation.")
-    return constructor_finishing_df
+    # Get unique constructor finishing points by team
+    return finishing_points.reset_index()
 
 
 def get_aggregated_results(session_results, session_type):
@@ -419,19 +424,12 @@ def get_aggregated_results(session_results, session_type):
         session_results (pd.DataFrame): DataFrame containing session results.
         session_type (str): The type of session to retrieve. Options include 'Sprint' or 'Race'.
     """
-    # Calculate the constructor points based on the session type
-    if session_type == "Sprint":
-        team_aggregated_results = session_results.groupby('TeamId').agg(
-            TotalSprintPoints=pd.NamedAgg(column='Points', aggfunc='sum'),
-            PlacesGainedSprintPoints=pd.NamedAgg(column='PlacesGainedSprintFloor', aggfunc='sum')
-        ).reset_index()
-    elif session_type == "Race":
-        team_aggregated_results = session_results.groupby('TeamId').agg(
-            TotalRacePoints=pd.NamedAgg(column='Points', aggfunc='sum'),
-            PlacesGainedRacePoints=pd.NamedAgg(column='PlacesGainedRaceFloor', aggfunc='sum')
-        ).reset_index()
-    team_aggregated_results[f'Constructor{session_type}Points'] = team_aggregated_results[f'Total{session_type}Points'] + team_aggregated_results[f'PlacesGained{session_type}Points']
-    return team_aggregated_results
+    team_points = aggregate_team_points(session_results, f'PlacesGained{session_type}Floor')
+    return team_points[['TeamId', 'TotalPoints', 'PlacesGainedPoints', 'ConstructorPoints']].rename(columns={
+        'TotalPoints': f'Total{session_type}Points',
+        'PlacesGainedPoints': f'PlacesGained{session_type}Points',
+        'ConstructorPoints': f'Constructor{session_type}Points',
+    })
 
 def slim_constructor_points_df(constructor_points_df, event_format):
     """
@@ -469,42 +467,270 @@ def slim_constructor_points_df(constructor_points_df, event_format):
     else:
         raise ValueError(f"Session type '{event_format}' is not supported for constructor points DataFrame.")
 
-def calculate_constructor_points(session_results, session_type):
-    if session_type in ["Sprint", "Race"]:
-        constructor_finishing_df        = calculate_constructor_finishing_points(session_results, session_type=session_type)
-        team_aggregated_results         = get_aggregated_results(session_results, session_type)
-        constructor_points_df           = constructor_finishing_df.merge(team_aggregated_results, on='TeamId', how='left')
-        
-        constructor_points_df[f"TotalConstructor{session_type}Points"] = constructor_points_df[f'Constructor{session_type}FinishingPoints'] + constructor_points_df[f'Constructor{session_type}Points']
-    else:
+def calculate_constructor_points(session_results, session_type, one_car_points=2, both_cars_points=5):
+    """
+    Calculate constructor finishing points, summed points and places gained for one session in a single grouped pass.
+    Args:
+        session_results (pd.DataFrame): Driver-scored session results (with PlacesGained<session_type>Floor).
+        session_type (str): The type of session. Options include 'Sprint' or 'Race'.
+    """
+    if session_type not in ["Sprint", "Race"]:
         raise ValueError(f"Session type '{session_type}' is not supported for constructor point calculation.")
-    return constructor_points_df
+
+    team_points = aggregate_team_points(session_results, f'PlacesGained{session_type}Floor',
+                                        one_car_points=one_car_points, both_cars_points=both_cars_points)
+    return team_points[['TeamId', 'FinishingPoints', 'TotalPoints', 'PlacesGainedPoints', 'ConstructorPoints', 'TotalConstructorPoints']].rename(columns={
+        'FinishingPoints': f'Constructor{session_type}FinishingPoints',
+        'TotalPoints': f'Total{session_type}Points',
+        'PlacesGainedPoints': f'PlacesGained{session_type}Points',
+        'ConstructorPoints': f'Constructor{session_type}Points',
+        'TotalConstructorPoints': f'TotalConstructor{session_type}Points',
+    })
+
+
+_fastf1_cache_lock = threading.Lock()
+_fastf1_cache_enabled = False
+
+
+def _enable_event_points_cache():
+    """Enable the event_points FastF1 cache once per process, before the first network load."""
+    global _fastf1_cache_enabled
+    with _fastf1_cache_lock:
+        if not _fastf1_cache_enabled:
+            ensure_fastf1_cache('event_points')
+            _fastf1_cache_enabled = True
+
+
+class SessionProvider(abc.ABC):
+    """
+    Source of session results for scoring.
+
+    Subclasses implement ``load``, returning a ``session.results``-shaped frame and raising
+    ValueError when a session cannot be loaded. Providers whose results are not real
+    (fixtures, synthetic seasons) set ``cacheable = False`` so they never land in the
+    local SessionResultsStore.
+    """
+
+    name = 'base'
+    cacheable = True
+
+    @abc.abstractmethod
+    def load(self, year, event_name, session_type):
+        """Return the session's ``session.results``-shaped frame; raise ValueError when it cannot be loaded."""
 
 
-def get_event_points(event_name=None, year=None, return_dfs=False):
+class FastF1SessionProvider(SessionProvider):
+    """Loads session results from the FastF1 API through the size-managed event_points cache."""
+
+    name = 'fastf1'
+
+    def load(self, year, event_name, session_type):
+        import fastf1
+        from src.data_prep.fastf1_cache import get_cache_manager
+
+        _enable_event_points_cache()
+        f1_session = fastf1.get_session(year, event_name, session_type)
+
+        # Count the cache hit or miss and keep the cache under F1_POINTS_CACHE_MAX_BYTES
+        cache_manager = get_cache_manager('event_points')
+        session_key   = cache_manager.session_key(f1_session.api_path) if getattr(f1_session, 'api_path', None) else None
+        cache_hit     = session_key is not None and cache_manager.is_cached(session_key)
+        f1_session.load(laps=False, telemetry=False, weather=False, messages=False)
+        if session_key is not None:
+            cache_manager.record_access(session_key, cache_hit)
+        return f1_session.results
+
+
+SESSION_PROVIDER_ENV = 'F1_POINTS_SESSION_PROVIDER'
+_session_provider = None
+
+
+def _provider_from_env():
+    provider_name = os.environ.get(SESSION_PROVIDER_ENV, 'fastf1').strip().lower()
+    if provider_name == 'fastf1':
+        return FastF1SessionProvider()
+    if provider_name in ('fixture', 'record', 'synthetic'):
+        from src.data_prep.session_fixtures import FixtureSessionProvider, RecordingSessionProvider, SyntheticSessionProvider
+
+        if provider_name == 'synthetic':
+            return SyntheticSessionProvider()
+        fixtures = FixtureSessionProvider()
+        return fixtures if provider_name == 'fixture' else RecordingSessionProvider(FastF1SessionProvider(), fixtures)
+    raise ValueError(
+        f"Unknown session provider '{provider_name}' in {SESSION_PROVIDER_ENV}. Expected one of: fastf1, fixture, record, synthetic"
+    )
+
+
+def get_session_provider():
+    """Get the process-wide session provider (F1_POINTS_SESSION_PROVIDER, FastF1 by default)."""
+    global _session_provider
+    if _session_provider is None:
+        _session_provider = _provider_from_env()
+    return _session_provider
+
+
+def set_session_provider(provider):
+    """
+    Replace the process-wide session provider.
+    Args:
+        provider (SessionProvider): The new provider, or None to go back to F1_POINTS_SESSION_PROVIDER.
+    Returns:
+        SessionProvider: The previous provider (None if none had been created yet).
+    """
+    global _session_provider
+    previous, _session_provider = _session_provider, provider
+    return previous
+
+
+def load_session_results(year, event_name, session_type):
+    """
+    Load the results of one session from the configured session provider.
+    Args:
+        year (int): The year of the event.
+        event_name (str): The name of the event.
+        session_type (str): The type of session. Options include 'Sprint', 'Qualifying' or 'Race'.
+    Returns:
+        pd.DataFrame: The session results.
+    """
+    return get_session_provider().load(year, event_name, session_type)
+
+
+class SessionLoadError(ValueError):
+    """Raised when one session of an event cannot be loaded; ``session_type`` names the session."""
+
+    def __init__(self, session_type, message):
+        super().__init__(message)
+        self.session_type = session_type
+
+
+def load_event_session_results(year, event_name, session_types, max_workers=None, event_round=None, force_refresh=False,
+                               accept_results=None):
+    """
+    Load the results of every session of one event concurrently on a bounded thread pool.
+    Args:
+        year (int): The year of the event.
+        event_name (str): The name of the event.
+        session_types (list): Session types to load, e.g. from get_session_types_list.
+        max_workers (int): Maximum concurrent loads. Default is F1_POINTS_SESSION_LOAD_WORKERS, or 3.
+        event_round (int): The round number of the event. When given, sessions are read from the local
+            SessionResultsStore first and only misses are loaded from the session provider (and then stored).
+            Providers that are not cacheable bypass the store.
+        force_refresh (bool): Load every session from FastF1 even when it is in the results store.
+        accept_results (callable): Optional check a loaded results frame must pass before it is used or stored,
+            e.g. ``provisional_points.has_classified_results`` while a race weekend is still running.
+    Returns:
+        tuple: Session results DataFrames keyed by session type, and a dict of load timings with
+            per-session seconds, the wall-clock seconds and the seconds saved versus loading one by one.
+    Raises:
+        SessionLoadError: If any session raises ValueError while loading, has no results yet or fails ``accept_results``.
+    """
+    if max_workers is None:
+        max_workers = int(os.environ.get('F1_POINTS_SESSION_LOAD_WORKERS', '3'))
+
+    results_store = SessionResultsStore() if event_round is not None and get_session_provider().cacheable else None
+    stored_dfs    = {}
+    if results_store is not None and not force_refresh:
+        for session_type in session_types:
+            stored_results = results_store.get(year, event_round, session_type)
+            if stored_results is not None:
+                stored_dfs[session_type] = stored_results
+    fetched_types = [session_type for session_type in session_types if session_type not in stored_dfs]
+
+    def timed_load(session_type):
+        started = time.perf_counter()
+        with stage('session_load', year=int(year), event_name=event_name, session_type=session_type):
+            session_results = load_session_results(year, event_name, session_type)
+        if len(session_results) == 0:
+            # FastF1 loads a session before its results are published; never score or store that
+            raise ValueError(f"No results published yet for {session_type} of {event_name} ({year})")
+        if accept_results is not None and not accept_results(session_results):
+            raise ValueError(f"Results of {session_type} of {event_name} ({year}) are not final yet")
+        return session_results, time.perf_counter() - started
+
+    fetched_dfs      = {}
+    session_seconds  = {}
+    started          = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(fetched_types)))) as executor:
+        futures = {session_type: executor.submit(timed_load, session_type) for session_type in fetched_types}
+        for session_type, future in futures.items():
+            try:
+                fetched_dfs[session_type], session_seconds[session_type] = future.result()
+            except ValueError as exc:
+                for pending_future in futures.values():
+                    pending_future.cancel()
+                raise SessionLoadError(session_type, str(exc)) from exc
+    # Storing the results below is not part of the load, so it stays out of the concurrency saving
+    wall_seconds = time.perf_counter() - started
+
+    if results_store is not None:
+        for session_type, session_results in fetched_dfs.items():
+            fetched_dfs[session_type], _ = results_store.put(year, event_round, session_type, session_results)
+    session_dfs = {session_type: stored_dfs.get(session_type, fetched_dfs.get(session_type)) for session_type in session_types}
+
+    sequential_seconds = sum(session_seconds.values())
+    load_timings = {
+        'sessions': {session_type: round(seconds, 3) for session_type, seconds in session_seconds.items()},
+        'wall_seconds': round(wall_seconds, 3),
+        'sequential_seconds': round(sequential_seconds, 3),
+        'saved_seconds': round(sequential_seconds - wall_seconds, 3),
+        'stored_sessions': list(stored_dfs),
+    }
+    print(
+        f"Loaded {len(fetched_types)} sessions for {event_name} ({year}) in {load_timings['wall_seconds']}s "
+        f"(sum of session loads {load_timings['sequential_seconds']}s, saved {load_timings['saved_seconds']}s, "
+        f"{len(stored_dfs)} read from the results store)"
+    )
+    return session_dfs, load_timings
+
+
+def write_event_points(driver_points_df_slim, constructor_points_df_slim, year, event_round, event_name, export_csv=None, store=None):
+    """
+    Write one event's slim driver and constructor points, in the compact points schema, to the season store.
+    Args:
+        export_csv (bool): Also write the per-event CSV copies to data/. Default is F1_POINTS_EXPORT_CSV (on).
+        store (SeasonPointsStore): Optional season store. Default is the store under data/season_store.
+    Returns:
+        tuple: The driver and constructor points as written, in the points schema.
+    """
+    with stage('write', year=int(year), event_round=int(event_round), event_name=event_name):
+        driver_points_df_slim       = apply_points_schema(driver_points_df_slim)
+        constructor_points_df_slim  = apply_points_schema(constructor_points_df_slim)
+
+        store = store or SeasonPointsStore()
+        store.write_event('driver', year, event_round, driver_points_df_slim)
+        store.write_event('constructor', year, event_round, constructor_points_df_slim)
+
+        if not csv_export_enabled(export_csv):
+            return driver_points_df_slim, constructor_points_df_slim
+
+        driver_output_path = os.path.join(get_data_dir(), f'driver_points_{year}_{event_round}_{event_name}.csv')
+        constructor_output_path = os.path.join(get_data_dir(), f'constructor_points_{year}_{event_round}_{event_name}.csv')
+
+        driver_points_df_slim.to_csv(driver_output_path, index=False)
+        constructor_points_df_slim.to_csv(constructor_output_path, index=False)
+    return driver_points_df_slim, constructor_points_df_slim
+
+
+def get_event_points(event_name=None, year=None, return_dfs=False, scoring_rules=None, force_refresh=False, export_csv=None):
     """
     Get the event points for a specific event in a specific year.
     Args:
         year (int): The year of the event.
         event_name (str): The name of the event.
+        scoring_rules (ScoringRuleSet): Optional scoring rules. Default is the rule set from
+            F1_POINTS_SCORING_RULES, or the standard rules when it is unset.
+        force_refresh (bool): Reload sessions from FastF1 instead of the local results store.
+        export_csv (bool): Also write the per-event CSV copies. Default is F1_POINTS_EXPORT_CSV (on).
     """
-    import fastf1
-    import pandas as pd
-    import datetime
-    from src.data_prep import functions
-    from importlib import reload
+    from src.data_prep.scoring_rules import load_scoring_rules
 
-    reload(functions)    
     today = datetime.datetime.now(datetime.timezone.utc)
-    year = resolve_season_year(year=year, today=today, require_past_races=True)
+    with stage('schedule_resolve', event_name=event_name):
+        year = resolve_season_year(year=year, today=today, require_past_races=True)
 
-    # Set cache path relative to project root
-    ensure_fastf1_cache('event_points')
+        session_time_index = load_season_schedule(year).session_time_index
 
-    sessions_path = os.path.join(os.path.dirname(__file__), '..', '..', 'data', f'sessions_{year}.csv')
-    sessions_df = pd.read_csv(sessions_path)
-
-    selected_session_df   = functions.get_session_df(sessions_df, event_name=event_name)
+        selected_session_df   = get_session_df(session_time_index, event_name=event_name, today=today, year=year)
 
     if selected_session_df.empty:
         print("No eligible event session found. Skipping event point generation.")
@@ -514,54 +740,103 @@ def get_event_points(event_name=None, year=None, return_dfs=False):
     SELECTED_EVENT_FORMAT = selected_session_df['EventFormat'].values[0]
     SELECTED_EVENT_ROUND  = selected_session_df['RoundNumber'].values[0]
 
-    session_types = functions.get_session_types_list(SELECTED_EVENT_FORMAT)
-
-    session_dfs = {}
+    session_types = get_session_types_list(SELECTED_EVENT_FORMAT)
+    scoring_plan  = (scoring_rules or load_scoring_rules()).compile()
 
-    for session_type in session_types:
-        try:
-            f1_session = fastf1.get_session(year, SELECTED_EVENT_NAME, session_type)
-            f1_session.load(laps=False, telemetry=False, weather=False, messages=False)
-        except ValueError as exc:
-            print(
-                f"Failed to load {session_type} session for {SELECTED_EVENT_NAME} ({year}): {exc}. "
-                "Skipping event point generation."
-            )
-            return None
-
-        event_results = f1_session.results
-        session_dfs[session_type] = event_results
-
-    driver_points_dfs       = {}
-    constructor_points_dfs  = {}
-
-    for session_type in session_types:
-        if session_type in ["Qualifying"]:
-            session_driver_points = functions.calculate_intermediate_driver_points(session_dfs[session_type], session_type)
-            driver_points_dfs[session_type] = session_driver_points
-        elif session_type in ["Race", "Sprint"]:
-            session_driver_points = functions.calculate_intermediate_driver_points(session_dfs[session_type], session_type)
-            session_constructor_points = functions.calculate_constructor_points(session_dfs[session_type], session_type)
-            driver_points_dfs[session_type] = session_driver_points
-            constructor_points_dfs[session_type] = session_constructor_points
-        else:
-            raise ValueError(f"Unknown session type: {session_type}")
-        
-    merged_driver_points        = functions.merge_points_dataframes(driver_points_dfs, merge_key="DriverId")
-    merged_constructor_points   = functions.merge_points_dataframes(constructor_points_dfs, merge_key="TeamId")
+    try:
+        session_dfs, _ = load_event_session_results(year, SELECTED_EVENT_NAME, session_types,
+                                                    event_round=SELECTED_EVENT_ROUND, force_refresh=force_refresh)
+    except SessionLoadError as exc:
+        print(
+            f"Failed to load {exc.session_type} session for {SELECTED_EVENT_NAME} ({year}): {exc}. "
+            "Skipping event point generation."
+        )
+        return None
 
-    driver_points_df            = functions.calculate_final_driver_points(merged_driver_points, SELECTED_EVENT_FORMAT)
-    driver_points_df_slim       = functions.slim_driver_points_df(driver_points_df, event_format=SELECTED_EVENT_FORMAT)
-    constructor_points_df_slim  = functions.slim_constructor_points_df(merged_constructor_points, event_format=SELECTED_EVENT_FORMAT)
+    driver_points_df_slim, constructor_points_df_slim = scoring_plan.score_event(session_dfs, SELECTED_EVENT_FORMAT)
 
     driver_points_df_slim.loc[:,"EventName"]      = SELECTED_EVENT_NAME
     constructor_points_df_slim.loc[:,"EventName"] = SELECTED_EVENT_NAME
 
-    driver_output_path = os.path.join(os.path.dirname(__file__), '..', '..', 'data', f'driver_points_{year}_{SELECTED_EVENT_ROUND}_{SELECTED_EVENT_NAME}.csv')
-    constructor_output_path = os.path.join(os.path.dirname(__file__), '..', '..', 'data', f'constructor_points_{year}_{SELECTED_EVENT_ROUND}_{SELECTED_EVENT_NAME}.csv')
-
-    driver_points_df_slim.to_csv(driver_output_path, index=False)
-    constructor_points_df_slim.to_csv(constructor_output_path, index=False)
+    driver_points_df_slim, constructor_points_df_slim = write_event_points(
+        driver_points_df_slim, constructor_points_df_slim, year, SELECTED_EVENT_ROUND, SELECTED_EVENT_NAME, export_csv=export_csv)
 
     if return_dfs:
         return driver_points_df_slim, constructor_points_df_slim
+
+
+def get_season_points(year=None, event_names=None, scoring_rules=None, return_dfs=False, force_refresh=False, export_csv=None):
+    """
+    Score every past event of a season in one batch and write the per-event point files.
+    Args:
+        year (int): The season year. Default is the latest season with past races.
+        event_names (list): Optional event names to score. Default is every past race event.
+        scoring_rules (ScoringRuleSet): Optional scoring rules. Default is the configured rule set.
+        return_dfs (bool): Return the long driver and constructor points DataFrames.
+        force_refresh (bool): Reload sessions from FastF1 instead of the local results store.
+        export_csv (bool): Also write the per-event CSV copies. Default is F1_POINTS_EXPORT_CSV (on).
+
+    Session results of all events are stacked into one frame keyed by
+    (RoundNumber, SessionType, DriverId) and scored with grouped operations, so the
+    only per-event work left is loading sessions from FastF1 and writing files.
+    Events with a session that fails to load are skipped.
+    """
+    from src.data_prep.scoring_rules import load_scoring_rules
+
+    today = datetime.datetime.now(datetime.timezone.utc)
+    with stage('schedule_resolve'):
+        year = resolve_season_year(year=year, today=today, require_past_races=True)
+
+        sessions_df = load_season_schedule(year).sessions
+        if event_names is None:
+            event_names = get_past_race_event_names(today=today, year=year)
+
+    stacked_results = []
+    for event_name in event_names:
+        selected_session_df = get_session_df(sessions_df, event_name=event_name)
+        if selected_session_df.empty:
+            print(f"No race session found for {event_name} ({year}). Skipping event.")
+            continue
+
+        event_format  = selected_session_df['EventFormat'].values[0]
+        event_round   = selected_session_df['RoundNumber'].values[0]
+        try:
+            session_dfs, _ = load_event_session_results(year, event_name, get_session_types_list(event_format),
+                                                        event_round=event_round, force_refresh=force_refresh)
+        except SessionLoadError as exc:
+            print(f"Failed to load {exc.session_type} session for {event_name} ({year}): {exc}. Skipping event.")
+            continue
+
+        event_results = [
+            session_results[SESSION_RESULT_COLUMNS].assign(SessionType=session_type)
+            for session_type, session_results in session_dfs.items()
+        ]
+        stacked_results.append(pd.concat(event_results, ignore_index=True).assign(
+            RoundNumber=event_round, EventName=event_name, EventFormat=event_format))
+
+    if not stacked_results:
+        print(f"No event sessions could be loaded for {year}. Skipping season point generation.")
+        return None
+
+    season_results = pd.concat(stacked_results, ignore_index=True)
+    scoring_plan   = (scoring_rules or load_scoring_rules()).compile()
+    with stage('score_season', year=int(year), events=len(stacked_results)):
+        driver_points_df, constructor_points_df = scoring_plan.score_season(season_results)
+
+    write_season_points(driver_points_df, constructor_points_df, year, export_csv=export_csv)
+
+    if return_dfs:
+        return driver_points_df, constructor_points_df
+
+
+def write_season_points(driver_points_df, constructor_points_df, year, export_csv=None):
+    """Split long season points DataFrames into the per-event slim files."""
+    for (event_round, event_name, event_format), event_driver_points in driver_points_df.groupby(['RoundNumber', 'EventName', 'EventFormat'], sort=True):
+        event_constructor_points = constructor_points_df[constructor_points_df['RoundNumber'] == event_round]
+
+        driver_points_df_slim       = slim_driver_points_df(event_driver_points, event_format=event_format).reset_index(drop=True)
+        constructor_points_df_slim  = slim_constructor_points_df(event_constructor_points.copy(), event_format=event_format).reset_index(drop=True)
+        driver_points_df_slim.loc[:,"EventName"]      = event_name
+        constructor_points_df_slim.loc[:,"EventName"] = event_name
+
+        write_event_points(driver_points_df_slim, constructor_points_df_slim, year, event_round, event_name, export_csv=export_csv)
@@ -2,71 +2,93 @@ import fastf1
 import datetime
 import pandas as pd
 import os
+import sys
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
 
+from src.data_prep.data_manifest import refresh_manifest
 from src.data_prep.functions import ensure_fastf1_cache
+from src.data_prep.season_schedule import get_data_dir, get_sessions_path
 
-ensure_fastf1_cache('event_schedule')
 
-year                    = datetime.date.today().year
-output_path = os.path.join(os.path.dirname(__file__), '..', '..', 'data', f'sessions_{year}.csv')
-try:
-    event_schedule = fastf1.get_event_schedule(year)
-except ValueError:
-    print(f"No schedule available for {year} yet.")
-    if os.path.exists(output_path):
-        print(f"Keeping existing schedule file: {output_path}")
-        raise SystemExit(0)
+def write_event_schedule(year=None, data_dir=None):
+    """
+    Fetch a season's event schedule from FastF1 and write it as sessions_<year>.csv, one row per session.
+    Args:
+        year (int): The season year. Default is the current year.
+        data_dir (str): Output directory. Default is the pipeline data directory.
+    Returns:
+        str: The sessions file path. data/manifest.json is refreshed to list the season.
+    """
+    ensure_fastf1_cache('event_schedule')
 
-    print(f"No existing schedule file found for {year}. Writing an empty schedule file.")
-    event_schedule = pd.DataFrame(columns=[
-        'RoundNumber', 'Country', 'Location', 'OfficialEventName', 'EventDate', 'EventName',
-        'EventFormat', 'Session1', 'SessionDate1', 'SessionDateUtc1', 'Session2', 'SessionDate2',
-        'SessionDateUtc2', 'Session3', 'SessionDate3', 'SessionDateUtc3', 'Session4', 'SessionDate4',
-        'SessionDateUtc4', 'Session5', 'SessionDate5', 'SessionDateUtc5', 'F1ApiSupport'
-    ])
-event_schedule.columns  = ['RoundNumber', 
-                          'Country', 
-                          'Location', 
-                          'OfficialEventName', 
-                          'EventDate',
-                          'EventName', 
-                          'EventFormat', 
-                          'Session1', 
-                          'SessionDate1',
-                          'SessionDateUtc1', 
-                          'Session2', 
-                          'SessionDate2', 
-                          'SessionDateUtc2',
-                          'Session3', 
-                          'SessionDate3', 
-                          'SessionDateUtc3', 
-                          'Session4',
-                          'SessionDate4', 
-                          'SessionDateUtc4', 
-                          'Session5', 
-                          'SessionDate5', 
-                          'SessionDateUtc5', 
-                          'F1ApiSupport']
+    year        = year or datetime.date.today().year
+    output_path = get_sessions_path(year, data_dir or get_data_dir())
+    try:
+        event_schedule = fastf1.get_event_schedule(year)
+    except ValueError:
+        print(f"No schedule available for {year} yet.")
+        if os.path.exists(output_path):
+            print(f"Keeping existing schedule file: {output_path}")
+            refresh_manifest(data_dir)
+            return output_path
 
-event_schedule_melted = pd.wide_to_long(
-    event_schedule,
-    stubnames=['Session', 'SessionDate', 'SessionDateUtc'], 
-    i=['RoundNumber', 'Country', 'Location', 'OfficialEventName', 'EventDate', 'EventName', 'EventFormat', 'F1ApiSupport'],
-    j='SessionNumber',
-    sep='',  
-    suffix=r'\d+'
-).reset_index()
+        print(f"No existing schedule file found for {year}. Writing an empty schedule file.")
+        event_schedule = pd.DataFrame(columns=[
+            'RoundNumber', 'Country', 'Location', 'OfficialEventName', 'EventDate', 'EventName',
+            'EventFormat', 'Session1', 'SessionDate1', 'SessionDateUtc1', 'Session2', 'SessionDate2',
+            'SessionDateUtc2', 'Session3', 'SessionDate3', 'SessionDateUtc3', 'Session4', 'SessionDate4',
+            'SessionDateUtc4', 'Session5', 'SessionDate5', 'SessionDateUtc5', 'F1ApiSupport'
+        ])
+    event_schedule.columns  = ['RoundNumber', 
+                              'Country', 
+                              'Location', 
+                              'OfficialEventName', 
+                              'EventDate',
+                              'EventName', 
+                              'EventFormat', 
+                              'Session1', 
+                              'SessionDate1',
+                              'SessionDateUtc1', 
+                              'Session2', 
+                              'SessionDate2', 
+                              'SessionDateUtc2',
+                              'Session3', 
+                              'SessionDate3', 
+                              'SessionDateUtc3', 
+                              'Session4',
+                              'SessionDate4', 
+                              'SessionDateUtc4', 
+                              'Session5', 
+                              'SessionDate5', 
+                              'SessionDateUtc5', 
+                              'F1ApiSupport']
 
-event_schedule_melted = event_schedule_melted.rename(
-    columns={
-        'Session': 'SessionName',
-        'SessionDate': 'SessionDate',
-        'SessionDateUtc': 'SessionDateUtc'
-    }
-)
+    event_schedule_melted = pd.wide_to_long(
+        event_schedule,
+        stubnames=['Session', 'SessionDate', 'SessionDateUtc'], 
+        i=['RoundNumber', 'Country', 'Location', 'OfficialEventName', 'EventDate', 'EventName', 'EventFormat', 'F1ApiSupport'],
+        j='SessionNumber',
+        sep='',  
+        suffix=r'\d+'
+    ).reset_index()
 
-event_schedule_melted = event_schedule_melted.sort_values(['RoundNumber', 'SessionDate'])
-event_schedule_melted = event_schedule_melted.dropna(subset=['SessionName'])
+    event_schedule_melted = event_schedule_melted.rename(
+        columns={
+            'Session': 'SessionName',
+            'SessionDate': 'SessionDate',
+            'SessionDateUtc': 'SessionDateUtc'
+        }
+    )
 
-# Save to data directory relative to project root
-event_schedule_melted.to_csv(output_path, index=False)
+    event_schedule_melted = event_schedule_melted.sort_values(['RoundNumber', 'SessionDate'])
+    event_schedule_melted = event_schedule_melted.dropna(subset=['SessionName'])
+
+    # Save to data directory relative to project root
+    event_schedule_melted.to_csv(output_path, index=False)
+    refresh_manifest(data_dir)
+    return output_path
+
+
+if __name__ == '__main__':
+    write_event_schedule()
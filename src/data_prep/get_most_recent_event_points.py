@@ -4,8 +4,14 @@ project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(_
 sys.path.insert(0, project_root)
 import datetime
 from src.data_prep import functions
+from src.data_prep.run_report import recorded_run
+from src.data_prep.season_schedule import get_data_dir
 
 def main():
+    with recorded_run('get_most_recent_event_points'):
+        write_most_recent_event_points()
+
+def write_most_recent_event_points():
     # Determine the year and fetch points DataFrames
     year = functions.resolve_season_year(require_past_races=True)
     result = functions.get_event_points(
@@ -15,11 +21,14 @@ def main():
     )
     if result is not None:
         drivers_points, constructors_points = result
-        # Write the outputs
-        drivers_points.to_csv(f'data/driver_points_{year}_most_recent.csv', index=False)
-        constructors_points.to_csv(f'data/constructor_points_{year}_most_recent.csv', index=False)
+        write_most_recent_points(drivers_points, constructors_points, year)
     else:
         print("No event points data returned.")
 
+def write_most_recent_points(drivers_points, constructors_points, year):
+    """Write the _most_recent driver and constructor point files the site shows for the latest event."""
+    drivers_points.to_csv(os.path.join(get_data_dir(), f'driver_points_{year}_most_recent.csv'), index=False)
+    constructors_points.to_csv(os.path.join(get_data_dir(), f'constructor_points_{year}_most_recent.csv'), index=False)
+
 if __name__ == '__main__':
     main()
@@ -1,21 +1,227 @@
+import argparse
+import json
+import multiprocessing
 import os
 import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 sys.path.insert(0, project_root)
 from src.data_prep import functions
+from src.data_prep.run_report import recorded_run
 
-def main():
-    # Get all past events and process them
+EVENT_TIMEOUT_ENV = 'F1_POINTS_BACKFILL_EVENT_TIMEOUT'
+DEFAULT_EVENT_TIMEOUT_SECONDS = 900
+# How often the backfill loop checks running events against their deadline
+_DEADLINE_POLL_SECONDS = 1.0
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Compute point files for every past event of the season.")
+    parser.add_argument('--years', type=int, nargs='+', default=None,
+                        help="Season years to process. Defaults to the latest season with past races.")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--batch', action='store_true',
+                      help="Score all past events in one stacked pass instead of one get_event_points call per event.")
+    mode.add_argument('--workers', type=int, default=None,
+                      help="Backfill events in parallel on a pool of N processes sharing one FastF1 cache.")
+    parser.add_argument('--checkpoint', default=None,
+                        help="Backfill checkpoint file. Events recorded as succeeded there are skipped on the next run.")
+    parser.add_argument('--summary', default=None, help="Write the backfill per-event summary as JSON to this path.")
+    parser.add_argument('--event-timeout', type=float, default=None,
+                        help=f"Seconds one backfilled event may run before it is recorded as failed. "
+                             f"Default is {EVENT_TIMEOUT_ENV}, or {DEFAULT_EVENT_TIMEOUT_SECONDS}.")
+    parser.add_argument('--refresh', action='store_true',
+                        help="Reload sessions from FastF1 even when they are in the local results store.")
+    return parser.parse_args(argv)
+
+def get_past_event_names(year=None):
     try:
-        past_event_names = functions.get_past_race_event_names().tolist() or []
+        return functions.get_past_race_event_names(year=year).tolist() or []
     except Exception:
-        past_event_names = []
-    for past_event_name in past_event_names:
-        try:
-            functions.get_event_points(event_name=past_event_name)
-        except Exception:
-            # ignore errors in event processing
-            pass
+        return []
+
+def load_checkpoint(checkpoint_path):
+    """Return the set of (year, event name) pairs a previous backfill completed."""
+    if not checkpoint_path or not os.path.exists(checkpoint_path):
+        return set()
+    with open(checkpoint_path, 'r', encoding='utf-8') as file:
+        checkpoint = json.load(file)
+    return {(entry['year'], entry['event_name']) for entry in checkpoint.get('completed', [])}
+
+def save_checkpoint(checkpoint_path, completed):
+    parent_dir = os.path.dirname(checkpoint_path)
+    if parent_dir:
+        os.makedirs(parent_dir, exist_ok=True)
+    entries = [{'year': year, 'event_name': event_name} for year, event_name in sorted(completed)]
+    # Write then rename so an interrupted run never leaves a truncated checkpoint behind
+    with open(f'{checkpoint_path}.tmp', 'w', encoding='utf-8') as file:
+        json.dump({'completed': entries}, file, ensure_ascii=False, indent=2)
+        file.write("\n")
+    os.replace(f'{checkpoint_path}.tmp', checkpoint_path)
+
+def _init_backfill_worker(cache_dir):
+    # Point every worker's ensure_fastf1_cache at the parent's cache directory
+    os.environ['F1_POINTS_CACHE_DIR'] = cache_dir
+
+def _backfill_event(year, event_name, force_refresh=False):
+    started = time.perf_counter()
+    try:
+        result = functions.get_event_points(event_name=event_name, year=year, return_dfs=True, force_refresh=force_refresh)
+        status, error = ('success', None) if result is not None else ('skipped', "Sessions could not be loaded.")
+    except Exception as exc:
+        status, error = 'failed', f"{type(exc).__name__}: {exc}"
+    return {
+        'year': year,
+        'event_name': event_name,
+        'status': status,
+        'error': error,
+        'seconds': round(time.perf_counter() - started, 3),
+    }
+
+def _new_pool(workers, cache_dir):
+    return ProcessPoolExecutor(max_workers=workers, initializer=_init_backfill_worker, initargs=(cache_dir,))
+
+def _end_stuck_workers():
+    """End pool workers still held by timed-out events once the backfill is done with them."""
+    # The backfill's only child processes are pool workers; a retired pool cannot end a running task itself
+    for process in multiprocessing.active_children():
+        process.terminate()
+
+def summarize_backfill(results, summary_path=None):
+    """
+    Count per-event backfill results by status, print the counts and optionally write them as JSON.
+    Returns:
+        dict: Summary with per-event results and status counts.
+    """
+    results = sorted(results, key=lambda result: (result['year'] or 0, result['event_name']))
+    summary = {
+        'events': results,
+        'counts': {status: sum(result['status'] == status for result in results) for status in ('success', 'skipped', 'failed')},
+    }
+    print(f"📊 Backfill finished: {summary['counts']}")
+
+    if summary_path:
+        parent_dir = os.path.dirname(summary_path)
+        if parent_dir:
+            os.makedirs(parent_dir, exist_ok=True)
+        with open(summary_path, 'w', encoding='utf-8') as file:
+            json.dump(summary, file, ensure_ascii=False, indent=2)
+            file.write("\n")
+    return summary
+
+def _print_result(result):
+    if result['status'] == 'success':
+        print(f"✅ {result['event_name']} ({result['year']}) in {result['seconds']}s")
+    else:
+        print(f"❌ {result['event_name']} ({result['year']}) {result['status']}: {result['error']}")
+
+def run_backfill(years, workers, checkpoint_path=None, summary_path=None, force_refresh=False, event_timeout=None):
+    """
+    Process past events of one or more seasons on a process pool.
+
+    Each event runs in its own task, so a failing or slow event only occupies one
+    worker while the rest of the season keeps going. At most ``workers`` events are
+    submitted at a time, so every submitted event is running and its deadline starts
+    when it does. An event still running after ``event_timeout`` seconds is recorded as
+    failed; its pool is retired (queued work cancelled) and the backfill carries on in a
+    fresh pool, so one stuck event never holds up the summary or the checkpoint. Workers
+    still stuck when the backfill ends are terminated. Successes are recorded in the
+    checkpoint file as they complete, and every event's outcome lands in the summary.
+    Args:
+        event_timeout (float): Seconds one event may run. Default is F1_POINTS_BACKFILL_EVENT_TIMEOUT, or 900.
+    Returns:
+        dict: Summary with per-event results and status counts.
+    """
+    if event_timeout is None:
+        event_timeout = float(os.environ.get(EVENT_TIMEOUT_ENV, DEFAULT_EVENT_TIMEOUT_SECONDS))
+    cache_dir  = os.path.dirname(functions.get_fastf1_cache_path('event_points'))
+    completed  = load_checkpoint(checkpoint_path)
+
+    pending_events = []
+    for year in years:
+        season_year = functions.resolve_season_year(year=year, require_past_races=True)
+        for event_name in get_past_event_names(season_year):
+            if (season_year, event_name) in completed:
+                print(f"⏭️  Skipping {event_name} ({season_year}): already in checkpoint")
+                continue
+            pending_events.append((season_year, event_name))
+
+    results = []
+
+    def record(result):
+        results.append(result)
+        _print_result(result)
+        if result['status'] == 'success':
+            completed.add((result['year'], result['event_name']))
+            if checkpoint_path:
+                save_checkpoint(checkpoint_path, completed)
+
+    executor  = _new_pool(workers, cache_dir)
+    running   = {}
+    timed_out = False
+    try:
+        while pending_events or running:
+            while pending_events and len(running) < workers:
+                year, event_name = pending_events.pop(0)
+                future = executor.submit(_backfill_event, year, event_name, force_refresh)
+                running[future] = ((year, event_name), time.monotonic())
+            done, _ = wait(running, timeout=min(_DEADLINE_POLL_SECONDS, event_timeout), return_when=FIRST_COMPLETED)
+            for future in done:
+                running.pop(future)
+                record(future.result())
+
+            now = time.monotonic()
+            expired = [future for future, (_, started) in running.items() if now - started >= event_timeout]
+            for future in expired:
+                (year, event_name), started = running.pop(future)
+                record({'year': year, 'event_name': event_name, 'status': 'failed',
+                        'error': f"Timed out after {event_timeout:g}s", 'seconds': round(now - started, 3)})
+            if expired:
+                # A pool cannot end one running task: retire it with the stuck event and go on in a fresh one.
+                # Events still running in the retired pool finish there and are collected as usual.
+                timed_out = True
+                executor.shutdown(wait=False, cancel_futures=True)
+                executor = _new_pool(workers, cache_dir)
+    finally:
+        executor.shutdown(wait=not timed_out, cancel_futures=timed_out)
+        if timed_out:
+            _end_stuck_workers()
+
+    return summarize_backfill(results, summary_path)
+
+def main(argv=None):
+    args = parse_args(argv)
+    with recorded_run('get_past_event_points'):
+        return run_past_event_points(args)
+
+def run_past_event_points(args):
+    years = args.years or [None]
+
+    if args.workers:
+        summary = run_backfill(years, args.workers, checkpoint_path=args.checkpoint, summary_path=args.summary,
+                               force_refresh=args.refresh, event_timeout=args.event_timeout)
+        return 1 if summary['counts']['failed'] else 0
+
+    results = []
+    for year in years:
+        # Get all past events and process them
+        past_event_names = get_past_event_names(year)
+
+        if args.batch:
+            if past_event_names:
+                functions.get_season_points(year=year, event_names=past_event_names, force_refresh=args.refresh)
+            continue
+
+        for past_event_name in past_event_names:
+            # One failing event must not stop the season; it is reported and fails the run at the end
+            result = _backfill_event(year, past_event_name, force_refresh=args.refresh)
+            _print_result(result)
+            results.append(result)
+
+    if args.batch:
+        return 0
+    summary = summarize_backfill(results, args.summary)
+    return 1 if summary['counts']['failed'] else 0
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,206 @@
+import argparse
+import functools
+import math
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+from src.data_prep import functions
+from src.data_prep.entity_registry import load_entity_registry
+from src.data_prep.price_alignment import load_current_prices, long_points
+from src.data_prep.run_report import recorded_run, stage
+from src.data_prep.season_bundle import read_scored_rounds
+
+DEFAULT_DRIVERS = 5
+DEFAULT_CONSTRUCTORS = 2
+DEFAULT_BUDGET = 100_000_000
+# Upper bound on budget / price step. The DP keeps one (drivers + 1) x (constructors + 1) x steps table of
+# choices per candidate, so this keeps a 5 + 2 lineup over ~35 candidates to about 13 MB.
+MAX_PRICE_STEPS = 20_000
+LINEUP_COLUMNS = ['EntityType', 'EntityId', 'Name', 'Price', 'Points']
+
+
+def form_points(scored_rounds, window=None):
+    """
+    Total points of every entity over the last ``window`` scored rounds.
+    Args:
+        scored_rounds (list): ``season_bundle.read_scored_rounds`` output.
+        window (int): Optional number of most recent rounds. Default is every scored round.
+    Returns:
+        pd.DataFrame: EntityType, EntityId (FastF1 id) and Points.
+    """
+    if window is not None and window < 1:
+        raise ValueError(f"The form window must be at least one round, got {window}")
+    recent_rounds = scored_rounds[-window:] if window else scored_rounds
+    if not recent_rounds:
+        return pd.DataFrame(columns=['EntityType', 'EntityId', 'Points'])
+    points = pd.concat([long_points(scored_round['points']) for scored_round in recent_rounds], ignore_index=True)
+    return points.groupby(['EntityType', 'EntityId'], as_index=False, sort=False)['Points'].sum()
+
+
+def lineup_candidates(points, prices, registry):
+    """
+    Every priced entity with its points, keyed by canonical id.
+    Args:
+        points (pd.DataFrame): EntityType, EntityId and Points, e.g. ``form_points``.
+        prices (pd.DataFrame): ``price_alignment.load_current_prices`` output.
+        registry (EntityRegistry): Resolves FastF1 ids to the canonical ids prices are filed under.
+    Returns:
+        pd.DataFrame: LINEUP_COLUMNS, with EntityId the canonical id. Priced entities without points score 0.
+    """
+    resolved = points.assign(CanonicalId=registry.canonical_ids(points, 'EntityId')).dropna(subset=['CanonicalId'])
+    # FastF1 ids that share a canonical id (a renamed team) add up
+    resolved = resolved.groupby(['EntityType', 'CanonicalId'], as_index=False)['Points'].sum()
+    candidates = prices.drop_duplicates(['EntityType', 'CanonicalId'], keep='last')[['EntityType', 'CanonicalId', 'Price']]
+    candidates = candidates.merge(resolved, on=['EntityType', 'CanonicalId'], how='left').fillna({'Points': 0.0})
+    candidates = candidates.rename(columns={'CanonicalId': 'EntityId'})
+    candidates['Name'] = [registry.entities[entity_type][entity_id]['name'] or entity_id
+                          for entity_type, entity_id in zip(candidates['EntityType'], candidates['EntityId'])]
+    return candidates[LINEUP_COLUMNS].reset_index(drop=True)
+
+
+def _resolve_entity_ids(candidates, entity_ids, registry, label):
+    """(EntityType, canonical id) of each locked or excluded id; with a registry, ids may also be FastF1 ids or names."""
+    priced = set(zip(candidates['EntityType'], candidates['EntityId']))
+    resolved = set()
+    for entity_id in entity_ids:
+        matches = {(entity_type, canonical_id) for entity_type, canonical_id in priced
+                   if canonical_id == entity_id or (registry is not None and registry.canonical_id(entity_type, entity_id) == canonical_id)}
+        if not matches:
+            raise ValueError(f"Cannot {label} '{entity_id}': no priced driver or constructor has that id")
+        resolved |= matches
+    return resolved
+
+
+def optimize_lineup(candidates, n_drivers=DEFAULT_DRIVERS, n_constructors=DEFAULT_CONSTRUCTORS, budget=DEFAULT_BUDGET,
+                    locked=(), excluded=(), registry=None):
+    """
+    Pick the highest-scoring lineup of ``n_drivers`` drivers and ``n_constructors`` constructors
+    whose prices add up to at most ``budget``.
+
+    An exact 0/1 knapsack with two cardinality constraints, solved by dynamic programming over
+    (drivers picked, constructors picked, price steps spent). Prices are counted in steps of the
+    greatest common divisor of every price and the budget, so discretizing loses nothing. FantasyGP
+    prices move in $0.1M steps, so a $100M budget is at most 1000 steps; the table is filled with one
+    vectorized update per candidate. A locked entity is forced into every state and an excluded one
+    is dropped. Among lineups with the same points, the cheapest one is returned.
+    Args:
+        candidates (pd.DataFrame): LINEUP_COLUMNS, e.g. ``lineup_candidates``. Price is in dollars.
+        n_drivers (int): Drivers in the lineup.
+        n_constructors (int): Constructors in the lineup.
+        budget (float): Price cap in dollars.
+        locked (iterable): Ids that must be in the lineup.
+        excluded (iterable): Ids that must not be in the lineup.
+        registry (EntityRegistry): Optional registry, so locked and excluded ids may be FastF1 ids or names.
+            Without one they must be canonical ids.
+    Returns:
+        pd.DataFrame: LINEUP_COLUMNS of the picked entities, drivers first, highest points first.
+    """
+    if n_drivers < 0 or n_constructors < 0:
+        raise ValueError("Lineup sizes cannot be negative")
+    if budget <= 0:
+        raise ValueError(f"The budget must be positive, got {budget}")
+    locked_keys   = _resolve_entity_ids(candidates, locked, registry, 'lock')
+    excluded_keys = _resolve_entity_ids(candidates, excluded, registry, 'exclude')
+    if locked_keys & excluded_keys:
+        raise ValueError(f"Cannot both lock and exclude: {', '.join(sorted(entity_id for _, entity_id in locked_keys & excluded_keys))}")
+
+    keys = list(zip(candidates['EntityType'], candidates['EntityId']))
+    pool = candidates[[key not in excluded_keys for key in keys]]
+    pool = pool.sort_values(['Points', 'Price'], ascending=[False, True], kind='stable', ignore_index=True)
+    prices = np.rint(pool['Price'].to_numpy(dtype=float)).astype(np.int64)
+    # Budgets in millions (e.g. 128.2) are not exact in dollars; truncating would leave a $1 price step
+    budget = int(round(budget))
+    price_step = functools.reduce(math.gcd, prices.tolist(), budget)
+    steps = budget // price_step
+    if steps > MAX_PRICE_STEPS:
+        raise ValueError(f"Budget of {budget} in steps of {price_step} needs {steps} DP columns (limit {MAX_PRICE_STEPS})")
+    costs = prices // price_step
+    is_driver = (pool['EntityType'] == 'driver').to_numpy()
+    points = pool['Points'].to_numpy(dtype=float)
+    is_locked = [key in locked_keys for key in zip(pool['EntityType'], pool['EntityId'])]
+
+    # best[d, c, s]: most points with d drivers and c constructors costing exactly s steps
+    best = np.full((n_drivers + 1, n_constructors + 1, steps + 1), -np.inf)
+    best[0, 0, 0] = 0.0
+    taken = []
+    for cost, driver, item_points, must_take in zip(costs, is_driver, points, is_locked):
+        with_item = np.full_like(best, -np.inf)
+        if cost <= steps:
+            if driver:
+                with_item[1:, :, cost:] = best[:-1, :, :steps + 1 - cost] + item_points
+            else:
+                with_item[:, 1:, cost:] = best[:, :-1, :steps + 1 - cost] + item_points
+        # A locked entity leaves only the states that include it
+        take = np.isfinite(with_item) if must_take else with_item > best
+        best = with_item if must_take else np.where(take, with_item, best)
+        taken.append(take)
+
+    final = best[n_drivers, n_constructors]
+    if not np.isfinite(final).any():
+        raise ValueError(f"No lineup of {n_drivers} drivers and {n_constructors} constructors fits a budget of "
+                         f"${budget / 1_000_000:.1f}M with the given locks and exclusions")
+    drivers_left, constructors_left, steps_left = n_drivers, n_constructors, int(np.argmax(final))
+    picked = []
+    for index in range(len(taken) - 1, -1, -1):
+        if taken[index][drivers_left, constructors_left, steps_left]:
+            picked.append(index)
+            steps_left -= costs[index]
+            drivers_left, constructors_left = (drivers_left - 1, constructors_left) if is_driver[index] else (drivers_left, constructors_left - 1)
+    lineup = pool.iloc[sorted(picked)]
+    order = lineup['EntityType'].map({'driver': 0, 'constructor': 1})
+    return lineup.assign(_order=order).sort_values(['_order', 'Points'], ascending=[True, False], kind='stable',
+                                                   ignore_index=True)[LINEUP_COLUMNS]
+
+
+def optimize_season_lineup(year=None, window=None, data_dir=None, **options):
+    """
+    The best lineup at current FantasyGP prices, scored on a season's points.
+    Args:
+        year (int): Optional season year. Default is the latest season with past races.
+        window (int): Optional recent-form window in rounds. Default is the whole season.
+        data_dir (str): Optional data directory. Default is the pipeline data directory.
+        **options: n_drivers, n_constructors, budget, locked and excluded, as for ``optimize_lineup``.
+    Returns:
+        pd.DataFrame: The ``optimize_lineup`` result.
+    """
+    year = year or functions.resolve_season_year(require_past_races=True)
+    with stage('lineup_optimizer', year=int(year)):
+        registry = load_entity_registry(data_dir)
+        points = form_points(read_scored_rounds(year, data_dir), window)
+        candidates = lineup_candidates(points, load_current_prices(data_dir, registry), registry)
+        return optimize_lineup(candidates, registry=registry, **options)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Pick the best-scoring FantasyGP lineup under the budget at current prices.")
+    parser.add_argument('--year', type=int, default=None, help="Season to score. Default is the latest season with past races.")
+    parser.add_argument('--drivers', type=int, default=DEFAULT_DRIVERS, help=f"Drivers in the lineup (default {DEFAULT_DRIVERS}).")
+    parser.add_argument('--constructors', type=int, default=DEFAULT_CONSTRUCTORS,
+                        help=f"Constructors in the lineup (default {DEFAULT_CONSTRUCTORS}).")
+    parser.add_argument('--budget', type=float, default=DEFAULT_BUDGET / 1_000_000,
+                        help=f"Price cap in millions (default {DEFAULT_BUDGET / 1_000_000:.0f}).")
+    parser.add_argument('--window', type=int, default=None, help="Score on the last N scored rounds only. Default is the whole season.")
+    parser.add_argument('--lock', nargs='+', default=[], help="Drivers or constructors that must be picked (FastF1 id, NameKey or name).")
+    parser.add_argument('--exclude', nargs='+', default=[], help="Drivers or constructors that must not be picked.")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    with recorded_run('lineup_optimizer'):
+        lineup = optimize_season_lineup(args.year, args.window, n_drivers=args.drivers, n_constructors=args.constructors,
+                                        budget=round(args.budget * 1_000_000), locked=args.lock, excluded=args.exclude)
+    form = f"last {args.window} rounds" if args.window else "season"
+    print(f"🏎️  Best lineup on {form} points:")
+    for pick in lineup.itertuples(index=False):
+        print(f"   {pick.EntityType:<12} {pick.Name:<20} ${pick.Price / 1_000_000:>5.1f}M {pick.Points:>8.1f} pts")
+    print(f"💰 Total ${lineup['Price'].sum() / 1_000_000:.1f}M of ${args.budget:.1f}M for {lineup['Points'].sum():.1f} points")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+
+
+CATEGORY_COLUMNS = ['DriverId', 'TeamId', 'EventName', 'EventFormat']
+INTEGER_DTYPE = 'int16'
+NULLABLE_INTEGER_DTYPE = 'Int16'
+FRACTIONAL_DTYPE = 'float32'
+
+
+def is_points_column(column):
+    return 'Points' in column
+
+
+def is_sprint_only_column(column):
+    """Sprint columns are empty on conventional weekends, so they always get a nullable type."""
+    return 'Sprint' in column and is_points_column(column)
+
+
+def _is_integral(values):
+    values = values.dropna()
+    return bool(np.all(np.mod(values.to_numpy(dtype='float64'), 1) == 0))
+
+
+def _fits_int16(values):
+    values = values.dropna()
+    info = np.iinfo(INTEGER_DTYPE)
+    return values.empty or (values.min() >= info.min and values.max() <= info.max)
+
+
+def points_column_dtype(column, values):
+    """
+    Pick the compact dtype for one point (or round) column.
+    Returns:
+        str: int16 when the column is whole and complete, Int16 when whole with gaps (or sprint-only),
+            and float32 when it holds fractional points (e.g. half points for a shortened race).
+    """
+    numeric = pd.to_numeric(values, errors='coerce')
+    if not _is_integral(numeric) or not _fits_int16(numeric):
+        return FRACTIONAL_DTYPE
+    if is_sprint_only_column(column) or numeric.isna().any():
+        return NULLABLE_INTEGER_DTYPE
+    return INTEGER_DTYPE
+
+
+def apply_points_schema(points_df):
+    """
+    Convert a points frame to compact dtypes.
+
+    Ids, event names and formats become categoricals, RoundNumber and point columns
+    become (nullable) 16-bit integers, and columns the schema does not know keep
+    their dtype. Applying the schema twice is a no-op.
+    Args:
+        points_df (pd.DataFrame): Slim event points or combined standings.
+    Returns:
+        pd.DataFrame: A typed copy of the frame.
+    """
+    typed_df = points_df.copy()
+    for column in typed_df.columns:
+        if column in CATEGORY_COLUMNS:
+            typed_df[column] = typed_df[column].astype('category')
+        elif column == 'RoundNumber' or is_points_column(column):
+            dtype = points_column_dtype(column, typed_df[column])
+            typed_df[column] = pd.to_numeric(typed_df[column], errors='coerce').astype(dtype)
+    return typed_df
+
+
+def read_points_csv(path, **kwargs):
+    """Read a points CSV straight into the compact schema."""
+    return apply_points_schema(pd.read_csv(path, **kwargs))
+
+
+def memory_usage_bytes(points_df):
+    return int(points_df.memory_usage(index=True, deep=True).sum())
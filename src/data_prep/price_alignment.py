@@ -0,0 +1,163 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+from src.data_prep.data_paths import CURRENT_PRICES_FILE_NAME, list_price_snapshots
+from src.data_prep.entity_registry import load_entity_registry, normalize_name_key
+from src.data_prep.season_schedule import get_data_dir
+
+ENTITY_COLUMNS = {
+    'driver': ('DriverId', 'TotalDriverPoints'),
+    'constructor': ('TeamId', 'TotalConstructorPoints'),
+}
+PRICE_COLUMNS = ['EntityType', 'PriceKey', 'CanonicalId', 'Price']
+ALIGNED_PRICE_COLUMNS = ['RoundNumber', 'EntityType', 'EntityId', 'SnapshotDate', 'Price', 'Points', 'PointsPerMillion']
+VALUE_COLUMNS = ['EntityType', 'EntityId', 'Price', 'Points', 'PointsPerMillion']
+
+
+def _with_canonical_ids(frame, id_column, registry, label):
+    """Attach CanonicalId from the registry; rows it does not know are reported and dropped."""
+    frame = frame.assign(CanonicalId=registry.canonical_ids(frame, id_column))
+    unregistered = frame['CanonicalId'].isna()
+    if unregistered.any():
+        print(f"⚠️  {unregistered.sum()} {label} rows are not in the entity registry: "
+              f"{', '.join(sorted(set(frame.loc[unregistered, id_column].astype(str))))}")
+    return frame[~unregistered]
+
+
+def normalize_prices(prices, registry):
+    """
+    Price rows as EntityType, PriceKey, CanonicalId and Price in dollars; FantasyGP files carry
+    millions (e.g. 21.0). Rows without a type, key or positive price are dropped.
+    """
+    name_keys = prices['NameKey'] if 'NameKey' in prices.columns else prices['Name']
+    if 'Name' in prices.columns:
+        name_keys = name_keys.fillna(prices['Name'])
+    price = pd.to_numeric(prices['Price'], errors='coerce')
+    normalized = pd.DataFrame({
+        'EntityType': prices['EntityType'],
+        'PriceKey': name_keys.map(normalize_name_key, na_action='ignore'),
+        'Price': np.where(price < 1000, price * 1_000_000, price),
+    })
+    normalized = normalized[normalized['EntityType'].notna() & (normalized['PriceKey'].fillna('') != '') & (normalized['Price'] > 0)]
+    return _with_canonical_ids(normalized, 'PriceKey', registry, 'price')[PRICE_COLUMNS]
+
+
+def load_price_history(data_dir=None, registry=None):
+    """
+    Every dated FantasyGP price snapshot as one frame.
+    Args:
+        data_dir (str): Optional data directory. Default is the pipeline data directory.
+        registry (EntityRegistry): Optional entity registry. Default is the data directory's registry.
+    Returns:
+        pd.DataFrame: SnapshotDate (UTC midnight) and PRICE_COLUMNS, one row per entity and snapshot,
+            sorted by SnapshotDate.
+    """
+    registry  = registry or load_entity_registry(data_dir)
+    snapshots = [normalize_prices(pd.read_csv(path), registry).assign(SnapshotDate=pd.Timestamp(snapshot_date))
+                 for snapshot_date, path in list_price_snapshots(data_dir or get_data_dir())]
+    if not snapshots:
+        return pd.DataFrame({'SnapshotDate': pd.Series(dtype='datetime64[ns]'),
+                             **{column: pd.Series(dtype=float if column == 'Price' else object) for column in PRICE_COLUMNS}})
+    history = pd.concat(snapshots, ignore_index=True)
+    history = history.drop_duplicates(['SnapshotDate', 'EntityType', 'CanonicalId'], keep='last')
+    return history[['SnapshotDate', *PRICE_COLUMNS]].sort_values('SnapshotDate', kind='stable', ignore_index=True)
+
+
+def load_current_prices(data_dir=None, registry=None):
+    current_path = os.path.join(data_dir or get_data_dir(), CURRENT_PRICES_FILE_NAME)
+    if not os.path.exists(current_path):
+        return pd.DataFrame(columns=PRICE_COLUMNS)
+    return normalize_prices(pd.read_csv(current_path), registry or load_entity_registry(data_dir))
+
+
+def current_prices_season(data_dir=None):
+    """
+    The season the current FantasyGP prices belong to: the year they were scraped (ScrapedAtUtc),
+    or the year of the latest dated snapshot for files without it. None without any prices.
+    """
+    data_dir = data_dir or get_data_dir()
+    current_path = os.path.join(data_dir, CURRENT_PRICES_FILE_NAME)
+    if os.path.exists(current_path):
+        current = pd.read_csv(current_path)
+        if 'ScrapedAtUtc' in current.columns:
+            scraped_at = pd.to_datetime(current['ScrapedAtUtc'], utc=True, errors='coerce').dropna()
+            if not scraped_at.empty:
+                return int(scraped_at.max().year)
+    snapshots = list_price_snapshots(data_dir)
+    return int(snapshots[-1][0][:4]) if snapshots else None
+
+
+def long_points(points_by_entity):
+    """
+    Stack slim driver and constructor points into EntityType, EntityId and (total) Points.
+    Args:
+        points_by_entity (dict): Entity type -> slim points DataFrame.
+    """
+    frames = []
+    for entity_type, points_df in points_by_entity.items():
+        id_column, total_column = ENTITY_COLUMNS[entity_type]
+        frames.append(pd.DataFrame({'EntityType': entity_type, 'EntityId': points_df[id_column].astype(str),
+                                    'Points': points_df[total_column].astype(float)}))
+    return pd.concat(frames, ignore_index=True)
+
+
+def _points_per_million(aligned):
+    return aligned.assign(PointsPerMillion=aligned['Points'].astype(float) / (aligned['Price'] / 1_000_000))
+
+
+def align_round_prices(round_points, price_history, registry):
+    """
+    Price every (round, entity) with the snapshot in force on the round's event date.
+
+    An as-of join (``pd.merge_asof``) on EventDate against SnapshotDate, by entity: each
+    round takes the latest snapshot taken on or before its event day. Rounds before the
+    first snapshot take the earliest one, as the page did.
+    Args:
+        round_points (pd.DataFrame): RoundNumber, EventDate, EntityType, EntityId and Points.
+        price_history (pd.DataFrame): The output of ``load_price_history``.
+        registry (EntityRegistry): Resolves each EntityId to the canonical id its prices are filed under.
+    Returns:
+        pd.DataFrame: ALIGNED_PRICE_COLUMNS, one row per priced (round, entity), ordered by round and entity.
+            SnapshotDate is a YYYY-MM-DD string.
+    """
+    rounds = round_points.assign(
+        EventDate=pd.to_datetime(round_points['EventDate'].astype(str).str.slice(0, 10)),
+        CanonicalId=registry.canonical_ids(round_points, 'EntityId'),
+    ).dropna(subset=['CanonicalId', 'EventDate']).sort_values('EventDate', kind='stable')
+    if rounds.empty:
+        return pd.DataFrame(columns=ALIGNED_PRICE_COLUMNS)
+
+    history = price_history[['SnapshotDate', 'EntityType', 'CanonicalId', 'Price']]
+    history = history.assign(SnapshotDate=history['SnapshotDate'].astype('datetime64[ns]'))
+    rounds  = rounds.assign(EventDate=rounds['EventDate'].astype('datetime64[ns]'))
+    as_of = dict(left_on='EventDate', right_on='SnapshotDate', by=['EntityType', 'CanonicalId'])
+    aligned = pd.merge_asof(rounds, history, direction='backward', **as_of)
+    earliest = pd.merge_asof(rounds, history, direction='forward', **as_of)
+    missing = aligned['Price'].isna()
+    aligned.loc[missing, ['SnapshotDate', 'Price']] = earliest.loc[missing, ['SnapshotDate', 'Price']]
+
+    aligned = _points_per_million(aligned.dropna(subset=['Price']))
+    aligned['SnapshotDate'] = aligned['SnapshotDate'].dt.strftime('%Y-%m-%d')
+    return aligned.sort_values(['RoundNumber', 'EntityType', 'EntityId'], ignore_index=True)[ALIGNED_PRICE_COLUMNS]
+
+
+def value_table(points, prices, registry):
+    """
+    Points per $1M of each entity at the given prices.
+    Args:
+        points (pd.DataFrame): EntityType, EntityId and Points.
+        prices (pd.DataFrame): PRICE_COLUMNS with Price in dollars, e.g. ``load_current_prices``.
+        registry (EntityRegistry): Resolves each EntityId to the canonical id its prices are filed under.
+    Returns:
+        pd.DataFrame: VALUE_COLUMNS for every priced entity, best value first.
+    """
+    priced = points.assign(CanonicalId=registry.canonical_ids(points, 'EntityId')).dropna(subset=['CanonicalId'])
+    current_prices = prices.drop_duplicates(['EntityType', 'CanonicalId'], keep='last')[['EntityType', 'CanonicalId', 'Price']]
+    priced = priced.merge(current_prices, on=['EntityType', 'CanonicalId'])
+    priced = _points_per_million(priced)
+    return priced.sort_values('PointsPerMillion', ascending=False, kind='stable', ignore_index=True)[VALUE_COLUMNS]
@@ -0,0 +1,223 @@
+import argparse
+import datetime
+import hashlib
+import json
+import os
+import sys
+
+import pandas as pd
+
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+from src.data_prep import functions
+from src.data_prep.get_most_recent_event_points import write_most_recent_points
+from src.data_prep.points_schema import apply_points_schema
+from src.data_prep.run_report import recorded_run, stage
+from src.data_prep.scoring_rules import load_scoring_rules
+from src.data_prep.season_schedule import load_season_schedule
+
+SCORED_SESSIONS_DIR_ENV = 'F1_POINTS_SCORED_SESSIONS_DIR'
+SCORING_SESSION_TYPES = ['Sprint', 'Qualifying', 'Race']
+
+
+def has_classified_results(session_results):
+    """
+    Whether a session's results are final during a race weekend: FastF1 serves a partly classified
+    results frame while a session is still being published, so every driver needs a Position.
+    Scoring after the weekend accepts unclassified drivers, as they never get a Position.
+    """
+    return len(session_results) > 0 and 'Position' in session_results.columns and bool(session_results['Position'].notna().all())
+
+
+def get_scored_sessions_dir():
+    """Get the scored session cache directory (F1_POINTS_SCORED_SESSIONS_DIR, or scored_sessions under the cache dir)."""
+    return os.environ.get(
+        SCORED_SESSIONS_DIR_ENV,
+        os.path.join(os.environ.get('F1_POINTS_CACHE_DIR', os.path.join(functions.PROJECT_ROOT, '.cache')), 'scored_sessions')
+    )
+
+
+def rules_key(scoring_rules):
+    """Short, stable key for a rule set, so frames scored under other rules are never reused."""
+    rules_json = json.dumps(scoring_rules.to_dict(), sort_keys=True)
+    return hashlib.sha256(rules_json.encode('utf-8')).hexdigest()[:12]
+
+
+class ScoredSessionCache:
+    """
+    Scored session frames (the output of ``CompiledScoringPlan.score_session``) on disk.
+
+    Frames live at ``{root}/{rules_key}/{year}/round_{NN}/{driver|constructor}_{session}.parquet``,
+    so a weekend scored provisionally on Saturday is upgraded on Sunday by scoring the
+    Race alone and merging it with the stored Sprint and Qualifying frames.
+    """
+
+    def __init__(self, scoring_rules=None, root=None):
+        self.scoring_rules = scoring_rules or load_scoring_rules()
+        self.root = root or get_scored_sessions_dir()
+
+    def path_for(self, entity_type, year, event_round, session_type):
+        return os.path.join(self.root, rules_key(self.scoring_rules), str(year), f'round_{int(event_round):02d}',
+                            f'{entity_type}_{session_type.lower()}.parquet')
+
+    def get(self, year, event_round, session_type):
+        """
+        Returns:
+            tuple: The stored driver and constructor (None for Qualifying) points frames, or None when not stored.
+        """
+        driver_path = self.path_for('driver', year, event_round, session_type)
+        if not os.path.exists(driver_path):
+            return None
+        constructor_path = self.path_for('constructor', year, event_round, session_type)
+        constructor_points = pd.read_parquet(constructor_path) if os.path.exists(constructor_path) else None
+        return pd.read_parquet(driver_path), constructor_points
+
+    def put(self, year, event_round, session_type, driver_points, constructor_points=None):
+        for entity_type, points_df in (('constructor', constructor_points), ('driver', driver_points)):
+            if points_df is None:
+                continue
+            # The driver frame is written last: its presence marks the session as stored
+            path = self.path_for(entity_type, year, event_round, session_type)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f'{path}.{os.getpid()}.tmp'
+            points_df.to_parquet(temp_path)
+            os.replace(temp_path, path)
+
+
+def current_weekend(year=None, now=None):
+    """
+    The race weekend of the latest scoring session (Sprint, Qualifying or Race) that has started.
+    Returns:
+        pd.Series: That event's Race row from the schedule, or None when no scoring session has started.
+    """
+    now = now or datetime.datetime.now(datetime.timezone.utc)
+    year = functions.resolve_season_year(year=year, today=now)
+    schedule = load_season_schedule(year)
+
+    latest_sessions = [functions.get_most_recent_session_df(schedule.session_time_index, session_type=session_type, today=now, year=year)
+                       for session_type in SCORING_SESSION_TYPES]
+    latest_sessions = [session for session in latest_sessions if not session.empty]
+    if not latest_sessions:
+        return None
+    latest_session = max(latest_sessions, key=lambda session: pd.to_datetime(session['SessionDateUtc'].iloc[0], utc=True))
+    return schedule.get_race_by_event_name(latest_session['EventName'].iloc[0])
+
+
+def write_provisional_points(driver_points, constructor_points, year):
+    """
+    Write provisional points to the _most_recent files with a Provisional column.
+
+    Provisional points stay out of the season store and the per-event files, so the
+    season standings only ever combine finished weekends.
+    """
+    write_most_recent_points(driver_points.assign(Provisional=True), constructor_points.assign(Provisional=True), year)
+
+
+def score_weekend(year=None, event_name=None, now=None, scoring_rules=None, export_csv=None, cache=None):
+    """
+    Score whichever sessions of a race weekend are complete.
+
+    Sessions already in the scored session cache are reused as they are; only sessions
+    whose results have newly appeared are loaded and scored. When every session is in,
+    the weekend is written like ``get_event_points`` does. Otherwise the merged points
+    are provisional and only the _most_recent files are written, with Provisional=True.
+    Args:
+        year (int): Optional season year. Default is the season of ``now``.
+        event_name (str): Optional event. Default is the weekend of the latest scoring session that has started.
+        now (datetime): The current UTC time. Default is now.
+        scoring_rules (ScoringRuleSet): Optional scoring rules. Default is the configured rule set.
+        export_csv (bool): Also write the per-event CSV copies of a complete weekend. Default is F1_POINTS_EXPORT_CSV (on).
+        cache (ScoredSessionCache): Optional scored session cache. Default is the cache directory for the rules.
+    Returns:
+        tuple: Slim driver and constructor points DataFrames and whether they are provisional,
+            or None when no session of the weekend has results yet.
+    """
+    now   = now or datetime.datetime.now(datetime.timezone.utc)
+    cache = cache or ScoredSessionCache(scoring_rules)
+    scoring_plan = cache.scoring_rules.compile()
+
+    with stage('schedule_resolve', event_name=event_name):
+        year = functions.resolve_season_year(year=year, today=now)
+        race = current_weekend(year, now) if event_name is None else load_season_schedule(year).get_race_by_event_name(event_name)
+    if race is None:
+        print("No race weekend with a started scoring session. Skipping provisional scoring.")
+        return None
+
+    event_name, event_round, event_format = race['EventName'], int(race['RoundNumber']), race['EventFormat']
+    sessions = load_season_schedule(year).sessions
+    session_starts = sessions[sessions['EventName'] == event_name].set_index('SessionName')['SessionDateUtc']
+
+    driver_points_dfs      = {}
+    constructor_points_dfs = {}
+    for session_type in functions.get_session_types_list(event_format):
+        scored = cache.get(year, event_round, session_type)
+        if scored is None:
+            session_start = session_starts.get(session_type)
+            if session_start is None or pd.isna(session_start):
+                print(f"⚠️  The schedule has no {session_type} start for {event_name}; skipping it.")
+                continue
+            if pd.to_datetime(session_start, utc=True) > pd.Timestamp(now):
+                continue
+            try:
+                session_dfs, _ = functions.load_event_session_results(year, event_name, [session_type], event_round=event_round,
+                                                                      accept_results=has_classified_results)
+            except functions.SessionLoadError as exc:
+                print(f"⏳ {session_type} for {event_name} is not available yet: {exc}")
+                continue
+            scored = scoring_plan.score_session(session_dfs[session_type], session_type)
+            cache.put(year, event_round, session_type, *scored)
+            print(f"🏎️  Scored {session_type} for {event_name}")
+        else:
+            print(f"♻️  Reusing scored {session_type} for {event_name}")
+        driver_points_dfs[session_type] = scored[0]
+        if scored[1] is not None:
+            constructor_points_dfs[session_type] = scored[1]
+
+    if not driver_points_dfs:
+        print(f"No session of {event_name} ({year}) has results yet.")
+        return None
+    return write_weekend_points(scoring_plan, driver_points_dfs, constructor_points_dfs, year, event_round, event_name,
+                                event_format, export_csv)
+
+
+def write_weekend_points(scoring_plan, driver_points_dfs, constructor_points_dfs, year, event_round, event_name, event_format,
+                         export_csv=None):
+    """
+    Merge a weekend's scored sessions and write them, provisionally when sessions are still missing.
+    Returns:
+        tuple: Slim driver and constructor points DataFrames and whether they are provisional.
+    """
+    provisional = len(driver_points_dfs) < len(functions.get_session_types_list(event_format))
+    driver_points, constructor_points = scoring_plan.merge_sessions(driver_points_dfs, constructor_points_dfs, event_format,
+                                                                    allow_pending=provisional)
+    driver_points       = driver_points.assign(EventName=event_name)
+    constructor_points  = constructor_points.assign(EventName=event_name)
+
+    if provisional:
+        driver_points, constructor_points = apply_points_schema(driver_points), apply_points_schema(constructor_points)
+        write_provisional_points(driver_points, constructor_points, year)
+        print(f"📝 Wrote provisional points for {event_name} ({year}) from {', '.join(driver_points_dfs)}")
+    else:
+        # write_event_points applies the points schema
+        driver_points, constructor_points = functions.write_event_points(driver_points, constructor_points, year, event_round,
+                                                                         event_name, export_csv=export_csv)
+        write_most_recent_points(driver_points, constructor_points, year)
+        print(f"💾 Wrote points for {event_name} ({year})")
+    return driver_points, constructor_points, provisional
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Score the completed sessions of the current race weekend, provisionally until the Race is in.")
+    parser.add_argument('--year', type=int, default=None, help="Season year. Default is the current season.")
+    parser.add_argument('--event', default=None, help="Event name. Default is the weekend of the latest started scoring session.")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    with recorded_run('provisional_points'):
+        score_weekend(args.year, args.event)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,408 @@
+import abc
+import argparse
+import datetime
+import functools
+import hashlib
+import json
+import os
+import sys
+import time
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+# Only stdlib modules are imported up front: deciding that every stage is fresh must not
+# pay for pandas or FastF1. Stage modules are imported when a stage actually runs.
+from src.data_prep import data_manifest, data_paths
+from src.data_prep.data_paths import ENTITY_TYPES, file_sha256, get_data_dir, race_is_past, read_races
+from src.data_prep.run_report import recorded_run, stage
+
+STATE_FILE_NAME = 'pipeline_state.json'
+
+
+class PipelineContext:
+    """
+    What the stages of one run share: the data directory, the run time, and the sessions
+    files read with the csv module so freshness checks never import pandas.
+    """
+
+    def __init__(self, data_dir=None, now=None):
+        self.data_dir = data_dir or get_data_dir()
+        self.now      = now or datetime.datetime.now(datetime.timezone.utc)
+        self._races   = {}
+
+    def sessions_path(self, year):
+        return data_paths.get_sessions_path(year, self.data_dir)
+
+    def races(self, year):
+        """Race sessions of a season as dicts with round, event name, event date and session time, in file order."""
+        if year not in self._races:
+            self._races[year] = read_races(self.sessions_path(year))
+        return self._races[year]
+
+    def past_events(self, year):
+        """(round, event name) of races finished before now, counted from the end of their event day."""
+        past_events = []
+        for race in self.races(year):
+            event = (race['round'], race['event_name'])
+            if race_is_past(race['event_date'], self.now) and event not in past_events:
+                past_events.append(event)
+        return past_events
+
+    def latest_race(self, year):
+        """The race with the latest session time before now, as scored by get_most_recent_event_points."""
+        started = [race for race in self.races(year) if race['session_utc'] is not None and race['session_utc'] < self.now]
+        return max(started, key=lambda race: race['session_utc'], default=None)
+
+    @functools.cached_property
+    def season_year(self):
+        """The season functions.resolve_season_year(require_past_races=True) would pick, or None."""
+        manifest = data_manifest.load_current_manifest(self.data_dir)
+        if manifest is not None:
+            return data_manifest.resolve_season_year(manifest['seasons'], self.now)
+        candidate_years = [self.now.year]
+        if os.path.isdir(self.data_dir):
+            available_years = []
+            for filename in os.listdir(self.data_dir):
+                raw_year = filename.removeprefix('sessions_').removesuffix('.csv')
+                if filename.startswith('sessions_') and filename.endswith('.csv') and raw_year.isdigit():
+                    available_years.append(int(raw_year))
+            candidate_years += [year for year in sorted(set(available_years), reverse=True) if year != self.now.year]
+        for year in candidate_years:
+            if self.past_events(year):
+                return year
+        return None
+
+    def store_path(self, entity_type, year, event_round):
+        return data_paths.get_season_store_path(entity_type, year, event_round, data_paths.get_season_store_dir(self.data_dir))
+
+    def event_points_path(self, entity_type, year, event_round, event_name):
+        return data_paths.get_event_points_path(entity_type, year, event_round, event_name, self.data_dir)
+
+    def event_paths(self, year, events):
+        """Point file of each (round, event name) and entity, keyed 'entity/round/event'; events without one are left out."""
+        return data_paths.find_event_paths(year, events, self.data_dir)
+
+    def price_paths(self):
+        # The dated snapshots price_alignment.load_price_history reads, plus the current price file
+        price_paths = [path for _, path in data_paths.list_price_snapshots(self.data_dir)]
+        return price_paths + [os.path.join(self.data_dir, data_paths.CURRENT_PRICES_FILE_NAME)]
+
+    def points_paths(self):
+        """Every point CSV in the data dir and every season store file, as entity_registry.collect_fastf1_ids reads them."""
+        points_paths = [os.path.join(self.data_dir, file_name) for file_name in sorted(os.listdir(self.data_dir))
+                        if data_paths.POINTS_FILE_PATTERN.match(file_name)] if os.path.isdir(self.data_dir) else []
+        for root, dir_names, file_names in os.walk(data_paths.get_season_store_dir(self.data_dir)):
+            dir_names.sort()
+            points_paths += [os.path.join(root, file_name) for file_name in sorted(file_names) if file_name.endswith('.parquet')]
+        return points_paths
+
+    def registry_path(self):
+        return data_paths.get_registry_path(self.data_dir)
+
+    def csv_export_enabled(self):
+        return data_paths.csv_export_enabled()
+
+    def scoring_rules_fingerprint(self):
+        path = os.environ.get('F1_POINTS_SCORING_RULES')
+        if not path:
+            return None
+        return {'path': os.path.abspath(path), 'sha256': file_sha256(path) if os.path.exists(path) else None}
+
+
+class PipelineStage(abc.ABC):
+    """
+    One step of the pipeline with declared inputs and outputs.
+
+    ``inputs`` returns a JSON-serialisable description of everything the stage reads
+    (file hashes, the events it covers), or None when there is nothing to do yet.
+    ``outputs`` lists the files it writes. A stage is fresh when its inputs hash to
+    the value recorded after its last successful run and every output still has the
+    recorded content.
+    """
+
+    name = None
+
+    @abc.abstractmethod
+    def inputs(self, context):
+        """JSON-serialisable description of what the stage reads, or None when there is nothing to do yet."""
+
+    @abc.abstractmethod
+    def outputs(self, context):
+        """Paths of the files the stage writes."""
+
+    @abc.abstractmethod
+    def run(self, context):
+        """Run the stage."""
+
+
+class EventScheduleStage(PipelineStage):
+    """
+    Refresh the current season's sessions file from FastF1.
+
+    The schedule is fetched when the file is missing and again once after every race
+    weekend (to pick up calendar changes); a week without a race leaves it alone.
+    """
+
+    name = 'event_schedule'
+
+    def inputs(self, context):
+        past_events = context.past_events(context.now.year)
+        return {'year': context.now.year, 'last_past_event': past_events[-1] if past_events else None}
+
+    def outputs(self, context):
+        return [context.sessions_path(context.now.year)]
+
+    def run(self, context):
+        from src.data_prep.get_event_schedule import write_event_schedule
+        write_event_schedule(context.now.year, context.data_dir)
+
+
+class EventPointsStage(PipelineStage):
+    """Score the most recent race weekend and write its per-event and _most_recent point files."""
+
+    name = 'event_points'
+
+    def inputs(self, context):
+        year = context.season_year
+        race = context.latest_race(year) if year else None
+        if race is None:
+            return None
+        return {
+            'year': year,
+            'event': [race['round'], race['event_name']],
+            'sessions_sha256': file_sha256(context.sessions_path(year)),
+            'scoring_rules': context.scoring_rules_fingerprint(),
+        }
+
+    def outputs(self, context):
+        year = context.season_year
+        race = context.latest_race(year)
+        paths = [os.path.join(context.data_dir, f'{entity_type}_points_{year}_most_recent.csv') for entity_type in ENTITY_TYPES]
+        paths += [context.store_path(entity_type, year, race['round']) for entity_type in ENTITY_TYPES]
+        if context.csv_export_enabled():
+            paths += [context.event_points_path(entity_type, year, race['round'], race['event_name']) for entity_type in ENTITY_TYPES]
+        return paths
+
+    def run(self, context):
+        from src.data_prep.get_most_recent_event_points import write_most_recent_event_points
+        write_most_recent_event_points()
+
+
+class CombineStage(PipelineStage):
+    """Merge the per-event point files of past races into the season's _current standings."""
+
+    name = 'combine'
+
+    def inputs(self, context):
+        year = context.season_year
+        if year is None:
+            return None
+        event_paths = context.event_paths(year, context.past_events(year))
+        if not event_paths:
+            return None
+        return {
+            'year': year,
+            'export_csv': context.csv_export_enabled(),
+            'event_files': {key: file_sha256(path) for key, path in event_paths.items()},
+        }
+
+    def outputs(self, context):
+        if not context.csv_export_enabled():
+            return []
+        year = context.season_year
+        paths = [os.path.join(context.data_dir, f'{entity_type}_points_{year}_current.csv') for entity_type in ENTITY_TYPES]
+        return paths + [os.path.join(context.data_dir, f'combine_manifest_{year}.json')]
+
+    def run(self, context):
+        from src.data_prep import combine_event_points
+        year = context.season_year
+        combine_event_points.combine_points(year, context.past_events(year), incremental=True, data_dir=context.data_dir)
+
+
+class EntityRegistryStage(PipelineStage):
+    """Match the FastF1 ids of every point file to FantasyGP price keys and store the entity registry."""
+
+    name = 'entity_registry'
+
+    def inputs(self, context):
+        watched_paths = [path for path in context.points_paths() + context.price_paths() if os.path.exists(path)]
+        if not watched_paths:
+            return None
+        return {'files': {os.path.relpath(path, context.data_dir).replace(os.sep, '/'): file_sha256(path) for path in watched_paths}}
+
+    def outputs(self, context):
+        return [context.registry_path()]
+
+    def run(self, context):
+        from src.data_prep.entity_registry import write_entity_registry
+        write_entity_registry(context.data_dir)
+
+
+class SeasonBundleStage(PipelineStage):
+    """Export the season bundle (schedule, per-round points and round-aligned prices) index.html loads in one request."""
+
+    name = 'season_bundle'
+
+    def inputs(self, context):
+        year = context.season_year
+        if year is None:
+            return None
+        events = [(race['round'], race['event_name']) for race in context.races(year)]
+        watched_paths = {
+            **context.event_paths(year, events),
+            **{os.path.basename(path): path for path in context.price_paths()},
+            'entity_registry': context.registry_path(),
+            **{f'{entity_type}/most_recent': os.path.join(context.data_dir, f'{entity_type}_points_{year}_most_recent.csv')
+               for entity_type in ENTITY_TYPES},
+            'sessions': context.sessions_path(year),
+        }
+        return {
+            'year': year,
+            'files': {key: file_sha256(path) if os.path.exists(path) else None for key, path in watched_paths.items()},
+        }
+
+    def outputs(self, context):
+        return [os.path.join(context.data_dir, f'season_bundle_{context.season_year}.json')]
+
+    def run(self, context):
+        from src.data_prep import season_bundle
+        season_bundle.write_season_bundle(context.season_year, data_dir=context.data_dir)
+
+
+STAGES = [EventScheduleStage(), EventPointsStage(), CombineStage(), EntityRegistryStage(), SeasonBundleStage()]
+STAGE_NAMES = [pipeline_stage.name for pipeline_stage in STAGES]
+
+
+def get_state_path(data_dir=None):
+    return os.path.join(data_dir or get_data_dir(), STATE_FILE_NAME)
+
+
+def load_state(data_dir=None):
+    """Return the per-stage {'inputs_sha256', 'outputs', 'completed_at_utc'} records of the last successful runs."""
+    state_path = get_state_path(data_dir)
+    if not os.path.exists(state_path):
+        return {}
+    with open(state_path, 'r', encoding='utf-8') as file:
+        return json.load(file).get('stages', {})
+
+
+def save_state(stages, data_dir=None):
+    state_path = get_state_path(data_dir)
+    os.makedirs(os.path.dirname(state_path), exist_ok=True)
+    temp_path = f'{state_path}.{os.getpid()}.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as file:
+        json.dump({'stages': stages}, file, ensure_ascii=False, indent=2, sort_keys=True)
+        file.write("\n")
+    os.replace(temp_path, state_path)
+
+
+def _inputs_sha256(inputs):
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+
+def _output_hashes(paths, data_dir):
+    """{path relative to the data dir: sha256}, or None when any output is missing."""
+    if not all(os.path.exists(path) for path in paths):
+        return None
+    return {os.path.relpath(path, data_dir): file_sha256(path) for path in paths}
+
+
+def stage_status(pipeline_stage, context, stage_state):
+    """
+    Decide whether a stage has to run.
+    Returns:
+        tuple: (status, inputs) where status is 'idle' (nothing to do yet), 'fresh' or 'stale'.
+    """
+    inputs = pipeline_stage.inputs(context)
+    if inputs is None:
+        return 'idle', None
+    if not stage_state or stage_state.get('inputs_sha256') != _inputs_sha256(inputs):
+        return 'stale', inputs
+    if _output_hashes(pipeline_stage.outputs(context), context.data_dir) != stage_state.get('outputs'):
+        return 'stale', inputs
+    return 'fresh', inputs
+
+
+def run_pipeline(force=(), skip=(), dry_run=False):
+    """
+    Run every stale pipeline stage, in order, in this interpreter, against the pipeline data directory.
+    data/manifest.json is refreshed once at the end when a stage ran.
+    Args:
+        force (iterable): Stage names to run even when fresh; 'all' forces every stage.
+        skip (iterable): Stage names to leave out, e.g. event_schedule for offline runs against session fixtures.
+        dry_run (bool): Only report which stages would run.
+    Returns:
+        dict: Stage name -> 'skipped', 'idle', 'fresh', 'stale' (dry run), 'ran' or 'incomplete' (ran but left an output missing).
+    """
+    force, skip = set(force), set(skip)
+    unknown_stages = (force | skip) - set(STAGE_NAMES) - {'all'}
+    if unknown_stages:
+        raise ValueError(f"Unknown pipeline stage(s): {', '.join(sorted(unknown_stages))}. Expected: {', '.join(STAGE_NAMES)}")
+
+    context = PipelineContext()
+    state   = load_state(context.data_dir)
+    results = {}
+    for pipeline_stage in STAGES:
+        if pipeline_stage.name in skip:
+            print(f"⏭️  {pipeline_stage.name} skipped")
+            results[pipeline_stage.name] = 'skipped'
+            continue
+        status, inputs = stage_status(pipeline_stage, context, state.get(pipeline_stage.name))
+        forced = 'all' in force or pipeline_stage.name in force
+        if status == 'idle' or (status == 'fresh' and not forced):
+            print(f"⏭️  {pipeline_stage.name} is {'up to date' if status == 'fresh' else 'waiting for a past race'}")
+            results[pipeline_stage.name] = status
+            continue
+        if dry_run:
+            print(f"🔸 {pipeline_stage.name} would run")
+            results[pipeline_stage.name] = 'stale'
+            continue
+
+        print(f"▶️  Running {pipeline_stage.name}")
+        with stage('pipeline_stage', profile=False, stage_name=pipeline_stage.name, forced=forced):
+            pipeline_stage.run(context)
+
+        # Later stages read what this one wrote, so drop the cached schedule reads
+        context = PipelineContext(context.data_dir, context.now)
+        outputs = _output_hashes(pipeline_stage.outputs(context), context.data_dir)
+        if outputs is None:
+            print(f"⚠️  {pipeline_stage.name} did not write all of its outputs; it will run again next time")
+            results[pipeline_stage.name] = 'incomplete'
+            continue
+
+        state[pipeline_stage.name] = {
+            'inputs_sha256': _inputs_sha256(pipeline_stage.inputs(context) or inputs),
+            'outputs': outputs,
+            'completed_at_utc': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        }
+        save_state(state, context.data_dir)
+        results[pipeline_stage.name] = 'ran'
+
+    # Hashing the whole data directory grows with its size, so a run that changed nothing leaves
+    # the manifest alone; the context only trusts it while the sessions files still match it
+    if any(status in ('ran', 'incomplete') for status in results.values()):
+        data_manifest.refresh_manifest(context.data_dir, context.now)
+    return results
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run the points pipeline, skipping stages whose outputs are already fresh.")
+    parser.add_argument('--force', action='append', default=[], choices=STAGE_NAMES + ['all'],
+                        help="Run a stage even when it is fresh. Repeat for several stages, or use 'all'.")
+    parser.add_argument('--skip', action='append', default=[], choices=STAGE_NAMES,
+                        help="Leave a stage out, e.g. event_schedule for offline runs against session fixtures.")
+    parser.add_argument('--dry-run', action='store_true', help="Only report which stages would run.")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    started = time.perf_counter()
+    with recorded_run('run_pipeline'):
+        results = run_pipeline(force=args.force, skip=args.skip, dry_run=args.dry_run)
+    ran = [name for name, status in results.items() if status in ('ran', 'incomplete', 'stale')]
+    print(f"✅ Pipeline {'checked' if args.dry_run else 'finished'} in {time.perf_counter() - started:.2f}s "
+          f"({('would run ' if args.dry_run else 'ran ') + ', '.join(ran) if ran else 'nothing to do'})")
+
+
+if __name__ == '__main__':
+    main()
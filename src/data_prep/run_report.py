@@ -0,0 +1,246 @@
+import datetime
+import json
+import logging
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+RUN_REPORT_PATH_ENV = 'F1_POINTS_RUN_REPORT_PATH'
+PROFILE_ENV = 'F1_POINTS_PROFILE'
+PROFILE_DIR_ENV = 'F1_POINTS_PROFILE_DIR'
+PROFILERS = ('cprofile', 'pyinstrument')
+
+logger = logging.getLogger(__name__)
+
+
+def _get_profile_dir():
+    return os.environ.get(PROFILE_DIR_ENV, os.path.join('.artifacts', 'profiles'))
+
+
+def _get_profiler_name():
+    profiler_name = os.environ.get(PROFILE_ENV, '').strip().lower()
+    if profiler_name and profiler_name not in PROFILERS:
+        raise ValueError(f"Unknown profiler '{profiler_name}' in {PROFILE_ENV}. Expected one of: {', '.join(PROFILERS)}")
+    return profiler_name or None
+
+
+def _peak_rss_bytes():
+    try:
+        import resource
+    except ImportError:
+        return None
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class _StageProfiler:
+    """One cProfile or pyinstrument session around a stage, dumped to the profile directory."""
+
+    def __init__(self, profiler_name):
+        self.profiler_name = profiler_name
+        if profiler_name == 'pyinstrument':
+            try:
+                from pyinstrument import Profiler
+            except ImportError as exc:
+                raise RuntimeError(
+                    "pyinstrument is not installed. Install it with `pip install pyinstrument` or set F1_POINTS_PROFILE=cprofile."
+                ) from exc
+            self.profiler = Profiler()
+        else:
+            import cProfile
+            self.profiler = cProfile.Profile()
+
+    def start(self):
+        try:
+            if self.profiler_name == 'pyinstrument':
+                self.profiler.start()
+            else:
+                self.profiler.enable()
+            return True
+        except (RuntimeError, ValueError) as exc:
+            # Another profiler is already active (e.g. an enclosing or concurrent stage)
+            logger.debug("Skipping stage profile: %s", exc)
+            return False
+
+    def stop_and_dump(self, path_stem):
+        os.makedirs(os.path.dirname(path_stem), exist_ok=True)
+        if self.profiler_name == 'pyinstrument':
+            self.profiler.stop()
+            path = f'{path_stem}.html'
+            with open(path, 'w', encoding='utf-8') as file:
+                file.write(self.profiler.output_html())
+        else:
+            self.profiler.disable()
+            path = f'{path_stem}.prof'
+            self.profiler.dump_stats(path)
+        return path
+
+
+class RunRecorder:
+    """
+    Collects per-stage wall time, CPU time and peak traced memory for one pipeline run.
+
+    Stages nest and may run on several threads at once (e.g. concurrent session
+    loads). CPU time is process CPU time while the stage was open, so concurrent
+    stages overlap. Peak memory is the highest traced allocation above the stage's
+    starting point, tracked with tracemalloc while the recorder is enabled.
+    """
+
+    def __init__(self):
+        self.enabled        = False
+        self.stages         = []
+        self.started_at     = None
+        self._lock          = threading.Lock()
+        self._open_stages   = []
+        self._local         = threading.local()
+
+    def enable(self):
+        self.enabled    = True
+        self.stages     = []
+        self.started_at = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def disable(self):
+        self.enabled = False
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def _fold_peak(self):
+        # Carry the traced peak into every open stage before resetting it for the next stage
+        _, peak = tracemalloc.get_traced_memory()
+        for open_stage in self._open_stages:
+            open_stage['_peak'] = max(open_stage['_peak'], peak)
+        return peak
+
+    @contextmanager
+    def stage(self, name, profile=True, **fields):
+        if not self.enabled:
+            yield None
+            return
+
+        parents = getattr(self._local, 'stack', [])
+        record  = {'name': name, **fields, 'parent': parents[-1]['name'] if parents else None,
+                   'thread': threading.current_thread().name, 'status': 'success'}
+        with self._lock:
+            self._fold_peak()
+            tracemalloc.reset_peak()
+            record['_start_memory'] = record['_peak'] = tracemalloc.get_traced_memory()[0]
+            self._open_stages.append(record)
+            self.stages.append(record)
+        self._local.stack = parents + [record]
+
+        # Profilers do not nest, so a stage inside a profiled stage on the same thread is only timed
+        profiler_name = _get_profiler_name() if profile and not getattr(self._local, 'profiling', False) else None
+        profiler      = _StageProfiler(profiler_name) if profiler_name else None
+        profiling     = profiler.start() if profiler else False
+        self._local.profiling = getattr(self._local, 'profiling', False) or profiling
+
+        started_wall = time.perf_counter()
+        started_cpu  = time.process_time()
+        try:
+            yield record
+        except BaseException as exc:
+            record['status'] = 'failed'
+            record['error']  = f"{type(exc).__name__}: {exc}"
+            raise
+        finally:
+            record['wall_seconds'] = round(time.perf_counter() - started_wall, 6)
+            record['cpu_seconds']  = round(time.process_time() - started_cpu, 6)
+            if profiling:
+                stage_index = self.stages.index(record)
+                record['profile_path'] = profiler.stop_and_dump(os.path.join(_get_profile_dir(), f'{stage_index:03d}_{name}'))
+                self._local.profiling = False
+            with self._lock:
+                self._fold_peak()
+                self._open_stages.remove(record)
+                record['peak_memory_bytes'] = record.pop('_peak') - record.pop('_start_memory')
+            self._local.stack = parents
+
+    def report(self, **fields):
+        """
+        Build the machine-readable run report.
+        Returns:
+            dict: Run metadata, every stage in start order, and per-stage-name totals.
+        """
+        totals = {}
+        for record in self.stages:
+            stage_totals = totals.setdefault(record['name'], {'count': 0, 'wall_seconds': 0.0, 'cpu_seconds': 0.0, 'peak_memory_bytes': 0})
+            stage_totals['count']             += 1
+            stage_totals['wall_seconds']      = round(stage_totals['wall_seconds'] + record.get('wall_seconds', 0.0), 6)
+            stage_totals['cpu_seconds']       = round(stage_totals['cpu_seconds'] + record.get('cpu_seconds', 0.0), 6)
+            stage_totals['peak_memory_bytes'] = max(stage_totals['peak_memory_bytes'], record.get('peak_memory_bytes', 0))
+        return {
+            **fields,
+            'run_started_at_utc': self.started_at,
+            'run_completed_at_utc': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            'peak_rss_bytes': _peak_rss_bytes(),
+            'stages': [{key: value for key, value in record.items() if not key.startswith('_')} for record in self.stages],
+            'totals': totals,
+        }
+
+
+_recorder = RunRecorder()
+
+
+def get_run_recorder():
+    return _recorder
+
+
+def stage(name, profile=True, **fields):
+    """
+    Record one pipeline stage. Usable as a context manager or a decorator:
+
+        with stage('session_load', session_type='Race'):
+            ...
+
+    Does nothing unless a run report is being recorded. With F1_POINTS_PROFILE set, the
+    stage is also profiled unless ``profile`` is False or an enclosing stage is profiled.
+    """
+    return _recorder.stage(name, profile=profile, **fields)
+
+
+def write_run_report(report_payload, report_path=None):
+    report_path = report_path or os.environ.get(RUN_REPORT_PATH_ENV)
+    if not report_path:
+        return None
+    try:
+        parent_dir = os.path.dirname(report_path)
+        if parent_dir:
+            os.makedirs(parent_dir, exist_ok=True)
+        with open(report_path, 'w', encoding='utf-8') as file:
+            json.dump(report_payload, file, ensure_ascii=False, indent=2, sort_keys=True, default=str)
+            file.write("\n")
+        print(f"🧾 Wrote run report to {report_path}")
+    except OSError as exc:
+        logger.warning("Failed to write points run report to %s: %s", report_path, exc)
+    return report_path
+
+
+@contextmanager
+def recorded_run(entry_point, report_path=None):
+    """
+    Record every stage of an entry point's run and write the JSON run report when it ends.
+    Args:
+        entry_point (str): Name of the script, stored in the report.
+        report_path (str): Report file. Default is F1_POINTS_RUN_REPORT_PATH; nothing is recorded when neither is set.
+    """
+    report_path = report_path or os.environ.get(RUN_REPORT_PATH_ENV)
+    if not report_path:
+        yield None
+        return
+
+    _recorder.enable()
+    status = 'started'
+    try:
+        with _recorder.stage('run', profile=False, entry_point=entry_point):
+            yield _recorder
+        status = 'success'
+    except BaseException:
+        status = 'failed'
+        raise
+    finally:
+        write_run_report(_recorder.report(entry_point=entry_point, status=status), report_path)
+        _recorder.disable()
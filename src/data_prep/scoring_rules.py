@@ -0,0 +1,358 @@
+import copy
+import json
+import os
+from functools import partial
+
+import numpy as np
+import pandas as pd
+
+from src.data_prep import functions
+from src.data_prep.run_report import stage
+
+
+SCORING_RULES_ENV = 'F1_POINTS_SCORING_RULES'
+
+DEFAULT_RULES = {
+    'pole_points': 10,
+    'teammate_points': {'Sprint': 5, 'Qualifying': 5, 'Race': 5},
+    'places_gained_multiplier': {'Sprint': 1, 'Race': 2},
+    'constructor_finishing_points': {'one_car': 2, 'both_cars': 5},
+}
+
+SEASON_DRIVER_COLUMNS = {
+    'Sprint': {'SessionPoints': 'SprintPoints', 'PlacesGainedPoints': 'PlacesGainedSprintPoints', 'TeammatePoints': 'TeammateSprintPoints'},
+    'Qualifying': {'PolePoints': 'PolePoints'},
+    'Race': {'SessionPoints': 'RacePoints', 'PlacesGainedPoints': 'PlacesGainedRacePoints', 'TeammatePoints': 'TeammateRacePoints', 'TeammateQualiPoints': 'TeammateQualiPoints'},
+}
+
+SEASON_CONSTRUCTOR_COLUMNS = {
+    session_type: {
+        'TotalPoints': f'Total{session_type}Points',
+        'PlacesGainedPoints': f'PlacesGained{session_type}Points',
+        'FinishingPoints': f'Constructor{session_type}FinishingPoints',
+        'ConstructorPoints': f'Constructor{session_type}Points',
+        'TotalConstructorPoints': f'TotalConstructor{session_type}Points',
+    }
+    for session_type in ('Sprint', 'Race')
+}
+
+
+class ScoringRuleSet:
+    """
+    Declarative scoring values for one fantasy league variant.
+
+    A rule set is built from a dict (or a JSON/YAML file with the same keys as
+    ``DEFAULT_RULES``; missing keys fall back to the defaults) and compiled once
+    into a ``CompiledScoringPlan``. The compiled plan is cached on the rule set, so
+    scoring every event of a season reuses the same plan.
+    """
+
+    def __init__(self, rules=None):
+        rules = rules or {}
+        unknown_keys = set(rules) - set(DEFAULT_RULES)
+        if unknown_keys:
+            raise ValueError(f"Unknown scoring rule(s): {', '.join(sorted(unknown_keys))}.")
+
+        merged_rules = copy.deepcopy(DEFAULT_RULES)
+        for key, value in rules.items():
+            if isinstance(merged_rules[key], dict):
+                if not isinstance(value, dict):
+                    raise ValueError(f"Scoring rule '{key}' must be a mapping, got {value!r}.")
+                unknown_entries = set(value) - set(merged_rules[key])
+                if unknown_entries:
+                    raise ValueError(f"Unknown entries for scoring rule '{key}': {', '.join(sorted(unknown_entries))}.")
+                merged_rules[key].update(value)
+            else:
+                merged_rules[key] = value
+
+        self.pole_points                  = merged_rules['pole_points']
+        self.teammate_points              = merged_rules['teammate_points']
+        self.places_gained_multiplier     = merged_rules['places_gained_multiplier']
+        self.constructor_finishing_points = merged_rules['constructor_finishing_points']
+        self._compiled_plan = None
+
+    @classmethod
+    def from_file(cls, path):
+        """
+        Load a rule set from a JSON or YAML file.
+        Args:
+            path (str): Path to a .json, .yaml or .yml file.
+        Returns:
+            ScoringRuleSet: The loaded rule set.
+        """
+        with open(path, 'r', encoding='utf-8') as file:
+            if path.endswith(('.yaml', '.yml')):
+                try:
+                    import yaml
+                except ImportError as exc:
+                    raise RuntimeError(
+                        "Loading YAML scoring rules requires PyYAML to be installed. "
+                        "Install pyyaml or provide the rules as JSON."
+                    ) from exc
+                rules = yaml.safe_load(file)
+            else:
+                rules = json.load(file)
+        return cls(rules)
+
+    def to_dict(self):
+        return {
+            'pole_points': self.pole_points,
+            'teammate_points': dict(self.teammate_points),
+            'places_gained_multiplier': dict(self.places_gained_multiplier),
+            'constructor_finishing_points': dict(self.constructor_finishing_points),
+        }
+
+    def __eq__(self, other):
+        return isinstance(other, ScoringRuleSet) and self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        return f"ScoringRuleSet({self.to_dict()!r})"
+
+    def compile(self):
+        """Compile the rule set into an evaluation plan, reusing the cached plan on later calls."""
+        if self._compiled_plan is None:
+            self._compiled_plan = CompiledScoringPlan(self)
+        return self._compiled_plan
+
+
+def _fill_pending_sessions(merged_driver_points, merged_constructor_points, driver_points_dfs, pending_sessions):
+    """Add zero columns for sessions not scored yet, so the event totals can be computed from the scored ones."""
+    if merged_constructor_points is None:
+        # Only Qualifying is in: every team that took part scores zero so far
+        team_ids = pd.concat([session_results['TeamId'] for session_results in driver_points_dfs.values()]).dropna().unique()
+        merged_constructor_points = pd.DataFrame({'TeamId': team_ids})
+    for session_type in pending_sessions:
+        for column in SEASON_DRIVER_COLUMNS[session_type].values():
+            merged_driver_points[column] = 0.0
+        for column in SEASON_CONSTRUCTOR_COLUMNS.get(session_type, {}).values():
+            merged_constructor_points[column] = 0.0
+    return merged_driver_points, merged_constructor_points
+
+
+def _copy_session_points(session_results, session_type):
+    session_results[f"{session_type}Points"] = session_results["Points"]
+    return session_results
+
+
+class CompiledScoringPlan:
+    """
+    Ordered, pre-bound scoring steps for every supported session type.
+
+    Each step is a vectorized column operation over a session results frame, bound
+    to the rule set's values once at compile time.
+    """
+
+    def __init__(self, rule_set):
+        self.rule_set = rule_set
+        teammate_points = rule_set.teammate_points
+        multipliers     = rule_set.places_gained_multiplier
+        finishing       = rule_set.constructor_finishing_points
+
+        self.driver_steps = {
+            'Sprint': (
+                partial(_copy_session_points, session_type='Sprint'),
+                partial(functions.calculate_places_gained_points, session_type='Sprint', multiplier=multipliers['Sprint']),
+                partial(functions.calculate_teammate_race_points, session_type='Sprint', points=teammate_points['Sprint']),
+            ),
+            'Qualifying': (
+                partial(functions.calculate_pole_points, points=rule_set.pole_points),
+            ),
+            'Race': (
+                partial(_copy_session_points, session_type='Race'),
+                partial(functions.calculate_places_gained_points, session_type='Race', multiplier=multipliers['Race']),
+                partial(functions.calculate_teammate_race_points, session_type='Race', points=teammate_points['Race']),
+                # This adds points for beating your teammate in qualifying
+                partial(functions.calculate_teammate_quali_points, points=teammate_points['Qualifying']),
+            ),
+        }
+        self.constructor_steps = {
+            session_type: partial(
+                functions.calculate_constructor_points,
+                session_type=session_type,
+                one_car_points=finishing['one_car'],
+                both_cars_points=finishing['both_cars'],
+            )
+            for session_type in ('Sprint', 'Race')
+        }
+
+    def score_driver_session(self, session_results, session_type):
+        if session_type not in self.driver_steps:
+            raise ValueError(f"Session type '{session_type}' is not supported for point calculation in session provided.")
+        for step in self.driver_steps[session_type]:
+            session_results = step(session_results)
+        return session_results
+
+    def score_constructor_session(self, session_results, session_type):
+        if session_type not in self.constructor_steps:
+            raise ValueError(f"Session type '{session_type}' is not supported for constructor point calculation.")
+        return self.constructor_steps[session_type](session_results)
+
+    def score_session(self, session_results, session_type):
+        """
+        Score one session on its own, so sessions can be scored as their results arrive.
+        Args:
+            session_results (pd.DataFrame): The session's results.
+            session_type (str): 'Sprint', 'Qualifying' or 'Race'.
+        Returns:
+            tuple: The driver points DataFrame, and the constructor points DataFrame (None for Qualifying).
+        """
+        with stage('score_driver_session', session_type=session_type):
+            driver_points = self.score_driver_session(session_results, session_type)
+        constructor_points = None
+        if session_type in self.constructor_steps:
+            # Constructor scoring reads the places gained columns added by the driver steps
+            with stage('score_constructor_session', session_type=session_type):
+                constructor_points = self.score_constructor_session(driver_points, session_type)
+        return driver_points, constructor_points
+
+    def merge_sessions(self, driver_points_dfs, constructor_points_dfs, event_format, allow_pending=False):
+        """
+        Merge scored sessions into an event's slim points.
+        Args:
+            driver_points_dfs (dict): Driver points DataFrames from ``score_session``, keyed by session type.
+            constructor_points_dfs (dict): Constructor points DataFrames from ``score_session``, keyed by session type.
+            event_format (str): The type of event. Options include 'sprint_qualifying' or 'conventional'.
+            allow_pending (bool): Allow sessions of the event to be missing. Their columns are NaN and the
+                totals cover the scored sessions only.
+        Returns:
+            tuple: Slim driver and constructor points DataFrames.
+        """
+        session_types    = functions.get_session_types_list(event_format)
+        pending_sessions = [session_type for session_type in session_types if session_type not in driver_points_dfs]
+        if pending_sessions and not allow_pending:
+            raise ValueError(f"Sessions not scored yet: {', '.join(pending_sessions)}. Pass allow_pending=True for provisional points.")
+        if len(pending_sessions) == len(session_types):
+            raise ValueError("No scored sessions to merge.")
+
+        with stage('merge', event_format=event_format, pending_sessions=pending_sessions):
+            merged_driver_points        = functions.merge_points_dataframes(driver_points_dfs, merge_key="DriverId")
+            merged_constructor_points   = functions.merge_points_dataframes(constructor_points_dfs, merge_key="TeamId")
+            if pending_sessions:
+                merged_driver_points, merged_constructor_points = _fill_pending_sessions(
+                    merged_driver_points, merged_constructor_points, driver_points_dfs, pending_sessions)
+
+            driver_points_df            = functions.calculate_final_driver_points(merged_driver_points, event_format)
+            driver_points_df_slim       = functions.slim_driver_points_df(driver_points_df, event_format=event_format)
+            constructor_points_df_slim  = functions.slim_constructor_points_df(merged_constructor_points, event_format=event_format)
+
+        # Sessions still to come read as NaN rather than as zero points
+        for session_type in pending_sessions:
+            driver_points_df_slim[list(SEASON_DRIVER_COLUMNS[session_type].values())] = np.nan
+            if session_type in SEASON_CONSTRUCTOR_COLUMNS:
+                constructor_points_df_slim[list(SEASON_CONSTRUCTOR_COLUMNS[session_type].values())] = np.nan
+        return driver_points_df_slim, constructor_points_df_slim
+
+    def score_event(self, session_dfs, event_format):
+        """
+        Score every session of one event.
+        Args:
+            session_dfs (dict): Session results DataFrames keyed by session type.
+            event_format (str): The type of event. Options include 'sprint_qualifying' or 'conventional'.
+        Returns:
+            tuple: Slim driver and constructor points DataFrames.
+        """
+        driver_points_dfs       = {}
+        constructor_points_dfs  = {}
+
+        for session_type in functions.get_session_types_list(event_format):
+            driver_points, constructor_points = self.score_session(session_dfs[session_type], session_type)
+            driver_points_dfs[session_type] = driver_points
+            if constructor_points is not None:
+                constructor_points_dfs[session_type] = constructor_points
+        return self.merge_sessions(driver_points_dfs, constructor_points_dfs, event_format)
+
+    def score_season(self, season_results):
+        """
+        Score many events at once from one stacked session results frame.
+        Args:
+            season_results (pd.DataFrame): Session results keyed by RoundNumber, SessionType and DriverId,
+                with EventName, EventFormat and the SESSION_RESULT_COLUMNS of every session.
+        Returns:
+            tuple: Long driver and constructor points DataFrames with one row per (RoundNumber, DriverId)
+                and (RoundNumber, TeamId). Sprint columns are NaN for conventional events.
+
+        Every rule is applied as a column operation or a grouped aggregation over the whole
+        frame, so the cost does not grow with a Python loop over events.
+        """
+        rules           = self.rule_set
+        results         = season_results.reset_index(drop=True).copy()
+        session_type    = results['SessionType']
+        is_race_session = session_type.isin(list(self.constructor_steps))
+        team_keys       = ['RoundNumber', 'SessionType', 'TeamId']
+
+        teammate_positions  = functions.get_teammate_positions(results, 'Position', team_keys)
+        teammate_grid       = functions.get_teammate_positions(results, 'GridPosition', team_keys)
+        teammate_points     = session_type.map(rules.teammate_points)
+
+        results['SessionPoints']        = results['Points'].where(is_race_session)
+        results['PlacesGainedFloor']    = (results['GridPosition'] - results['Position']).clip(lower=0)
+        results['PlacesGainedPoints']   = results['PlacesGainedFloor'] * session_type.map(rules.places_gained_multiplier)
+        results['TeammatePoints']       = np.where(is_race_session & (results['Position'] < teammate_positions), teammate_points, 0)
+        results['PolePoints']           = np.where((session_type == 'Qualifying') & (results['Position'] == 1.0), rules.pole_points, 0)
+        results['TeammateQualiPoints']  = np.where((session_type == 'Race') & (results['GridPosition'] < teammate_grid), rules.teammate_points['Qualifying'], 0)
+
+        events = results.drop_duplicates('RoundNumber').set_index('RoundNumber')[['EventName', 'EventFormat']]
+        driver_points       = self._pivot_sessions(results, 'DriverId', SEASON_DRIVER_COLUMNS, events)
+        constructor_points  = self._pivot_sessions(self._aggregate_teams(results[is_race_session]), 'TeamId', SEASON_CONSTRUCTOR_COLUMNS, events)
+
+        driver_points['TotalSprintRacePoints']      = driver_points['SprintPoints'] + driver_points['PlacesGainedSprintPoints'] + driver_points['TeammateSprintPoints']
+        driver_points['TotalRaceQualifyingPoints']  = driver_points['PolePoints'] + driver_points['TeammateQualiPoints']
+        driver_points['TotalRacePoints']            = driver_points['RacePoints'] + driver_points['PlacesGainedRacePoints'] + driver_points['TeammateRacePoints']
+        driver_points['TotalDriverPoints']          = (driver_points['TotalSprintRacePoints'].fillna(0) +
+                                                       driver_points['TotalRaceQualifyingPoints'] +
+                                                       driver_points['TotalRacePoints'])
+        constructor_points['TotalConstructorPoints'] = (constructor_points['TotalConstructorSprintPoints'].fillna(0) +
+                                                        constructor_points['TotalConstructorRacePoints'])
+        return driver_points, constructor_points
+
+    def _aggregate_teams(self, race_results):
+        finishing = self.rule_set.constructor_finishing_points
+        return functions.aggregate_team_points(race_results, 'PlacesGainedFloor',
+                                               group_columns=['RoundNumber', 'SessionType', 'TeamId'],
+                                               one_car_points=finishing['one_car'], both_cars_points=finishing['both_cars'],
+                                               sort=False)
+
+    @staticmethod
+    def _pivot_sessions(results, entity_key, session_columns, events):
+        """Spread per-session columns into one wide row per (RoundNumber, entity_key)."""
+        session_frames = [
+            results.loc[results['SessionType'] == session_type, ['RoundNumber', entity_key] + list(columns)]
+                   .rename(columns=columns)
+                   .set_index(['RoundNumber', entity_key])
+            for session_type, columns in session_columns.items()
+        ]
+        wide = pd.concat(session_frames, axis=1, join='outer').sort_index().reset_index()
+        wide = wide.join(events, on='RoundNumber')
+
+        # Entities missing from one session of an event score 0 there; sessions the event does not have stay NaN
+        is_sprint_event = wide['EventFormat'] == 'sprint_qualifying'
+        for session_type, columns in session_columns.items():
+            for column in columns.values():
+                wide[column] = wide[column].fillna(0)
+                if session_type == 'Sprint':
+                    wide[column] = wide[column].where(is_sprint_event)
+        return wide
+
+
+DEFAULT_SCORING_RULES = ScoringRuleSet()
+
+_loaded_rule_sets = {}
+
+
+def load_scoring_rules(path=None):
+    """
+    Get the scoring rule set for a pipeline run.
+    Args:
+        path (str): Optional rules file. Defaults to the F1_POINTS_SCORING_RULES environment variable.
+    Returns:
+        ScoringRuleSet: The default rules when no file is configured, otherwise the file's rules.
+            Loaded files are cached by path and modification time so their compiled plan is reused.
+    """
+    path = path or os.environ.get(SCORING_RULES_ENV)
+    if not path:
+        return DEFAULT_SCORING_RULES
+
+    cache_key = (os.path.abspath(path), os.path.getmtime(path))
+    if cache_key not in _loaded_rule_sets:
+        _loaded_rule_sets[cache_key] = ScoringRuleSet.from_file(path)
+    return _loaded_rule_sets[cache_key]
@@ -0,0 +1,161 @@
+import argparse
+import datetime
+import json
+import os
+import sys
+
+import pandas as pd
+
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+from src.data_prep import functions
+from src.data_prep.combine_event_points import ENTITY_TYPES, find_event_files, read_event_points
+from src.data_prep.data_manifest import refresh_manifest
+from src.data_prep.entity_registry import load_entity_registry, write_entity_registry
+from src.data_prep.points_schema import read_points_csv
+from src.data_prep.price_alignment import (align_round_prices, current_prices_season, load_current_prices, load_price_history,
+                                           long_points, value_table)
+from src.data_prep.run_report import recorded_run, stage
+from src.data_prep.season_schedule import get_data_dir, load_season_schedule
+
+BUNDLE_FORMAT_VERSION = 3
+
+
+def get_bundle_path(year, data_dir=None):
+    return os.path.join(data_dir or get_data_dir(), f'season_bundle_{year}.json')
+
+
+def to_table(points_df):
+    """Column-oriented JSON table: {'columns': [...], 'data': [[...], ...]}, with NaN as null."""
+    return json.loads(pd.DataFrame(points_df).to_json(orient='split', index=False))
+
+
+def load_race_schedule(year, data_dir=None):
+    """One row per race weekend of the season: RoundNumber, EventName, EventDate (YYYY-MM-DD) and EventFormat."""
+    races = load_season_schedule(year, data_dir).races
+    races = races[races['RoundNumber'] > 0].sort_values('RoundNumber')
+    return pd.DataFrame({
+        'RoundNumber': races['RoundNumber'].astype(int),
+        'EventName': races['EventName'],
+        'EventDate': races['EventDate'].astype(str).str.slice(0, 10),
+        'EventFormat': races['EventFormat'],
+    })
+
+
+def read_scored_rounds(year, data_dir=None, schedule=None):
+    """
+    Read the slim driver and constructor points of every scored round of a season.
+    Args:
+        year (int): The season year.
+        data_dir (str): Optional data directory. Default is the pipeline data directory.
+        schedule (pd.DataFrame): Optional ``load_race_schedule`` output, when the caller already has it.
+    Returns:
+        list: {'RoundNumber', 'EventName', 'EventDate', 'points': {entity type: points DataFrame}} per
+            scored round, in round order.
+    """
+    data_dir = data_dir or get_data_dir()
+    schedule = load_race_schedule(year, data_dir) if schedule is None else schedule
+    event_files = find_event_files(year, list(schedule[['RoundNumber', 'EventName']].itertuples(index=False, name=None)), data_dir,
+                                   verbose=False)
+    scored_rounds = []
+    for race in schedule.itertuples(index=False):
+        if race.EventName not in event_files['driver']:
+            continue
+        scored_rounds.append({
+            'RoundNumber': int(race.RoundNumber),
+            'EventName': race.EventName,
+            'EventDate': race.EventDate,
+            'points': {entity_type: read_event_points(entity_type, race.EventName, event_files[entity_type][race.EventName], verbose=False)
+                       for entity_type in ENTITY_TYPES if race.EventName in event_files[entity_type]},
+        })
+    return scored_rounds
+
+
+def build_season_bundle(year, data_dir=None):
+    """
+    Collect everything index.html shows for one season into one JSON-ready dict.
+    Args:
+        year (int): The season year.
+        data_dir (str): Optional data directory. Default is the pipeline data directory.
+    Returns:
+        dict: The schedule (one row per race weekend), the per-round driver and constructor points of
+            every scored round, the _most_recent points and whether they are provisional (a weekend
+            scored before its Race, see provisional_points), each round's points priced as of its event date
+            (``align_round_prices``) and the _most_recent points at current prices (``value_table``; None unless
+            the current prices were scraped during this season).
+            Frames are column-oriented tables (``to_table``).
+    """
+    data_dir = data_dir or get_data_dir()
+    schedule = load_race_schedule(year, data_dir)
+    scored_rounds = read_scored_rounds(year, data_dir, schedule)
+    rounds = [{'RoundNumber': scored_round['RoundNumber'], 'EventName': scored_round['EventName'], 'EventDate': scored_round['EventDate'],
+               **{entity_type: to_table(points_df) for entity_type, points_df in scored_round['points'].items()}}
+              for scored_round in scored_rounds]
+    round_points = [long_points(scored_round['points']).assign(RoundNumber=scored_round['RoundNumber'], EventDate=scored_round['EventDate'])
+                    for scored_round in scored_rounds]
+
+    most_recent = {}
+    for entity_type in ENTITY_TYPES:
+        most_recent_path = os.path.join(data_dir, f'{entity_type}_points_{year}_most_recent.csv')
+        if os.path.exists(most_recent_path):
+            most_recent[entity_type] = read_points_csv(most_recent_path)
+
+    registry = load_entity_registry(data_dir)
+    price_history = load_price_history(data_dir, registry)
+    # Price files are not split by season; keep the snapshots taken during this one
+    price_history = price_history[price_history['SnapshotDate'].dt.year == int(year)]
+    aligned_prices = align_round_prices(pd.concat(round_points, ignore_index=True), price_history, registry) if round_points else None
+    # Current prices only say something about the season they were scraped in
+    current_value = None
+    if most_recent and current_prices_season(data_dir) == int(year):
+        current_value = value_table(long_points(most_recent), load_current_prices(data_dir, registry), registry)
+
+    return {
+        'format_version': BUNDLE_FORMAT_VERSION,
+        'year': int(year),
+        'generated_at_utc': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        'schedule': to_table(schedule),
+        'rounds': rounds,
+        'most_recent': {entity_type: to_table(points_df) for entity_type, points_df in most_recent.items()},
+        'most_recent_provisional': {entity_type: bool('Provisional' in points_df.columns and points_df['Provisional'].fillna(False).astype(bool).any())
+                                    for entity_type, points_df in most_recent.items()},
+        'prices': {
+            'by_round': None if aligned_prices is None else to_table(aligned_prices),
+            'value': None if current_value is None else to_table(current_value),
+        },
+    }
+
+
+def write_season_bundle(year, data_dir=None):
+    """Build and write data/season_bundle_<year>.json (compact JSON, written atomically)."""
+    with stage('season_bundle', year=int(year)):
+        bundle = build_season_bundle(year, data_dir)
+        bundle_path = get_bundle_path(year, data_dir)
+        temp_path = f'{bundle_path}.{os.getpid()}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump(bundle, file, ensure_ascii=False, separators=(',', ':'))
+        os.replace(temp_path, bundle_path)
+    priced_rows = len(bundle['prices']['by_round']['data']) if bundle['prices']['by_round'] else 0
+    print(f"📦 Wrote season bundle with {len(bundle['rounds'])} rounds and {priced_rows} priced round entries "
+          f"to {bundle_path} ({os.path.getsize(bundle_path) / 1024:.1f} KB)")
+    return bundle_path
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Write the pre-aggregated season bundle index.html loads.")
+    parser.add_argument('--years', type=int, nargs='+', default=None,
+                        help="Seasons to export. Default is the latest season with past races.")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    with recorded_run('season_bundle'):
+        write_entity_registry()
+        for year in args.years or [functions.resolve_season_year(require_past_races=True)]:
+            write_season_bundle(year)
+        refresh_manifest()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,166 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from src.data_prep.data_paths import DATA_DIR, DATA_DIR_ENV, get_data_dir, get_sessions_path
+
+
+def _to_utc_datetime64(times):
+    """Read datetimes as UTC wall-clock times, matching ``today.replace(tzinfo=utc)``."""
+    times = pd.DatetimeIndex(pd.to_datetime(times))
+    if times.tz is not None:
+        times = times.tz_localize(None)
+    return times.to_numpy(dtype='datetime64[ns]')
+
+
+class SessionTimeIndex:
+    """
+    Pre-sorted per-session-type timestamp index over a sessions frame.
+
+    Answers "latest session of type X before time t" with ``np.searchsorted`` instead
+    of re-parsing and masking the whole frame, for one ``t`` or many at once.
+    """
+
+    def __init__(self, sessions):
+        self.sessions = sessions
+
+        parsed = sessions.copy()
+        parsed['SessionDateUtc'] = pd.to_datetime(parsed['SessionDateUtc'], errors='coerce', utc=True)
+        parsed = parsed.dropna(subset=['SessionDateUtc'])
+
+        self._by_session_type = {}
+        for session_type, session_rows in parsed.groupby('SessionName', sort=False):
+            dates = session_rows['SessionDateUtc'].dt.tz_convert(None).to_numpy(dtype='datetime64[ns]')
+            # Ties keep the earliest row last in the order, mirroring idxmax() picking the first maximum
+            order = np.lexsort((-np.arange(len(session_rows)), dates))
+            self._by_session_type[session_type] = (session_rows.iloc[order], dates[order])
+        self._empty = parsed.head(0)
+
+    def latest_before(self, session_type, today):
+        """Return a one-row frame with the latest ``session_type`` session before ``today`` (empty if none)."""
+        session_rows = self._sessions_for(session_type)
+        position     = self._positions_before(session_type, [today])[0]
+        if position < 0:
+            return session_rows.head(0).copy()
+        return session_rows.iloc[[position]]
+
+    def latest_before_many(self, session_type, times):
+        """
+        Return the latest ``session_type`` session before each of ``times``.
+        Returns:
+            pd.DataFrame: One row per query time that has an earlier session, indexed by the query time (AsOfUtc).
+        """
+        session_rows = self._sessions_for(session_type)
+        positions    = self._positions_before(session_type, times)
+        found        = positions >= 0
+
+        latest = session_rows.iloc[positions[found]].copy()
+        latest.index = pd.DatetimeIndex(_to_utc_datetime64(times)[found], name='AsOfUtc').tz_localize('UTC')
+        return latest
+
+    def _sessions_for(self, session_type):
+        return self._by_session_type.get(session_type, (self._empty, None))[0]
+
+    def _positions_before(self, session_type, times):
+        if session_type not in self._by_session_type:
+            return np.full(len(times), -1)
+        _, dates = self._by_session_type[session_type]
+        return np.searchsorted(dates, _to_utc_datetime64(times), side='left') - 1
+
+
+def _first_index_by(df, column):
+    first_rows = df.drop_duplicates(column)
+    return dict(zip(first_rows[column], first_rows.index))
+
+
+class SeasonSchedule:
+    """
+    Parsed and pre-indexed ``sessions_<year>.csv``.
+
+    The sessions file is parsed once; race sessions are indexed by EventName and
+    RoundNumber for O(1) lookups, and by end-of-race-day UTC timestamp (sorted) so
+    "which races happened before t" is a binary search.
+    """
+
+    def __init__(self, year, sessions_df):
+        self.year     = year
+        self.sessions = sessions_df
+
+        races_df = sessions_df[sessions_df['SessionName'] == 'Race'].copy()
+        # A race counts as past from the end of its event day (23:59:59.999999 UTC)
+        races_df['EventDateUtc'] = pd.to_datetime(races_df['EventDate'], errors='coerce', utc=True)
+        races_df['EventDateUtc'] = races_df['EventDateUtc'].dt.normalize() + pd.Timedelta(days=1) - pd.Timedelta(microseconds=1)
+        self.races = races_df
+
+        dated_races = races_df.dropna(subset=['EventDateUtc']).sort_values('EventDateUtc', kind='stable')
+        self._races_by_date       = dated_races
+        self._race_end_dates      = dated_races['EventDateUtc'].dt.tz_convert(None).to_numpy(dtype='datetime64[ns]')
+        self._race_index_by_event = _first_index_by(races_df, 'EventName')
+        self._race_index_by_round = _first_index_by(races_df, 'RoundNumber')
+        self._session_time_index  = None
+
+    @property
+    def session_time_index(self):
+        """SessionTimeIndex over this season's sessions, built on first use."""
+        if self._session_time_index is None:
+            self._session_time_index = SessionTimeIndex(self.sessions)
+        return self._session_time_index
+
+    @classmethod
+    def from_csv(cls, year, path=None):
+        return cls(year, pd.read_csv(path or get_sessions_path(year)))
+
+    def _count_races_before(self, today):
+        today_utc = pd.Timestamp(today)
+        today_utc = today_utc.tz_localize('UTC') if today_utc.tzinfo is None else today_utc.tz_convert('UTC')
+        return int(np.searchsorted(self._race_end_dates, today_utc.tz_localize(None).to_datetime64(), side='left'))
+
+    def has_past_races(self, today):
+        return self._count_races_before(today) > 0
+
+    def past_race_event_names(self, today):
+        """Return the unique names of race events finished before ``today``, in schedule order."""
+        past_races = self._races_by_date.iloc[:self._count_races_before(today)]
+        return self.races.loc[self.races.index.isin(past_races.index), 'EventName'].unique()
+
+    def get_race_by_event_name(self, event_name):
+        race_index = self._race_index_by_event.get(event_name)
+        return None if race_index is None else self.races.loc[race_index]
+
+    def get_race_by_round(self, round_number):
+        race_index = self._race_index_by_round.get(round_number)
+        return None if race_index is None else self.races.loc[race_index]
+
+    def get_round_number(self, event_name):
+        race = self.get_race_by_event_name(event_name)
+        if race is None:
+            raise ValueError(f"Could not extract round number from event name: {event_name}")
+        return race['RoundNumber']
+
+
+_schedule_cache = {}
+
+
+def load_season_schedule(year, data_dir=None):
+    """
+    Get the parsed schedule for a season, cached per process.
+    Args:
+        year (int): The season year.
+        data_dir (str): Optional data directory. Default is the repository data/ directory.
+    Returns:
+        SeasonSchedule: The cached schedule, re-parsed only when the sessions file's mtime or size changes.
+    """
+    path = os.path.abspath(get_sessions_path(year, data_dir))
+    stat = os.stat(path)
+    file_version = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _schedule_cache.get(path)
+    if cached is None or cached[0] != file_version:
+        cached = (file_version, SeasonSchedule.from_csv(year, path))
+        _schedule_cache[path] = cached
+    return cached[1]
+
+
+def clear_schedule_cache():
+    _schedule_cache.clear()
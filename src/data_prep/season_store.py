@@ -0,0 +1,115 @@
+import argparse
+import glob
+import os
+import re
+
+import pandas as pd
+
+from src.data_prep.data_paths import ENTITY_TYPES, EXPORT_CSV_ENV, csv_export_enabled, get_season_store_dir, get_season_store_path
+from src.data_prep.points_schema import apply_points_schema
+from src.data_prep.season_schedule import get_data_dir
+
+_ROUND_FILE_PATTERN = re.compile(r'round_(\d+)\.parquet$')
+
+
+def _to_store_types(points_df, event_round):
+    """Type a slim points frame for the store with its round as a column."""
+    return apply_points_schema(points_df.assign(RoundNumber=int(event_round)))
+
+
+class SeasonPointsStore:
+    """
+    Columnar store of scored event points, one Parquet dataset per season.
+
+    The dataset is partitioned by entity type and round
+    (``{year}/{entity_type}/round_{NN}.parquet``), so rescoring one event rewrites
+    one small file and reading a season is a handful of typed column reads instead
+    of parsing every per-event CSV again.
+    """
+
+    def __init__(self, root=None):
+        self.root = root or get_season_store_dir()
+
+    def path_for(self, entity_type, year, event_round):
+        if entity_type not in ENTITY_TYPES:
+            raise ValueError(f"Unknown entity type '{entity_type}'. Expected one of: {', '.join(ENTITY_TYPES)}")
+        return get_season_store_path(entity_type, year, event_round, self.root)
+
+    def rounds(self, entity_type, year):
+        """Return the rounds stored for a season, in order."""
+        paths = glob.glob(os.path.join(self.root, str(year), entity_type, 'round_*.parquet'))
+        return sorted(int(_ROUND_FILE_PATTERN.search(path).group(1)) for path in paths if _ROUND_FILE_PATTERN.search(path))
+
+    def write_event(self, entity_type, year, event_round, points_df):
+        """Store one event's slim points for an entity type, replacing any earlier version of that round."""
+        path = self.path_for(entity_type, year, event_round)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # Write then rename so readers never see a partial round file
+        temp_path = f'{path}.{os.getpid()}.tmp'
+        _to_store_types(points_df, event_round).to_parquet(temp_path, index=False)
+        os.replace(temp_path, path)
+        return path
+
+    def read_event(self, entity_type, year, event_round):
+        """Return one stored round, or None when it is not in the store."""
+        path = self.path_for(entity_type, year, event_round)
+        if not os.path.exists(path):
+            return None
+        return pd.read_parquet(path)
+
+    def read_season(self, entity_type, year, rounds=None):
+        """
+        Read the stored rounds of a season as one frame.
+        Args:
+            entity_type (str): 'driver' or 'constructor'.
+            year (int): The season year.
+            rounds (list): Optional rounds to read. Default is every stored round.
+        Returns:
+            pd.DataFrame: The rounds concatenated in round order (empty when none are stored).
+        """
+        frames = [self.read_event(entity_type, year, event_round) for event_round in sorted(rounds or self.rounds(entity_type, year))]
+        frames = [frame for frame in frames if frame is not None and not frame.empty]
+        if not frames:
+            return pd.DataFrame()
+        # Categories differ between rounds and sprint columns are missing on conventional weekends,
+        # so concat widens some dtypes; restore the compact schema
+        return apply_points_schema(pd.concat(frames, ignore_index=True))
+
+    def import_csv(self, entity_type, year, event_round, csv_path):
+        """Load a legacy per-event CSV into the store."""
+        return self.write_event(entity_type, year, event_round, pd.read_csv(csv_path))
+
+
+def import_event_csvs(year, store=None, data_dir=None):
+    """
+    Import every per-event points CSV of a season into the season store.
+    Returns:
+        int: Number of files imported.
+    """
+    store = store or SeasonPointsStore()
+    imported = 0
+    for entity_type in ENTITY_TYPES:
+        pattern = re.compile(rf'^{entity_type}_points_{year}_(\d+)_.+\.csv$')
+        for file_name in sorted(os.listdir(data_dir or get_data_dir())):
+            match = pattern.match(file_name)
+            if match is None:
+                continue
+            store.import_csv(entity_type, year, int(match.group(1)), os.path.join(data_dir or get_data_dir(), file_name))
+            imported += 1
+    return imported
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import per-event points CSVs into the columnar season store.")
+    parser.add_argument('--years', type=int, nargs='+', required=True, help="Season years to import.")
+    args = parser.parse_args(argv)
+
+    store = SeasonPointsStore()
+    for year in args.years:
+        imported = import_event_csvs(year, store)
+        print(f"📦 Imported {imported} event point files for {year} into {store.root}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,201 @@
+import argparse
+import datetime
+import os
+import re
+import sys
+import time
+import unicodedata
+import zlib
+
+import numpy as np
+import pandas as pd
+
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+from src.data_prep.functions import PROJECT_ROOT, SessionProvider
+from src.data_prep.season_schedule import get_data_dir, get_sessions_path
+from src.data_prep.synthetic_season import generate_season, generate_session_results
+
+FIXTURE_DIR_ENV = 'F1_POINTS_FIXTURE_DIR'
+FIXTURE_LATENCY_ENV = 'F1_POINTS_FIXTURE_LATENCY_SECONDS'
+
+
+def get_fixture_dir():
+    """Get the session fixture directory (F1_POINTS_FIXTURE_DIR, or session_fixtures under the cache dir)."""
+    return os.environ.get(
+        FIXTURE_DIR_ENV,
+        os.path.join(os.environ.get('F1_POINTS_CACHE_DIR', os.path.join(PROJECT_ROOT, '.cache')), 'session_fixtures')
+    )
+
+
+def slugify(name):
+    """ASCII file-name slug, e.g. 'São Paulo Grand Prix' -> 'sao_paulo_grand_prix'."""
+    ascii_name = unicodedata.normalize('NFKD', str(name)).encode('ascii', 'ignore').decode('ascii')
+    return re.sub(r'[^0-9a-z]+', '_', ascii_name.lower()).strip('_')
+
+
+class FixtureSessionProvider(SessionProvider):
+    """
+    Replays recorded ``session.results`` frames from disk.
+
+    Fixtures live at ``{root}/{year}/{event_slug}/{session_slug}.parquet``. An optional
+    fixed latency per load stands in for the network so concurrency and throughput can
+    be measured with deterministic timings. Missing fixtures raise ValueError, like a
+    FastF1 session that has no data yet.
+    """
+
+    name = 'fixture'
+    cacheable = False
+
+    def __init__(self, root=None, latency_seconds=None):
+        self.root = root or get_fixture_dir()
+        if latency_seconds is None:
+            latency_seconds = float(os.environ.get(FIXTURE_LATENCY_ENV, '0'))
+        self.latency_seconds = latency_seconds
+
+    def path_for(self, year, event_name, session_type):
+        return os.path.join(self.root, str(year), slugify(event_name), f'{slugify(session_type)}.parquet')
+
+    def load(self, year, event_name, session_type):
+        path = self.path_for(year, event_name, session_type)
+        if not os.path.exists(path):
+            raise ValueError(f"No recorded {session_type} session for {event_name} ({year}) at {path}")
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+        return pd.read_parquet(path)
+
+    def record(self, year, event_name, session_type, session_results):
+        """Save one session's results as a fixture."""
+        path = self.path_for(year, event_name, session_type)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f'{path}.{os.getpid()}.tmp'
+        pd.DataFrame(session_results).to_parquet(temp_path)
+        os.replace(temp_path, path)
+        return path
+
+
+class RecordingSessionProvider(SessionProvider):
+    """Loads from another provider (normally FastF1) and records every session it returns as a fixture."""
+
+    name = 'record'
+
+    def __init__(self, provider, fixtures):
+        self.provider = provider
+        self.fixtures = fixtures
+        self.cacheable = provider.cacheable
+
+    def load(self, year, event_name, session_type):
+        session_results = self.provider.load(year, event_name, session_type)
+        self.fixtures.record(year, event_name, session_type, session_results)
+        return session_results
+
+
+class SyntheticSessionProvider(SessionProvider):
+    """
+    Generates session results on the fly, without touching disk.
+
+    Each (year, event, session) gets its own seed, so repeated loads return the same
+    frame and any schedule can be scored at any grid size.
+    """
+
+    name = 'synthetic'
+    cacheable = False
+
+    def __init__(self, n_teams=10, drivers_per_team=2, seed=0, latency_seconds=0.0):
+        self.n_teams = n_teams
+        self.drivers_per_team = drivers_per_team
+        self.seed = seed
+        self.latency_seconds = latency_seconds
+
+    def load(self, year, event_name, session_type):
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+        session_seed = zlib.crc32(f'{self.seed}|{year}|{event_name}|{session_type}'.encode('utf-8'))
+        return generate_session_results(session_type, self.n_teams, self.drivers_per_team, rng=np.random.default_rng(session_seed))
+
+
+def build_schedule(year, events, first_race_date):
+    """
+    Build a sessions_<year>.csv frame for generated events, one race weekend per week.
+    Args:
+        year (int): The season year.
+        events (list): Events from ``generate_season``.
+        first_race_date (datetime.date): Race day of round 1.
+    """
+    rows = []
+    for event in events:
+        race_date = first_race_date + datetime.timedelta(weeks=event['RoundNumber'] - 1)
+        session_times = {
+            'Sprint': (race_date - datetime.timedelta(days=1), 11),
+            'Qualifying': (race_date - datetime.timedelta(days=1), 15),
+            'Race': (race_date, 14),
+        }
+        for session_number, session_type in enumerate(event['sessions'], start=1):
+            session_date, hour = session_times[session_type]
+            session_datetime = datetime.datetime.combine(session_date, datetime.time(hour))
+            rows.append({
+                'RoundNumber': event['RoundNumber'],
+                'Country': 'Synthetic',
+                'Location': 'Synthetic',
+                'OfficialEventName': f"{event['EventName'].upper()} {year}",
+                'EventDate': race_date.isoformat(),
+                'EventName': event['EventName'],
+                'EventFormat': event['EventFormat'],
+                'F1ApiSupport': True,
+                'SessionNumber': session_number,
+                'SessionName': session_type,
+                'SessionDate': f'{session_datetime.isoformat(sep=" ")}+00:00',
+                'SessionDateUtc': session_datetime.isoformat(sep=' '),
+            })
+    return pd.DataFrame(rows)
+
+
+def synthesize_season(year, n_events=24, n_teams=10, drivers_per_team=2, sprint_ratio=0.25, seed=0,
+                      fixtures=None, data_dir=None, first_race_date=None):
+    """
+    Record a synthetic season as fixtures and write its sessions_<year>.csv.
+    Args:
+        year (int): The season year to write. Use a year without real data, e.g. 2099.
+        fixtures (FixtureSessionProvider): Where to record sessions. Default is the fixture directory.
+        data_dir (str): Where to write the schedule. Default is the pipeline data directory.
+        first_race_date (datetime.date): Race day of round 1. Default puts the whole season in the past.
+    Returns:
+        pd.DataFrame: The written schedule.
+    """
+    fixtures = fixtures or FixtureSessionProvider()
+    events = generate_season(n_events, n_teams, drivers_per_team, sprint_ratio, seed=seed)
+    for event in events:
+        for session_type, session_results in event['sessions'].items():
+            fixtures.record(year, event['EventName'], session_type, session_results)
+
+    if first_race_date is None:
+        first_race_date = datetime.date.today() - datetime.timedelta(weeks=n_events + 1)
+    schedule = build_schedule(year, events, first_race_date)
+    sessions_path = get_sessions_path(year, data_dir or get_data_dir())
+    os.makedirs(os.path.dirname(sessions_path), exist_ok=True)
+    schedule.to_csv(sessions_path, index=False)
+    return schedule
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Record a synthetic season as session fixtures for offline pipeline runs.")
+    parser.add_argument('--year', type=int, default=2099, help="Season year to write. Default is 2099.")
+    parser.add_argument('--events', type=int, default=24)
+    parser.add_argument('--teams', type=int, default=10)
+    parser.add_argument('--drivers-per-team', type=int, default=2)
+    parser.add_argument('--sprint-ratio', type=float, default=0.25)
+    parser.add_argument('--seed', type=int, default=0)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    fixtures = FixtureSessionProvider()
+    schedule = synthesize_season(args.year, args.events, args.teams, args.drivers_per_team, args.sprint_ratio, args.seed,
+                                 fixtures=fixtures)
+    print(f"🧪 Recorded {len(schedule)} sessions for {args.year} into {fixtures.root}")
+    print(f"📅 Wrote {get_sessions_path(args.year)}")
+
+
+if __name__ == '__main__':
+    main()
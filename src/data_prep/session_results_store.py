@@ -0,0 +1,70 @@
+import hashlib
+import os
+
+import pandas as pd
+
+
+SESSION_RESULT_COLUMNS = ['DriverId', 'TeamId', 'Position', 'GridPosition', 'Points', 'Status']
+PROJECT_ROOT = os.path.join(os.path.dirname(__file__), '..', '..')
+
+
+def get_results_store_dir():
+    """Get the results store directory (F1_POINTS_RESULTS_STORE_DIR, or session_results under the cache dir)."""
+    return os.environ.get(
+        'F1_POINTS_RESULTS_STORE_DIR',
+        os.path.join(os.environ.get('F1_POINTS_CACHE_DIR', os.path.join(PROJECT_ROOT, '.cache')), 'session_results')
+    )
+
+
+def _file_sha256(path):
+    with open(path, 'rb') as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+
+class SessionResultsStore:
+    """
+    Local store of slim session results, one Parquet file per (year, round, session).
+
+    Only the SESSION_RESULT_COLUMNS that scoring uses are kept. Every file has a
+    ``.sha256`` sidecar with its content hash; a file whose hash no longer matches
+    is treated as a miss, so a truncated or hand-edited file is fetched again.
+    """
+
+    def __init__(self, root=None):
+        self.root = root or get_results_store_dir()
+
+    def path_for(self, year, event_round, session_type):
+        session_slug = session_type.lower().replace(' ', '_')
+        return os.path.join(self.root, str(year), f'{int(event_round):02d}_{session_slug}.parquet')
+
+    def get(self, year, event_round, session_type):
+        """Return the stored results for a session, or None on a miss."""
+        path = self.path_for(year, event_round, session_type)
+        hash_path = f'{path}.sha256'
+        if not os.path.exists(path) or not os.path.exists(hash_path):
+            return None
+        with open(hash_path, 'r', encoding='utf-8') as file:
+            expected_hash = file.read().strip()
+        if _file_sha256(path) != expected_hash:
+            return None
+        return pd.read_parquet(path)
+
+    def put(self, year, event_round, session_type, session_results):
+        """
+        Store the slim results of a session.
+        Returns:
+            tuple: The stored slim DataFrame and its content hash.
+        """
+        path = self.path_for(year, event_round, session_type)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        slim_results = pd.DataFrame(session_results)[SESSION_RESULT_COLUMNS].copy()
+        # Write then rename so concurrent readers and backfill workers never see a partial file
+        temp_path = f'{path}.{os.getpid()}.tmp'
+        slim_results.to_parquet(temp_path)
+        content_hash = _file_sha256(temp_path)
+        os.replace(temp_path, path)
+        with open(f'{path}.sha256.{os.getpid()}.tmp', 'w', encoding='utf-8') as file:
+            file.write(content_hash + "\n")
+        os.replace(f'{path}.sha256.{os.getpid()}.tmp', f'{path}.sha256')
+        return slim_results, content_hash
@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+
+from src.data_prep.session_results_store import SESSION_RESULT_COLUMNS
+
+
+RACE_POINTS = [25, 18, 15, 12, 10, 8, 6, 4, 2, 1]
+SPRINT_POINTS = [8, 7, 6, 5, 4, 3, 2, 1]
+
+
+def is_sprint_round(event_round, sprint_ratio):
+    """Spread sprint weekends evenly over the season: round r is a sprint when floor(r * ratio) steps up."""
+    return np.floor(event_round * sprint_ratio) > np.floor((event_round - 1) * sprint_ratio)
+
+
+def _finishing_points(positions, points_table):
+    points = np.zeros(len(positions))
+    scored = positions <= len(points_table)
+    points[scored] = np.asarray(points_table, dtype=float)[positions[scored].astype(int) - 1]
+    return points
+
+
+def generate_session_results(session_type, n_teams, drivers_per_team=2, retired_share=0.1, rng=None):
+    """
+    Generate one session's results in the shape FastF1 loads are slimmed to.
+    Args:
+        session_type (str): 'Sprint', 'Qualifying' or 'Race'.
+        n_teams (int): Number of teams.
+        drivers_per_team (int): Entries per team. Default is 2.
+        retired_share (float): Share of Sprint/Race entries that retire. Default is 0.1.
+        rng (np.random.Generator): Random generator. Default is a fresh generator seeded with 0.
+    Returns:
+        pd.DataFrame: SESSION_RESULT_COLUMNS for every driver, in finishing order.
+    """
+    rng = rng if rng is not None else np.random.default_rng(0)
+    n_drivers = n_teams * drivers_per_team
+    driver_numbers = rng.permutation(n_drivers)
+    positions = np.arange(1, n_drivers + 1, dtype=float)
+
+    session_results = pd.DataFrame({
+        'DriverId': [f'driver_{number}' for number in driver_numbers],
+        'TeamId': [f'team_{number // drivers_per_team}' for number in driver_numbers],
+        'Position': positions,
+    })
+    if session_type == 'Qualifying':
+        session_results['GridPosition'] = np.nan
+        session_results['Points'] = np.nan
+        session_results['Status'] = ''
+    else:
+        points_table = SPRINT_POINTS if session_type == 'Sprint' else RACE_POINTS
+        session_results['GridPosition'] = rng.permutation(n_drivers).astype(float) + 1
+        session_results['Points'] = _finishing_points(positions, points_table)
+        session_results['Status'] = np.where(rng.random(n_drivers) < retired_share, 'Retired', 'Finished')
+    return session_results[SESSION_RESULT_COLUMNS]
+
+
+def generate_season(n_events=24, n_teams=10, drivers_per_team=2, sprint_ratio=0.25, retired_share=0.1, seed=0):
+    """
+    Generate a synthetic season of session results.
+    Args:
+        n_events (int): Number of events (rounds). Default is 24.
+        n_teams (int): Number of teams. Default is 10.
+        drivers_per_team (int): Entries per team. Default is 2.
+        sprint_ratio (float): Share of events run in the sprint_qualifying format. Default is 0.25.
+        retired_share (float): Share of Sprint/Race entries that retire. Default is 0.1.
+        seed (int): Random seed. Default is 0.
+    Returns:
+        list: One dict per event with RoundNumber, EventName, EventFormat and ``sessions``
+            (session results DataFrames keyed by session type).
+    """
+    rng = np.random.default_rng(seed)
+    events = []
+    for event_round in range(1, n_events + 1):
+        event_format = 'sprint_qualifying' if is_sprint_round(event_round, sprint_ratio) else 'conventional'
+        session_types = ['Sprint', 'Qualifying', 'Race'] if event_format == 'sprint_qualifying' else ['Qualifying', 'Race']
+        events.append({
+            'RoundNumber': event_round,
+            'EventName': f'Synthetic Grand Prix {event_round}',
+            'EventFormat': event_format,
+            'sessions': {
+                session_type: generate_session_results(session_type, n_teams, drivers_per_team, retired_share, rng)
+                for session_type in session_types
+            },
+        })
+    return events
+
+
+def stack_season_results(events):
+    """Stack a generated season into the long frame ``CompiledScoringPlan.score_season`` scores."""
+    return pd.concat([
+        session_results.assign(SessionType=session_type, RoundNumber=event['RoundNumber'],
+                               EventName=event['EventName'], EventFormat=event['EventFormat'])
+        for event in events
+        for session_type, session_results in event['sessions'].items()
+    ], ignore_index=True)
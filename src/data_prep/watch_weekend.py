@@ -0,0 +1,245 @@
+import argparse
+import datetime
+import os
+import sys
+import time
+
+import pandas as pd
+
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+from src.data_prep import functions
+from src.data_prep.fastf1_cache import next_weekend_sessions
+from src.data_prep.provisional_points import ScoredSessionCache, has_classified_results, write_weekend_points
+from src.data_prep.run_report import recorded_run
+from src.data_prep.season_schedule import load_season_schedule
+
+# Results cannot be published before a session ends, so polling starts at start time + duration
+SESSION_DURATIONS = {
+    'Sprint': datetime.timedelta(hours=1),
+    'Qualifying': datetime.timedelta(hours=1),
+    'Race': datetime.timedelta(hours=2),
+}
+MIN_POLL_SECONDS = 60
+MAX_POLL_SECONDS = 15 * 60
+GIVE_UP_AFTER = datetime.timedelta(hours=12)
+
+
+def _utc_now():
+    return datetime.datetime.now(datetime.timezone.utc)
+
+
+def find_weekend(year=None, event_name=None, now=None):
+    """
+    Find the race weekend to watch and its scoring session start times.
+    Args:
+        year (int): Optional season year. Default is the season of ``now``.
+        event_name (str): Optional event. Default is the weekend whose Race is next (or finished under two days ago).
+        now (datetime): The current UTC time. Default is now.
+    Returns:
+        dict: Year, RoundNumber, EventName, EventFormat and SessionStartsUtc (session type -> UTC Timestamp),
+            or None when the season has no weekend left.
+    """
+    now  = now or _utc_now()
+    year = functions.resolve_season_year(year=year, today=now)
+    sessions = load_season_schedule(year).sessions
+
+    if event_name is None:
+        weekend_sessions = next_weekend_sessions(sessions, now)
+        if weekend_sessions.empty:
+            return None
+        event_name = weekend_sessions['EventName'].iloc[0]
+
+    race = load_season_schedule(year).get_race_by_event_name(event_name)
+    if race is None:
+        raise ValueError(f"No race weekend named '{event_name}' in the {year} schedule.")
+    session_types  = functions.get_session_types_list(race['EventFormat'])
+    event_sessions = sessions[(sessions['EventName'] == event_name) & sessions['SessionName'].isin(session_types)]
+    session_starts = dict(zip(event_sessions['SessionName'], pd.to_datetime(event_sessions['SessionDateUtc'], utc=True)))
+    return {
+        'Year': int(year),
+        'RoundNumber': int(race['RoundNumber']),
+        'EventName': event_name,
+        'EventFormat': race['EventFormat'],
+        'SessionStartsUtc': {session_type: session_starts[session_type] for session_type in session_types},
+    }
+
+
+def next_poll_at(session_start, session_type, attempts, now, min_poll_seconds=MIN_POLL_SECONDS, max_poll_seconds=MAX_POLL_SECONDS):
+    """
+    When to next look for a session's results.
+
+    Before the session's expected end that is the expected end itself. After it, each
+    unsuccessful attempt doubles the wait, from ``min_poll_seconds`` up to ``max_poll_seconds``,
+    so results published minutes after the flag are picked up quickly and a long delay
+    (red flags, stewards) costs few requests.
+    """
+    expected_end = session_start + SESSION_DURATIONS[session_type]
+    if now < expected_end:
+        return expected_end
+    return now + datetime.timedelta(seconds=min(max_poll_seconds, min_poll_seconds * 2 ** attempts))
+
+
+class WeekendWatcher:
+    """
+    Polls one race weekend's sessions and scores each session as soon as its results appear.
+
+    Sessions are scored one at a time with ``CompiledScoringPlan.score_session`` and kept
+    in the scored session cache. After each session, provisional points are written from
+    the frames scored so far; once the Race is in, the weekend's point files are written
+    from the same frames, without scoring any session twice. Sessions load through the
+    configured session provider, so a fixture or synthetic provider stands in for FastF1
+    in tests and offline runs. ``clock`` and ``sleep`` can be replaced to drive the
+    watcher on a simulated timeline.
+    """
+
+    def __init__(self, weekend, scoring_rules=None, min_poll_seconds=MIN_POLL_SECONDS, max_poll_seconds=MAX_POLL_SECONDS,
+                 give_up_after=GIVE_UP_AFTER, clock=None, sleep=time.sleep, export_csv=None, cache=None):
+        self.weekend          = weekend
+        self.cache            = cache or ScoredSessionCache(scoring_rules)
+        self.scoring_plan     = self.cache.scoring_rules.compile()
+        self.min_poll_seconds = min_poll_seconds
+        self.max_poll_seconds = max_poll_seconds
+        self.give_up_after    = give_up_after
+        self.clock            = clock or _utc_now
+        self.sleep            = sleep
+        self.export_csv       = export_csv
+
+        self.session_time_index     = load_season_schedule(weekend['Year']).session_time_index
+        self.driver_points_dfs      = {}
+        self.constructor_points_dfs = {}
+        self.abandoned              = []
+        self.attempts               = {session_type: 0 for session_type in weekend['SessionStartsUtc']}
+        for session_type in weekend['SessionStartsUtc']:
+            # A restarted watcher picks up the sessions it (or a provisional run) already scored
+            scored = self.cache.get(weekend['Year'], weekend['RoundNumber'], session_type)
+            if scored is not None:
+                self._keep_scored(session_type, *scored)
+        now = self.clock()
+        self.next_polls = {
+            session_type: next_poll_at(session_start, session_type, 0, now, min_poll_seconds, max_poll_seconds)
+            for session_type, session_start in weekend['SessionStartsUtc'].items()
+        }
+
+    @property
+    def pending(self):
+        return [session_type for session_type in self.weekend['SessionStartsUtc']
+                if session_type not in self.driver_points_dfs and session_type not in self.abandoned]
+
+    def has_started(self, session_type, now):
+        """Whether the schedule puts this weekend's ``session_type`` (or a later one) before ``now``."""
+        # Queried on every poll, so go to the index directly rather than through the printing schedule helpers
+        latest_session = self.session_time_index.latest_before(session_type, now)
+        if latest_session.empty:
+            return False
+        latest_start = pd.to_datetime(latest_session['SessionDateUtc'].iloc[0], utc=True)
+        return latest_start >= self.weekend['SessionStartsUtc'][session_type]
+
+    def poll(self):
+        """
+        Try to load every pending session that is due, scoring the ones whose results are out.
+        Returns:
+            list: Session types scored by this poll.
+        """
+        now    = self.clock()
+        scored = []
+        for session_type in self.pending:
+            if now < self.next_polls[session_type] or not self.has_started(session_type, now):
+                continue
+            try:
+                session_dfs, _ = functions.load_event_session_results(
+                    self.weekend['Year'], self.weekend['EventName'], [session_type], event_round=self.weekend['RoundNumber'],
+                    accept_results=has_classified_results)
+            except functions.SessionLoadError as exc:
+                self._retry_later(session_type, now, exc)
+                continue
+            except Exception as exc:
+                # Network, HTTP and FastF1 errors are transient on a race weekend; back off like an unpublished session
+                self._retry_later(session_type, now, f"{type(exc).__name__}: {exc}")
+                continue
+            self.score_session(session_type, session_dfs[session_type])
+            scored.append(session_type)
+        if scored and self.pending:
+            self.write_points()
+        return scored
+
+    def _retry_later(self, session_type, now, exc):
+        session_start = self.weekend['SessionStartsUtc'][session_type]
+        if now - session_start >= self.give_up_after:
+            print(f"❌ Giving up on {session_type} for {self.weekend['EventName']}: no results {self.give_up_after} after the start ({exc})")
+            self.abandoned.append(session_type)
+            return
+        self.attempts[session_type] += 1
+        self.next_polls[session_type] = next_poll_at(session_start, session_type, self.attempts[session_type], now,
+                                                     self.min_poll_seconds, self.max_poll_seconds)
+        print(f"⏳ {session_type} results not out yet; next check at {self.next_polls[session_type].isoformat()}")
+
+    def score_session(self, session_type, session_results):
+        """Score one session's results and keep the scored frames for the weekend merge."""
+        driver_points, constructor_points = self.scoring_plan.score_session(session_results, session_type)
+        self.cache.put(self.weekend['Year'], self.weekend['RoundNumber'], session_type, driver_points, constructor_points)
+        self._keep_scored(session_type, driver_points, constructor_points)
+        print(f"🏎️  Scored {session_type} for {self.weekend['EventName']} ({len(driver_points)} drivers)")
+
+    def _keep_scored(self, session_type, driver_points, constructor_points):
+        self.driver_points_dfs[session_type] = driver_points
+        if constructor_points is not None:
+            self.constructor_points_dfs[session_type] = constructor_points
+
+    def write_points(self):
+        """
+        Merge the scored sessions and write them: provisionally while sessions are pending,
+        otherwise as the weekend's per-event and _most_recent point files.
+        Returns:
+            tuple: Slim driver and constructor points DataFrames and whether they are provisional.
+        """
+        weekend = self.weekend
+        return write_weekend_points(self.scoring_plan, self.driver_points_dfs, self.constructor_points_dfs, weekend['Year'],
+                                    weekend['RoundNumber'], weekend['EventName'], weekend['EventFormat'], self.export_csv)
+
+    def run(self):
+        """
+        Watch until every session is scored or abandoned, sleeping until the next poll is due.
+        Returns:
+            tuple: Slim driver and constructor points DataFrames, or None when a session never produced results.
+        """
+        while self.pending:
+            self.poll()
+            if not self.pending:
+                break
+            wake_at = min(self.next_polls[session_type] for session_type in self.pending)
+            self.sleep(min(max((wake_at - self.clock()).total_seconds(), 0), self.max_poll_seconds))
+
+        if self.abandoned:
+            print(f"⚠️  {self.weekend['EventName']} is missing {', '.join(self.abandoned)}; only provisional points were written.")
+            return None
+        driver_points, constructor_points, _ = self.write_points()
+        return driver_points, constructor_points
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Watch a race weekend and score each session as soon as its results appear.")
+    parser.add_argument('--year', type=int, default=None, help="Season year. Default is the current season.")
+    parser.add_argument('--event', default=None, help="Event name. Default is the next (or just finished) race weekend.")
+    parser.add_argument('--min-poll', type=float, default=MIN_POLL_SECONDS, help="Seconds before the first retry after a session ends.")
+    parser.add_argument('--max-poll', type=float, default=MAX_POLL_SECONDS, help="Longest wait between polls, in seconds.")
+    parser.add_argument('--give-up-hours', type=float, default=GIVE_UP_AFTER.total_seconds() / 3600,
+                        help="Stop waiting for a session this many hours after its start.")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    weekend = find_weekend(args.year, args.event)
+    if weekend is None:
+        print("No upcoming race weekend in the schedule.")
+        return
+    session_starts = ', '.join(f"{session_type} {start.isoformat()}" for session_type, start in weekend['SessionStartsUtc'].items())
+    print(f"👀 Watching {weekend['EventName']} ({weekend['Year']}): {session_starts}")
+    with recorded_run('watch_weekend'):
+        WeekendWatcher(weekend, min_poll_seconds=args.min_poll, max_poll_seconds=args.max_poll,
+                       give_up_after=datetime.timedelta(hours=args.give_up_hours)).run()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+import collections
+import datetime
+import os
+import sys
+
+import pytest
+
+# Add the project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.data_prep import functions
+from src.data_prep.provisional_points import SCORED_SESSIONS_DIR_ENV
+from src.data_prep.season_schedule import DATA_DIR_ENV, clear_schedule_cache
+from src.data_prep.session_fixtures import FixtureSessionProvider, synthesize_season
+
+SyntheticSeason = collections.namedtuple('SyntheticSeason', ['data_dir', 'fixtures', 'schedule'])
+
+
+@pytest.fixture
+def synthetic_season(tmp_path, monkeypatch):
+    """
+    Factory for a synthetic 2099 season recorded as fixtures, with the pipeline pointed at temporary
+    data, results store and scored session dirs and the fixtures installed as the session provider.
+    The schedule cache is cleared and the previous session provider restored afterwards.
+    Args (of the returned function):
+        n_events, n_teams, sprint_ratio: As for ``synthesize_season``.
+        first_race_date (datetime.date): Default is 2020-03-01, so every round is in the past.
+    Returns:
+        SyntheticSeason: data_dir (pathlib.Path), fixtures (FixtureSessionProvider) and schedule (pd.DataFrame).
+    """
+    data_dir = tmp_path / 'data'
+    monkeypatch.setenv(DATA_DIR_ENV, str(data_dir))
+    monkeypatch.setenv('F1_POINTS_RESULTS_STORE_DIR', str(tmp_path / 'results_store'))
+    monkeypatch.setenv(SCORED_SESSIONS_DIR_ENV, str(tmp_path / 'scored_sessions'))
+    previous = functions.get_session_provider()
+
+    def make(n_events=3, n_teams=4, sprint_ratio=0.5, first_race_date=datetime.date(2020, 3, 1)):
+        fixtures = FixtureSessionProvider(str(tmp_path / 'fixtures'))
+        schedule = synthesize_season(2099, n_events=n_events, n_teams=n_teams, sprint_ratio=sprint_ratio,
+                                     fixtures=fixtures, first_race_date=first_race_date)
+        functions.set_session_provider(fixtures)
+        clear_schedule_cache()
+        return SyntheticSeason(data_dir, fixtures, schedule)
+
+    yield make
+    functions.set_session_provider(previous)
+    clear_schedule_cache()
@@ -0,0 +1,98 @@
+import os
+import shutil
+import sys
+
+import pandas as pd
+
+# Add the project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.data_prep import combine_event_points
+from src.data_prep.season_schedule import DATA_DIR_ENV
+
+DATA_DIR = os.path.join(project_root, 'data')
+EVENTS = [(4, 'Bahrain Grand Prix'), (5, 'Saudi Arabian Grand Prix'), (6, 'Miami Grand Prix'), (7, 'Emilia Romagna Grand Prix')]
+
+
+def copy_event_files(target_dir, events):
+    for event_round, event_name in events:
+        for entity_type in combine_event_points.ENTITY_TYPES:
+            shutil.copy(combine_event_points.get_event_points_path(entity_type, 2025, event_round, event_name, DATA_DIR), target_dir)
+
+
+def read_current(data_dir):
+    return {entity_type: pd.read_csv(combine_event_points.get_current_points_path(entity_type, 2025, str(data_dir)))
+            for entity_type in combine_event_points.ENTITY_TYPES}
+
+
+def assert_matches_full_rebuild(data_dir, events, tmp_path):
+    rebuild_dir = tmp_path / 'rebuild'
+    shutil.copytree(data_dir, rebuild_dir)
+    combine_event_points.combine_points(2025, events, data_dir=str(rebuild_dir))
+    expected = read_current(rebuild_dir)
+    for entity_type, combined in read_current(data_dir).items():
+        pd.testing.assert_frame_equal(combined, expected[entity_type], check_like=True, check_dtype=False)
+    shutil.rmtree(rebuild_dir)
+
+
+def test_incremental_combine_appends_new_event_without_rewriting(tmp_path, capsys):
+    data_dir = tmp_path / 'data'
+    data_dir.mkdir()
+    copy_event_files(data_dir, EVENTS[:3])
+    combine_event_points.combine_points(2025, EVENTS[:3], incremental=True, data_dir=str(data_dir))
+    assert_matches_full_rebuild(data_dir, EVENTS[:3], tmp_path)
+
+    copy_event_files(data_dir, EVENTS[3:])
+    capsys.readouterr()
+    combine_event_points.combine_points(2025, EVENTS, incremental=True, data_dir=str(data_dir))
+
+    output = capsys.readouterr().out
+    assert 'Appended' in output and 'Emilia Romagna Grand Prix' in output
+    assert_matches_full_rebuild(data_dir, EVENTS, tmp_path)
+    manifest = combine_event_points.load_manifest(2025, str(data_dir))
+    assert set(manifest['driver']) == {event_name for _, event_name in EVENTS}
+
+
+def test_incremental_combine_rebuilds_only_changed_older_event(tmp_path, capsys):
+    data_dir = tmp_path / 'data'
+    data_dir.mkdir()
+    copy_event_files(data_dir, EVENTS)
+    combine_event_points.combine_points(2025, EVENTS, incremental=True, data_dir=str(data_dir))
+
+    driver_path = combine_event_points.get_event_points_path('driver', 2025, 5, 'Saudi Arabian Grand Prix', str(data_dir))
+    rescored = pd.read_csv(driver_path)
+    rescored['TotalDriverPoints'] += 100
+    rescored.to_csv(driver_path, index=False)
+    capsys.readouterr()
+
+    combine_event_points.combine_points(2025, EVENTS, incremental=True, data_dir=str(data_dir))
+
+    output = capsys.readouterr().out
+    assert 'Rebuilt driver rows for Saudi Arabian Grand Prix' in output
+    assert 'Constructor standings already include every event file' in output
+    combined = read_current(data_dir)['driver']
+    assert combined['EventName'].drop_duplicates().tolist() == [event_name for _, event_name in EVENTS]
+    assert_matches_full_rebuild(data_dir, EVENTS, tmp_path)
+
+
+def test_quiet_combine_prints_nothing(tmp_path, capsys):
+    data_dir = tmp_path / 'data'
+    data_dir.mkdir()
+    copy_event_files(data_dir, EVENTS[:2])
+
+    assert combine_event_points.combine_points(2025, EVENTS[:3], data_dir=str(data_dir), verbose=False)
+    assert capsys.readouterr().out == ''
+    event_files = combine_event_points.find_event_files(2025, EVENTS[:3], str(data_dir))
+    assert list(event_files['driver']) == [event_name for _, event_name in EVENTS[:2]]
+    assert 'Driver file not found' in capsys.readouterr().out
+
+
+def test_data_dir_is_resolved_when_combining(tmp_path, monkeypatch):
+    # Set after the module was imported, as the pipeline runner and tests do
+    monkeypatch.setenv(DATA_DIR_ENV, str(tmp_path))
+    copy_event_files(tmp_path, EVENTS[:2])
+
+    assert combine_event_points.combine_points(2025, EVENTS[:2], verbose=False)
+    assert set(read_current(tmp_path)['driver']['EventName']) == {event_name for _, event_name in EVENTS[:2]}
+    assert os.path.exists(combine_event_points.get_manifest_path(2025, str(tmp_path)))
@@ -0,0 +1,111 @@
+import datetime
+import json
+import os
+import sys
+
+import pytest
+
+# Add the project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.data_prep import data_manifest, functions, run_pipeline
+from src.data_prep.season_schedule import clear_schedule_cache
+from src.data_prep.session_fixtures import FixtureSessionProvider, synthesize_season
+
+UTC = datetime.timezone.utc
+
+
+@pytest.fixture
+def offline_pipeline(synthetic_season):
+    """A synthetic 2099 season (three races from 2020-03-01, weekly) with the pipeline pointed at a temporary data dir."""
+    season = synthetic_season(n_events=3, n_teams=3)
+    return season.data_dir, season.schedule
+
+
+def test_pipeline_writes_a_manifest_of_seasons_rounds_and_files(offline_pipeline):
+    data_dir, schedule = offline_pipeline
+    run_pipeline.run_pipeline(skip=['event_schedule'])
+
+    manifest = data_manifest.load_manifest(str(data_dir))
+    season = manifest['seasons']['2099']
+    assert manifest['latest_season'] == 2099
+    assert [race['EventName'] for race in season['races']] == list(schedule['EventName'].unique())
+    assert season['completed_rounds'] == [1, 2, 3]
+    # Only the latest race is scored by the pipeline
+    assert season['scored_rounds'] == [3]
+    assert season['latest_scored_round'] == {'RoundNumber': 3, 'EventName': 'Synthetic Grand Prix 3'}
+    assert season['bundle'] == 'season_bundle_2099.json'
+
+    for name in ('sessions_2099.csv', 'season_bundle_2099.json', 'driver_points_2099_current.csv'):
+        assert manifest['files'][name] == {'sha256': run_pipeline.file_sha256(data_dir / name),
+                                           'size': os.path.getsize(data_dir / name)}
+    assert 'pipeline_state.json' not in manifest['files']
+
+
+def test_no_op_run_leaves_the_manifest_untouched(offline_pipeline):
+    data_dir, _ = offline_pipeline
+    run_pipeline.run_pipeline(skip=['event_schedule'])
+    manifest_bytes = (data_dir / 'manifest.json').read_bytes()
+
+    run_pipeline.run_pipeline(skip=['event_schedule'])
+    assert (data_dir / 'manifest.json').read_bytes() == manifest_bytes
+
+    # A file written outside the pipeline is picked up by the next run
+    (data_dir / 'fantasygp_prices_current.csv').write_text('EntityType,Name,NameKey,Price\n')
+    run_pipeline.run_pipeline(skip=['event_schedule'])
+    assert 'fantasygp_prices_current.csv' in json.loads((data_dir / 'manifest.json').read_text())['files']
+
+
+def test_resolve_season_year_reads_only_the_manifest(offline_pipeline, monkeypatch):
+    data_dir, _ = offline_pipeline
+    synthesize_season(2098, n_events=2, n_teams=2, fixtures=FixtureSessionProvider(str(data_dir / '..' / 'fixtures_2098')),
+                      first_race_date=datetime.date(2098, 3, 1))
+    clear_schedule_cache()
+    moments = [datetime.datetime(2098, 2, 1, tzinfo=UTC), datetime.datetime(2098, 3, 1, 12, tzinfo=UTC),
+               datetime.datetime(2098, 3, 2, tzinfo=UTC), datetime.datetime(2099, 6, 1, tzinfo=UTC)]
+    queries = [(year, today, require_past_races) for today in moments for year in (None, 2098, 2099)
+               for require_past_races in (False, True)]
+
+    def resolve(year, today, require_past_races):
+        try:
+            return functions.resolve_season_year(year=year, today=today, require_past_races=require_past_races)
+        except FileNotFoundError:
+            return None
+    from_files = [resolve(*query) for query in queries]
+
+    data_manifest.refresh_manifest(str(data_dir))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("resolve_season_year scanned the data directory")
+    monkeypatch.setattr(functions.os, 'listdir', fail)
+    monkeypatch.setattr(functions, 'load_season_schedule', fail)
+    assert [resolve(*query) for query in queries] == from_files
+    assert {2098, 2099} <= set(from_files)
+
+
+def test_resolve_season_year_notices_sessions_files_changed_after_the_manifest(offline_pipeline):
+    data_dir, _ = offline_pipeline
+    data_manifest.refresh_manifest(str(data_dir))
+    today = datetime.datetime(2098, 3, 2, tzinfo=UTC)
+    # Without a 2098 season the latest one is used
+    assert functions.resolve_season_year(year=2098, today=today, require_past_races=True) == 2099
+
+    # A season added by a script that does not refresh the manifest
+    synthesize_season(2098, n_events=2, n_teams=2, fixtures=FixtureSessionProvider(str(data_dir / '..' / 'fixtures_2098')),
+                      first_race_date=datetime.date(2098, 3, 1))
+    clear_schedule_cache()
+    assert data_manifest.load_current_manifest(str(data_dir)) is None
+    assert functions.resolve_season_year(year=2098, today=today, require_past_races=True) == 2098
+
+    data_manifest.refresh_manifest(str(data_dir))
+    assert data_manifest.load_current_manifest(str(data_dir)) is not None
+
+    # The same season rewritten in place with its races a year later, so none is past yet
+    sessions_path = data_dir / 'sessions_2098.csv'
+    sessions_path.write_text(sessions_path.read_text().replace('2098-', '2099-'))
+    manifest_mtime = os.stat(data_dir / 'manifest.json').st_mtime_ns
+    os.utime(sessions_path, ns=(manifest_mtime + 1_000_000, manifest_mtime + 1_000_000))
+    clear_schedule_cache()
+    assert data_manifest.load_current_manifest(str(data_dir)) is None
+    assert functions.resolve_season_year(year=2098, today=today, require_past_races=True) == 2099
@@ -0,0 +1,51 @@
+import os
+import sys
+
+import pandas as pd
+
+# Add the project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.data_prep.entity_registry import EntityRegistry, load_entity_registry, write_entity_registry
+
+PRICES = pd.DataFrame({
+    'EntityType': ['driver', 'driver', 'driver', 'constructor', 'constructor'],
+    'Name': ['Verstappen', 'Hamilton', 'Lindblad', 'Racing Bulls', 'Cadillac'],
+    'NameKey': ['verstappen', 'hamilton', 'arvid_lindlblad', 'racing_bulls', 'cadillac'],
+})
+
+
+def test_fastf1_ids_resolve_to_fantasygp_keys_and_leftovers_are_flagged():
+    registry = EntityRegistry.build(
+        {'driver': ['max_verstappen', 'lewis_hamilton', 'arvid_lindblad', 'new_driver'], 'constructor': ['rb', 'visa_cash_app_rb']},
+        PRICES)
+
+    assert registry.canonical_id('driver', 'max_verstappen') == 'verstappen'
+    assert registry.canonical_id('driver', 'Verstappen') == 'verstappen'
+    assert registry.canonical_id('driver', 'arvid_lindblad') == 'arvid_lindlblad'
+    assert registry.canonical_id('constructor', 'rb') == registry.canonical_id('constructor', 'visa_cash_app_rb') == 'racing_bulls'
+    assert registry.entities['constructor']['racing_bulls']['fastf1_ids'] == ['rb', 'visa_cash_app_rb']
+    assert registry.canonical_id('driver', 'rb') is None
+    assert registry.unmatched == {'driver': {'fastf1_ids': ['new_driver'], 'price_keys': []},
+                                  'constructor': {'fastf1_ids': [], 'price_keys': ['cadillac']}}
+
+    frame = pd.DataFrame({'EntityType': ['constructor', 'driver', 'driver'], 'EntityId': ['rb', 'lewis_hamilton', 'nobody']})
+    resolved = registry.canonical_ids(frame, 'EntityId')
+    assert resolved.tolist()[:2] == ['racing_bulls', 'hamilton'] and pd.isna(resolved.iloc[2])
+
+
+def test_stored_registry_round_trips(tmp_path):
+    pd.DataFrame({'DriverId': ['max_verstappen'], 'TotalDriverPoints': [25.0]}).to_csv(
+        tmp_path / 'driver_points_2099_most_recent.csv', index=False)
+    pd.DataFrame({'TeamId': ['rb'], 'TotalConstructorPoints': [10.0]}).to_csv(
+        tmp_path / 'constructor_points_2099_1_Synthetic Grand Prix 1.csv', index=False)
+    PRICES.assign(Price=[21.0, 18.0, 6.0, 6.5, 5.0]).to_csv(tmp_path / 'fantasygp_prices_2099-03-01.csv', index=False)
+
+    written = write_entity_registry(str(tmp_path))
+    loaded = load_entity_registry(str(tmp_path))
+
+    assert (tmp_path / 'entity_registry.json').exists()
+    assert loaded.to_dict() == written.to_dict()
+    assert loaded.canonical_id('constructor', 'rb') == 'racing_bulls'
+    assert loaded.unmatched['driver']['price_keys'] == ['arvid_lindlblad', 'hamilton']
@@ -0,0 +1,96 @@
+import datetime
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+# Add the project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.data_prep.fastf1_cache import FastF1CacheManager, next_weekend_sessions, parse_size
+
+SESSIONS = ['2025/2025-03-16_Australian_Grand_Prix/2025-03-16_Race',
+            '2025/2025-03-23_Chinese_Grand_Prix/2025-03-23_Race',
+            '2025/2025-04-06_Japanese_Grand_Prix/2025-04-06_Race']
+
+
+def write_session(root, session_key, size=1000):
+    session_dir = os.path.join(root, session_key)
+    os.makedirs(session_dir, exist_ok=True)
+    with open(os.path.join(session_dir, 'session_info.ff1pkl'), 'wb') as file:
+        file.write(b'x' * size)
+
+
+def test_parse_size_accepts_bytes_and_suffixes():
+    assert parse_size('2048') == 2048
+    assert parse_size('512M') == 512 * 1024 ** 2
+    assert parse_size('1.5g') == int(1.5 * 1024 ** 3)
+    assert parse_size(None) is None
+    with pytest.raises(ValueError):
+        parse_size('lots')
+
+
+def test_record_access_counts_hits_and_evicts_least_recently_used(tmp_path):
+    manager = FastF1CacheManager(root=str(tmp_path), max_bytes=2500)
+    for session_key in SESSIONS[:2]:
+        write_session(str(tmp_path), session_key)
+        manager.record_access(session_key, hit=False)
+    manager.record_access(SESSIONS[0], hit=manager.is_cached(SESSIONS[0]))
+
+    # Adding a third session goes over the cap and evicts the least recently used one
+    write_session(str(tmp_path), SESSIONS[2])
+    manager.record_access(SESSIONS[2], hit=False)
+
+    assert set(manager.session_dirs()) == {SESSIONS[0], SESSIONS[2]}
+    stats = manager.stats()
+    assert (stats['hits'], stats['misses'], stats['evictions']) == (1, 3, 1)
+    assert stats['sessions'] == 2 and stats['session_bytes'] == 2000
+    assert stats['bytes'] > stats['session_bytes']
+
+
+def test_http_cache_does_not_count_towards_the_cap(tmp_path):
+    manager = FastF1CacheManager(root=str(tmp_path), max_bytes=2500)
+    # FastF1's request cache cannot be evicted, so a large one must not flush every session
+    (tmp_path / 'fastf1_http_cache.sqlite').write_bytes(b'x' * 10_000)
+    for session_key in SESSIONS[:2]:
+        write_session(str(tmp_path), session_key)
+        manager.record_access(session_key, hit=False)
+
+    assert manager.evict() == []
+    assert set(manager.session_dirs()) == set(SESSIONS[:2])
+
+
+def test_archive_round_trips_into_another_cache(tmp_path):
+    source = FastF1CacheManager(root=str(tmp_path / 'source'))
+    for session_key in SESSIONS:
+        write_session(source.root, session_key)
+        source.record_access(session_key, hit=False)
+    manifest = source.archive(str(tmp_path / 'cache.tar.gz'))
+    assert manifest['sessions'] == sorted(SESSIONS)
+
+    target = FastF1CacheManager(root=str(tmp_path / 'target'), max_bytes=2500)
+    restored = target.restore(str(tmp_path / 'cache.tar.gz'))
+
+    assert restored['cache_scope'] == 'event_points'
+    # Restoring applies the target's cap, dropping the least recently used session
+    assert set(target.session_dirs()) == set(SESSIONS[1:])
+    assert target.stats()['misses'] == 3
+
+    with pytest.raises(ValueError):
+        FastF1CacheManager('event_schedule', root=str(tmp_path / 'other')).restore(str(tmp_path / 'cache.tar.gz'))
+
+
+def test_next_weekend_sessions_targets_the_weekend_that_just_finished_on_monday():
+    sessions = pd.read_csv(os.path.join(project_root, 'data', 'sessions_2025.csv'))
+
+    monday = datetime.datetime(2025, 3, 17, 8, tzinfo=datetime.timezone.utc)
+    weekend = next_weekend_sessions(sessions, monday)
+    assert weekend['EventName'].unique().tolist() == ['Australian Grand Prix']
+    assert weekend['SessionName'].tolist() == ['Qualifying', 'Race']
+
+    thursday = datetime.datetime(2025, 3, 20, 8, tzinfo=datetime.timezone.utc)
+    weekend = next_weekend_sessions(sessions, thursday)
+    assert weekend['EventName'].unique().tolist() == ['Chinese Grand Prix']
+    assert weekend['SessionName'].tolist() == ['Sprint', 'Qualifying', 'Race']
@@ -75,3 +75,117 @@ def test_get_round_number_from_event_name_with_no_year_uses_available_schedule()
     """Round lookup should work without explicitly passing a year."""
     round_number = functions.get_round_number_from_event_name('Australian Grand Prix')
     assert round_number == 1
+
+
+def test_calculate_teammate_race_points_compares_within_team():
+    """Drivers ahead of their teammate get 5 points; solo entries get none."""
+    df = pd.DataFrame({
+        'DriverId': ['a', 'b', 'c', 'd', 'e'],
+        'TeamId': ['red', 'blue', 'red', 'blue', 'green'],
+        'Position': [2.0, 5.0, 1.0, 4.0, 3.0]
+    })
+    res = functions.calculate_teammate_race_points(df.copy(), 'Race')
+    assert res['TeammateRacePoints'].tolist() == [0, 0, 5, 5, 0]
+
+
+def test_calculate_teammate_quali_points_with_three_entry_team_uses_first_teammate():
+    """Third entries compare against the team's first entry, matching the original loop."""
+    df = pd.DataFrame({
+        'DriverId': ['a', 'b', 'c'],
+        'TeamId': ['red', 'red', 'red'],
+        'GridPosition': [5.0, 4.0, 6.0]
+    })
+    res = functions.calculate_teammate_quali_points(df.copy())
+    assert res['TeammateQualiPoints'].tolist() == [0, 5, 0]
+
+
+def test_calculate_teammate_race_points_matches_loop_reference():
+    """The vectorized pass should agree with the iterrows reference on shuffled grids."""
+    from benchmarks.bench_teammate_points import build_session_results, loop_teammate_points
+
+    df = build_session_results(n_teams=12, drivers_per_team=3, seed=7)
+    df.loc[[0, 5], 'Position'] = float('nan')
+    expected = loop_teammate_points(df.copy(), 'Position', 'TeammateRacePoints')
+    res = functions.calculate_teammate_race_points(df.copy(), 'Race')
+    assert res['TeammateRacePoints'].tolist() == expected['TeammateRacePoints'].tolist()
+
+
+def test_load_event_session_results_loads_sessions_concurrently(monkeypatch):
+    """Session loads overlap, and the timings report the wall-clock saving."""
+    import time
+
+    def fake_load_session_results(year, event_name, session_type):
+        time.sleep(0.2)
+        return pd.DataFrame({'SessionType': [session_type], 'Position': [1.0]})
+
+    monkeypatch.setattr(functions, 'load_session_results', fake_load_session_results)
+    session_dfs, timings = functions.load_event_session_results(2026, 'Test GP', ['Sprint', 'Qualifying', 'Race'])
+
+    assert list(session_dfs) == ['Sprint', 'Qualifying', 'Race']
+    assert session_dfs['Race']['SessionType'].tolist() == ['Race']
+    assert timings['wall_seconds'] < timings['sequential_seconds']
+    assert timings['saved_seconds'] > 0.2
+
+
+def test_load_event_session_results_raises_with_failing_session_type(monkeypatch):
+    """A ValueError from any session surfaces as SessionLoadError naming that session."""
+    def fake_load_session_results(year, event_name, session_type):
+        if session_type == 'Qualifying':
+            raise ValueError('Session not available')
+        return pd.DataFrame()
+
+    monkeypatch.setattr(functions, 'load_session_results', fake_load_session_results)
+    with pytest.raises(functions.SessionLoadError) as exc_info:
+        functions.load_event_session_results(2026, 'Test GP', ['Qualifying', 'Race'])
+    assert exc_info.value.session_type == 'Qualifying'
+    assert isinstance(exc_info.value, ValueError)
+
+
+def test_load_event_session_results_applies_the_callers_results_check(monkeypatch):
+    """Partly classified results load by default; a race weekend caller can hold out for final ones."""
+    from src.data_prep.provisional_points import has_classified_results
+
+    monkeypatch.setattr(functions, 'load_session_results',
+                        lambda year, event_name, session_type: pd.DataFrame({'DriverId': ['a', 'b'], 'Position': [1.0, float('nan')]}))
+    session_dfs, _ = functions.load_event_session_results(2026, 'Test GP', ['Race'])
+    assert len(session_dfs['Race']) == 2
+    with pytest.raises(functions.SessionLoadError):
+        functions.load_event_session_results(2026, 'Test GP', ['Race'], accept_results=has_classified_results)
+
+
+def test_load_event_session_results_rejects_sessions_without_results(monkeypatch):
+    """A session loaded before its results are published counts as not loaded."""
+    monkeypatch.setattr(functions, 'load_session_results', lambda year, event_name, session_type: pd.DataFrame())
+    with pytest.raises(functions.SessionLoadError) as exc_info:
+        functions.load_event_session_results(2026, 'Test GP', ['Race'])
+    assert exc_info.value.session_type == 'Race'
+
+
+def test_csv_only_entry_points_do_not_import_fastf1():
+    """fastf1 is imported lazily, only by the code paths that fetch sessions."""
+    import subprocess
+
+    code = (
+        "import sys; "
+        "import src.data_prep.combine_event_points, src.data_prep.get_past_event_points; "
+        "print('fastf1' in sys.modules)"
+    )
+    result = subprocess.run([sys.executable, '-c', code], cwd=project_root, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == 'False'
+
+def test_calculate_constructor_points_matches_loop_reference():
+    """The single grouped pass should agree with the per-team loop, including all-retired and three-car teams."""
+    from benchmarks.bench_constructor_points import build_race_results, loop_constructor_points
+
+    df = build_race_results(n_teams=15, drivers_per_team=3, retired_share=0.4, seed=3)
+    df.loc[df['TeamId'] == 'team_0', 'Status'] = 'Retired'
+    expected = loop_constructor_points(df.copy(), 'Race')
+    res = functions.calculate_constructor_points(df.copy(), 'Race')
+    assert res.columns.tolist() == ['TeamId', 'ConstructorRaceFinishingPoints', 'TotalRacePoints',
+                                    'PlacesGainedRacePoints', 'ConstructorRacePoints', 'TotalConstructorRacePoints']
+    pd.testing.assert_frame_equal(res, expected[res.columns], check_dtype=False)
+    assert res.loc[res['TeamId'] == 'team_0', 'ConstructorRaceFinishingPoints'].item() == 0
+
+def test_calculate_constructor_points_rejects_qualifying():
+    with pytest.raises(ValueError):
+        functions.calculate_constructor_points(pd.DataFrame(), 'Qualifying')
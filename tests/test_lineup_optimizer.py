@@ -0,0 +1,110 @@
+import itertools
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add the project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.data_prep.entity_registry import EntityRegistry
+from src.data_prep.lineup_optimizer import form_points, lineup_candidates, optimize_lineup
+from src.data_prep.price_alignment import normalize_prices
+
+
+def random_grid(n_drivers, n_constructors, seed):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'EntityType': ['driver'] * n_drivers + ['constructor'] * n_constructors,
+        'EntityId': [f'driver_{index}' for index in range(n_drivers)] + [f'team_{index}' for index in range(n_constructors)],
+        'Name': None,
+        # FantasyGP prices move in $0.1M steps
+        'Price': rng.integers(50, 300, n_drivers + n_constructors) * 100_000.0,
+        'Points': rng.integers(0, 400, n_drivers + n_constructors).astype(float),
+    })
+
+
+def brute_force_points(candidates, n_drivers, n_constructors, budget, locked=(), excluded=()):
+    pool = candidates[~candidates['EntityId'].isin(excluded)]
+    drivers, constructors = pool[pool['EntityType'] == 'driver'], pool[pool['EntityType'] == 'constructor']
+    best = None
+    for driver_rows in itertools.combinations(drivers.index, n_drivers):
+        for constructor_rows in itertools.combinations(constructors.index, n_constructors):
+            lineup = pool.loc[list(driver_rows + constructor_rows)]
+            if lineup['Price'].sum() <= budget and set(locked) <= set(lineup['EntityId']):
+                best = max(best or 0.0, lineup['Points'].sum())
+    return best
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_dp_matches_brute_force(seed):
+    candidates = random_grid(9, 5, seed)
+    options = dict(n_drivers=3, n_constructors=2, budget=75_000_000, locked=['driver_2'], excluded=['team_0'])
+
+    lineup = optimize_lineup(candidates, **options)
+
+    assert lineup['Points'].sum() == brute_force_points(candidates, **options)
+    assert lineup['Price'].sum() <= options['budget']
+    assert 'driver_2' in set(lineup['EntityId']) and 'team_0' not in set(lineup['EntityId'])
+    assert lineup['EntityType'].tolist() == ['driver'] * 3 + ['constructor'] * 2
+
+
+def test_full_grid_solves_in_under_a_second():
+    candidates = random_grid(22, 11, seed=7)
+
+    started = time.perf_counter()
+    lineup = optimize_lineup(candidates, n_drivers=5, n_constructors=2, budget=100_000_000)
+    assert time.perf_counter() - started < 1.0
+    assert len(lineup) == 7 and lineup['Price'].sum() <= 100_000_000
+
+
+def test_budget_in_millions_keeps_the_price_step():
+    candidates = random_grid(9, 5, seed=2)
+    # 128.2 * 1e6 is 128199999.99999999 in floating point
+    budget = 128.2 * 1_000_000
+
+    lineup = optimize_lineup(candidates, n_drivers=3, n_constructors=2, budget=budget)
+
+    assert lineup['Points'].sum() == brute_force_points(candidates, 3, 2, round(budget))
+    assert lineup['Price'].sum() <= round(budget)
+
+
+def test_impossible_requests_raise():
+    candidates = random_grid(6, 3, seed=1)
+    with pytest.raises(ValueError):
+        optimize_lineup(candidates, n_drivers=5, n_constructors=2, budget=1_000_000)
+    with pytest.raises(ValueError):
+        optimize_lineup(candidates, locked=['driver_1'], excluded=['driver_1'])
+    with pytest.raises(ValueError):
+        optimize_lineup(candidates, locked=['nobody'])
+    # Prices in whole dollars would need a DP column per dollar
+    with pytest.raises(ValueError):
+        optimize_lineup(candidates.assign(Price=candidates['Price'] + 1), n_drivers=2, n_constructors=1)
+
+
+def test_recent_form_is_scored_per_canonical_entity():
+    def scored_round(driver_points, team_points):
+        return {'points': {
+            'driver': pd.DataFrame({'DriverId': list(driver_points), 'TotalDriverPoints': list(driver_points.values())}),
+            'constructor': pd.DataFrame({'TeamId': list(team_points), 'TotalConstructorPoints': list(team_points.values())}),
+        }}
+    scored_rounds = [scored_round({'max_verstappen': 50.0, 'lewis_hamilton': 0.0}, {'rb': 10.0}),
+                     scored_round({'max_verstappen': 2.0, 'lewis_hamilton': 30.0}, {'visa_cash_app_rb': 12.0})]
+    prices = pd.DataFrame({'EntityType': ['driver', 'driver', 'driver', 'constructor'],
+                           'Name': ['Verstappen', 'Hamilton', 'Lindblad', 'Racing Bulls'],
+                           'NameKey': ['verstappen', 'hamilton', 'lindblad', 'racing_bulls'], 'Price': [20.0, 18.0, 6.0, 7.0]})
+    registry = EntityRegistry.build({'driver': ['max_verstappen', 'lewis_hamilton'], 'constructor': ['rb', 'visa_cash_app_rb']}, prices)
+    current_prices = normalize_prices(prices, registry)
+
+    season = lineup_candidates(form_points(scored_rounds), current_prices, registry).set_index('EntityId')['Points']
+    recent = lineup_candidates(form_points(scored_rounds, window=1), current_prices, registry).set_index('EntityId')['Points']
+
+    assert season.to_dict() == {'verstappen': 52.0, 'hamilton': 30.0, 'lindblad': 0.0, 'racing_bulls': 22.0}
+    assert recent.to_dict() == {'verstappen': 2.0, 'hamilton': 30.0, 'lindblad': 0.0, 'racing_bulls': 12.0}
+    lineup = optimize_lineup(lineup_candidates(form_points(scored_rounds, window=1), current_prices, registry),
+                             n_drivers=1, n_constructors=1, budget=26_000_000, locked=['Racing Bulls'], registry=registry)
+    assert lineup['Name'].tolist() == ['Hamilton', 'Racing Bulls']
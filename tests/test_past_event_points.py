@@ -0,0 +1,103 @@
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Add the project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.data_prep import get_past_event_points
+
+
+def test_run_backfill_collects_summary_and_resumes_from_checkpoint(tmp_path, monkeypatch):
+    """Failures are reported per event and successes are skipped on the next run."""
+    monkeypatch.setenv('F1_POINTS_CACHE_DIR', str(tmp_path / 'cache'))
+    monkeypatch.setattr(get_past_event_points, 'ProcessPoolExecutor', ThreadPoolExecutor)
+    monkeypatch.setattr(get_past_event_points.functions, 'resolve_season_year', lambda year=None, **kwargs: year)
+    monkeypatch.setattr(get_past_event_points, 'get_past_event_names', lambda year=None: ['Good GP', 'Bad GP', 'Empty GP'])
+
+    calls = []
+
+    def fake_get_event_points(event_name=None, year=None, return_dfs=False, force_refresh=False):
+        calls.append((year, event_name))
+        assert os.environ['F1_POINTS_CACHE_DIR'] == str(tmp_path / 'cache')
+        if event_name == 'Bad GP':
+            raise KeyError('TeamId')
+        if event_name == 'Empty GP':
+            return None
+        return 'drivers', 'constructors'
+
+    monkeypatch.setattr(get_past_event_points.functions, 'get_event_points', fake_get_event_points)
+    checkpoint_path = str(tmp_path / 'backfill_checkpoint.json')
+    summary_path = str(tmp_path / 'summary.json')
+
+    summary = get_past_event_points.run_backfill([2025], workers=2, checkpoint_path=checkpoint_path, summary_path=summary_path)
+
+    assert summary['counts'] == {'success': 1, 'skipped': 1, 'failed': 1}
+    statuses = {event['event_name']: event['status'] for event in summary['events']}
+    assert statuses == {'Good GP': 'success', 'Bad GP': 'failed', 'Empty GP': 'skipped'}
+    with open(summary_path, encoding='utf-8') as file:
+        assert json.load(file)['counts'] == summary['counts']
+    assert get_past_event_points.load_checkpoint(checkpoint_path) == {(2025, 'Good GP')}
+
+    calls.clear()
+    get_past_event_points.run_backfill([2025], workers=2, checkpoint_path=checkpoint_path)
+    assert sorted(calls) == [(2025, 'Bad GP'), (2025, 'Empty GP')]
+
+
+def test_run_backfill_records_a_stuck_event_as_failed_without_waiting_for_it(tmp_path, monkeypatch):
+    """A worker stuck past the event deadline does not hold up the other events, the summary or the checkpoint."""
+    monkeypatch.setenv('F1_POINTS_CACHE_DIR', str(tmp_path / 'cache'))
+    monkeypatch.setattr(get_past_event_points, 'ProcessPoolExecutor', ThreadPoolExecutor)
+    monkeypatch.setattr(get_past_event_points, '_DEADLINE_POLL_SECONDS', 0.05)
+    monkeypatch.setattr(get_past_event_points.functions, 'resolve_season_year', lambda year=None, **kwargs: year)
+    monkeypatch.setattr(get_past_event_points, 'get_past_event_names', lambda year=None: ['Stuck GP', 'Good GP', 'Other GP', 'Late GP'])
+    release = threading.Event()
+    lock, in_flight, most_in_flight = threading.Lock(), [0], [0]
+
+    def fake_get_event_points(event_name=None, year=None, return_dfs=False, force_refresh=False):
+        if event_name == 'Stuck GP':
+            release.wait(30)
+            return 'drivers', 'constructors'
+        with lock:
+            in_flight[0] += 1
+            most_in_flight[0] = max(most_in_flight[0], in_flight[0])
+        time.sleep(0.2)
+        with lock:
+            in_flight[0] -= 1
+        return 'drivers', 'constructors'
+
+    monkeypatch.setattr(get_past_event_points.functions, 'get_event_points', fake_get_event_points)
+    checkpoint_path = str(tmp_path / 'backfill_checkpoint.json')
+    try:
+        summary = get_past_event_points.run_backfill([2025], workers=2, checkpoint_path=checkpoint_path, event_timeout=0.3)
+    finally:
+        release.set()
+
+    statuses = {event['event_name']: (event['status'], event['error']) for event in summary['events']}
+    # Late GP waits for a free worker; its deadline starts when it runs, not when the backfill began
+    assert statuses == {'Stuck GP': ('failed', 'Timed out after 0.3s'), 'Good GP': ('success', None),
+                        'Other GP': ('success', None), 'Late GP': ('success', None)}
+    assert get_past_event_points.load_checkpoint(checkpoint_path) == {(2025, 'Good GP'), (2025, 'Other GP'), (2025, 'Late GP')}
+    # Only as many events as workers are handed out; the abandoned stuck event no longer holds a slot
+    assert most_in_flight[0] <= 2
+
+
+def test_sequential_backfill_reports_failed_events_and_exits_non_zero(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(get_past_event_points, 'get_past_event_names', lambda year=None: ['Good GP', 'Bad GP'])
+
+    def fake_get_event_points(event_name=None, year=None, return_dfs=False, force_refresh=False):
+        if event_name == 'Bad GP':
+            raise KeyError('TeamId')
+        return 'drivers', 'constructors'
+
+    monkeypatch.setattr(get_past_event_points.functions, 'get_event_points', fake_get_event_points)
+    summary_path = tmp_path / 'summary.json'
+    args = get_past_event_points.parse_args(['--years', '2025', '--summary', str(summary_path)])
+
+    assert get_past_event_points.run_past_event_points(args) == 1
+    assert "Bad GP (2025) failed: KeyError: 'TeamId'" in capsys.readouterr().out
+    assert json.loads(summary_path.read_text())['counts'] == {'success': 1, 'skipped': 0, 'failed': 1}
@@ -0,0 +1,48 @@
+import os
+import sys
+
+import pandas as pd
+
+# Add the project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.data_prep.points_schema import apply_points_schema, memory_usage_bytes, read_points_csv
+
+DATA_DIR = os.path.join(project_root, 'data')
+
+
+def test_apply_points_schema_types_ids_points_and_sprint_columns():
+    points_df = pd.DataFrame({
+        'DriverId': ['albon', 'alonso', 'albon'],
+        'TotalDriverPoints': [22.0, 5.0, 16.0],
+        'SprintPoints': [None, None, 3.0],
+        'EventName': ['Australian Grand Prix', 'Australian Grand Prix', 'Chinese Grand Prix'],
+        'RoundNumber': [1, 1, 2],
+    })
+
+    typed = apply_points_schema(points_df)
+
+    assert isinstance(typed['DriverId'].dtype, pd.CategoricalDtype)
+    assert isinstance(typed['EventName'].dtype, pd.CategoricalDtype)
+    assert typed['TotalDriverPoints'].dtype == 'int16'
+    assert typed['RoundNumber'].dtype == 'int16'
+    assert typed['SprintPoints'].dtype == 'Int16'
+    assert typed['SprintPoints'].isna().tolist() == [True, True, False]
+    pd.testing.assert_frame_equal(apply_points_schema(typed), typed)
+
+
+def test_apply_points_schema_keeps_fractional_points():
+    typed = apply_points_schema(pd.DataFrame({'RacePoints': [12.5, 9.0], 'Status': ['Finished', 'Finished']}))
+    assert typed['RacePoints'].dtype == 'float32'
+    assert typed['RacePoints'].tolist() == [12.5, 9.0]
+    assert typed['Status'].dtype == object
+
+
+def test_read_points_csv_shrinks_current_standings_without_changing_values():
+    path = os.path.join(DATA_DIR, 'driver_points_2025_current.csv')
+    untyped = pd.read_csv(path)
+    typed = read_points_csv(path)
+
+    assert memory_usage_bytes(typed) < memory_usage_bytes(untyped) / 2
+    pd.testing.assert_frame_equal(typed.astype(untyped.dtypes.to_dict()), untyped)
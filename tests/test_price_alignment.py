@@ -0,0 +1,60 @@
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+# Add the project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.data_prep.entity_registry import EntityRegistry, collect_price_rows
+from src.data_prep.price_alignment import align_round_prices, load_current_prices, load_price_history, value_table
+
+
+def write_snapshot(data_dir, snapshot_date, prices):
+    pd.DataFrame([{'EntityType': entity_type, 'Name': name, 'NameKey': name.lower().replace(' ', '_'), 'Price': price,
+                   'ScrapedAtUtc': f'{snapshot_date}T09:00:00+00:00'} for entity_type, name, price in prices]
+                 ).to_csv(data_dir / f'fantasygp_prices_{snapshot_date}.csv', index=False)
+
+
+def test_rounds_take_the_latest_snapshot_on_or_before_their_event_date(tmp_path):
+    write_snapshot(tmp_path, '2099-03-02', [('driver', 'Verstappen', 20.0), ('constructor', 'Racing Bulls', 6.0)])
+    write_snapshot(tmp_path, '2099-03-09', [('driver', 'Verstappen', 21.0), ('constructor', 'Racing Bulls', 6.5)])
+    write_snapshot(tmp_path, '2099-03-16', [('driver', 'Verstappen', 22.5)])
+    round_points = pd.DataFrame({
+        'RoundNumber': [1, 1, 2, 2, 3, 3],
+        'EventDate': ['2099-03-01', '2099-03-01', '2099-03-09', '2099-03-09', '2099-03-20', '2099-03-20'],
+        'EntityType': ['driver', 'constructor'] * 3,
+        'EntityId': ['max_verstappen', 'rb'] * 3,
+        'Points': [10.0, 4.0, 21.0, 13.0, 45.0, 0.0],
+    })
+
+    registry = EntityRegistry.build({'driver': ['max_verstappen'], 'constructor': ['rb']}, collect_price_rows(str(tmp_path)))
+
+    aligned = align_round_prices(round_points, load_price_history(str(tmp_path), registry), registry)
+
+    assert aligned[['RoundNumber', 'EntityId', 'SnapshotDate', 'Price']].values.tolist() == [
+        # Before the first snapshot: the earliest one
+        [1, 'rb', '2099-03-02', 6_000_000], [1, 'max_verstappen', '2099-03-02', 20_000_000],
+        # A snapshot taken on the event day counts
+        [2, 'rb', '2099-03-09', 6_500_000], [2, 'max_verstappen', '2099-03-09', 21_000_000],
+        # Racing Bulls is missing from the last snapshot and keeps its previous price
+        [3, 'rb', '2099-03-09', 6_500_000], [3, 'max_verstappen', '2099-03-16', 22_500_000],
+    ]
+    assert aligned['PointsPerMillion'].tolist() == pytest.approx([4 / 6, 0.5, 2.0, 1.0, 0.0, 2.0])
+
+
+def test_value_table_prices_fastf1_ids_through_the_registry(tmp_path):
+    pd.DataFrame({'EntityType': ['driver', 'driver', 'constructor'], 'Name': ['Verstappen', 'Hamilton', 'Red Bull'],
+                  'Price': [21.0, 18.0, 24.0]}).to_csv(tmp_path / 'fantasygp_prices_current.csv', index=False)
+    points = pd.DataFrame({'EntityType': ['driver', 'driver', 'constructor', 'constructor'],
+                           'EntityId': ['max_verstappen', 'lewis_hamilton', 'red_bull_racing', 'unknown_team'],
+                           'Points': [42.0, 9.0, 48.0, 7.0]})
+    registry = EntityRegistry.build({'driver': ['max_verstappen', 'lewis_hamilton'], 'constructor': ['red_bull_racing', 'unknown_team']},
+                                    collect_price_rows(str(tmp_path)))
+
+    value = value_table(points, load_current_prices(str(tmp_path), registry), registry)
+
+    assert value['EntityId'].tolist() == ['max_verstappen', 'red_bull_racing', 'lewis_hamilton']
+    assert value['PointsPerMillion'].tolist() == pytest.approx([2.0, 2.0, 0.5])
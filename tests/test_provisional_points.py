@@ -0,0 +1,112 @@
+import datetime
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add the project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.data_prep import functions
+from src.data_prep.points_schema import apply_points_schema
+from src.data_prep.provisional_points import ScoredSessionCache, score_weekend
+from src.data_prep.scoring_rules import DEFAULT_SCORING_RULES, ScoringRuleSet
+from src.data_prep.season_bundle import build_season_bundle
+from src.data_prep.season_schedule import clear_schedule_cache
+from src.data_prep.season_store import SeasonPointsStore
+from src.data_prep.synthetic_season import generate_session_results
+
+UTC = datetime.timezone.utc
+
+
+class CountingProvider(functions.SessionProvider):
+    cacheable = False
+
+    def __init__(self, fixtures):
+        self.fixtures = fixtures
+        self.loads = []
+
+    def load(self, year, event_name, session_type):
+        self.loads.append(session_type)
+        return self.fixtures.load(year, event_name, session_type)
+
+
+@pytest.fixture
+def sprint_weekend(synthetic_season):
+    """A synthetic 2099 season whose first round is a sprint weekend on 2099-03-01."""
+    season = synthetic_season(n_events=2, n_teams=4, sprint_ratio=1.0, first_race_date=datetime.date(2099, 3, 1))
+    provider = CountingProvider(season.fixtures)
+    functions.set_session_provider(provider)
+    return season.data_dir, season.fixtures, provider
+
+
+def test_merge_sessions_scores_a_partial_weekend():
+    plan = DEFAULT_SCORING_RULES.compile()
+    qualifying = generate_session_results('Qualifying', n_teams=3, rng=np.random.default_rng(1))
+    driver_points, _ = plan.score_session(qualifying, 'Qualifying')
+
+    with pytest.raises(ValueError):
+        plan.merge_sessions({'Qualifying': driver_points}, {}, 'conventional')
+    driver_slim, constructor_slim = plan.merge_sessions({'Qualifying': driver_points}, {}, 'conventional', allow_pending=True)
+
+    pole_sitter = qualifying.loc[qualifying['Position'] == 1, 'DriverId'].iloc[0]
+    assert driver_slim.set_index('DriverId')['TotalDriverPoints'].to_dict() == {
+        driver_id: (10.0 if driver_id == pole_sitter else 0.0) for driver_id in qualifying['DriverId']}
+    assert driver_slim['RacePoints'].isna().all() and driver_slim['TeammateQualiPoints'].isna().all()
+    assert sorted(constructor_slim['TeamId']) == ['team_0', 'team_1', 'team_2']
+    assert (constructor_slim['TotalConstructorPoints'] == 0).all()
+    assert constructor_slim['ConstructorRacePoints'].isna().all()
+
+
+def test_provisional_weekend_is_upgraded_with_only_the_race_scored(sprint_weekend):
+    data_dir, fixtures, provider = sprint_weekend
+
+    saturday_night = datetime.datetime(2099, 2, 28, 20, 0, tzinfo=UTC)
+    driver_points, constructor_points, provisional = score_weekend(year=2099, now=saturday_night)
+    assert provisional
+    assert provider.loads == ['Sprint', 'Qualifying']
+    assert driver_points['RacePoints'].isna().all() and driver_points['TotalSprintRacePoints'].notna().all()
+    most_recent = pd.read_csv(data_dir / 'driver_points_2099_most_recent.csv')
+    assert most_recent['Provisional'].all()
+    # Provisional points never reach the season store the standings are built from
+    assert SeasonPointsStore().rounds('driver', 2099) == []
+    assert build_season_bundle(2099)['most_recent_provisional'] == {'driver': True, 'constructor': True}
+
+    sunday_night = datetime.datetime(2099, 3, 1, 20, 0, tzinfo=UTC)
+    driver_points, constructor_points, provisional = score_weekend(year=2099, now=sunday_night)
+    assert not provisional
+    assert provider.loads == ['Sprint', 'Qualifying', 'Race']
+    assert 'Provisional' not in pd.read_csv(data_dir / 'driver_points_2099_most_recent.csv').columns
+    assert SeasonPointsStore().rounds('driver', 2099) == [1]
+
+    session_dfs = {session_type: fixtures.load(2099, 'Synthetic Grand Prix 1', session_type)
+                   for session_type in ('Sprint', 'Qualifying', 'Race')}
+    expected_driver, expected_constructor = DEFAULT_SCORING_RULES.compile().score_event(session_dfs, 'sprint_qualifying')
+    pd.testing.assert_frame_equal(driver_points.drop(columns='EventName'), apply_points_schema(expected_driver))
+    pd.testing.assert_frame_equal(constructor_points.drop(columns='EventName'), apply_points_schema(expected_constructor))
+
+
+def test_scored_session_cache_is_keyed_by_scoring_rules(tmp_path):
+    default_cache = ScoredSessionCache(DEFAULT_SCORING_RULES, root=str(tmp_path))
+    league_cache = ScoredSessionCache(ScoringRuleSet({'pole_points': 3}), root=str(tmp_path))
+    qualifying = generate_session_results('Qualifying', n_teams=2)
+    default_cache.put(2099, 1, 'Qualifying', *DEFAULT_SCORING_RULES.compile().score_session(qualifying, 'Qualifying'))
+
+    assert default_cache.get(2099, 1, 'Qualifying')[1] is None
+    assert league_cache.get(2099, 1, 'Qualifying') is None
+
+
+def test_session_missing_from_the_schedule_is_skipped(sprint_weekend):
+    data_dir, _, provider = sprint_weekend
+    sessions_path = data_dir / 'sessions_2099.csv'
+    sessions = pd.read_csv(sessions_path)
+    sessions.drop(index=sessions.index[(sessions['RoundNumber'] == 1) & (sessions['SessionName'] == 'Sprint')]).to_csv(sessions_path, index=False)
+    clear_schedule_cache()
+
+    _, _, provisional = score_weekend(year=2099, now=datetime.datetime(2099, 2, 28, 20, 0, tzinfo=UTC))
+
+    assert provisional
+    assert provider.loads == ['Qualifying']
@@ -0,0 +1,99 @@
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+# Add the project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.data_prep import data_manifest, functions, run_pipeline
+from src.data_prep.season_schedule import DATA_DIR_ENV, load_season_schedule
+
+
+@pytest.fixture
+def offline_pipeline(synthetic_season):
+    """A synthetic 2099 season recorded as fixtures, with the pipeline pointed at a temporary data dir."""
+    season = synthetic_season(n_events=3, n_teams=4)
+    return season.data_dir, season.schedule
+
+
+def test_context_matches_the_pandas_schedule_helpers(offline_pipeline):
+    data_dir, schedule = offline_pipeline
+    context = run_pipeline.PipelineContext(str(data_dir))
+
+    assert context.season_year == functions.resolve_season_year(require_past_races=True) == 2099
+    assert [event_name for _, event_name in context.past_events(2099)] == \
+        list(load_season_schedule(2099).past_race_event_names(context.now))
+    assert context.latest_race(2099)['event_name'] == schedule['EventName'].iloc[-1]
+
+
+def test_second_run_skips_every_stage_until_an_input_changes(offline_pipeline):
+    data_dir, _ = offline_pipeline
+
+    first = run_pipeline.run_pipeline(skip=['event_schedule'])
+    assert first == {'event_schedule': 'skipped', 'event_points': 'ran', 'combine': 'ran', 'entity_registry': 'ran', 'season_bundle': 'ran'}
+    assert (data_dir / 'driver_points_2099_most_recent.csv').exists()
+    assert (data_dir / 'driver_points_2099_current.csv').exists()
+
+    started = time.perf_counter()
+    second = run_pipeline.run_pipeline(skip=['event_schedule'])
+    assert second == {'event_schedule': 'skipped', 'event_points': 'fresh', 'combine': 'fresh', 'entity_registry': 'fresh', 'season_bundle': 'fresh'}
+    assert time.perf_counter() - started < 0.5
+
+    # Editing an output makes its stage stale again; stages downstream follow through their input hashes
+    os.remove(data_dir / 'driver_points_2099_current.csv')
+    assert run_pipeline.run_pipeline(skip=['event_schedule'], dry_run=True)['combine'] == 'stale'
+    assert run_pipeline.run_pipeline(skip=['event_schedule'])['combine'] == 'ran'
+    assert run_pipeline.run_pipeline(skip=['event_schedule'], force=['event_points'])['event_points'] == 'ran'
+
+
+def test_no_op_run_stays_within_budget_on_a_large_data_dir(offline_pipeline, monkeypatch):
+    data_dir, _ = offline_pipeline
+    run_pipeline.run_pipeline(skip=['event_schedule'])
+    # Files no stage reads, e.g. an archive of past seasons: a no-op run must not pay for them
+    archive_dir = data_dir / 'archive'
+    archive_dir.mkdir()
+    for index in range(2000):
+        (archive_dir / f'file_{index}.csv').write_bytes(os.urandom(4096))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("a no-op run rebuilt the manifest")
+    monkeypatch.setattr(data_manifest, 'build_manifest', fail)
+    started = time.perf_counter()
+    results = run_pipeline.run_pipeline(skip=['event_schedule'])
+    assert time.perf_counter() - started < 0.5
+    assert set(results.values()) == {'skipped', 'fresh'}
+
+
+def test_stages_wait_without_a_past_race(tmp_path, monkeypatch):
+    monkeypatch.setenv(DATA_DIR_ENV, str(tmp_path))
+    assert run_pipeline.run_pipeline(skip=['event_schedule']) == {
+        'event_schedule': 'skipped', 'event_points': 'idle', 'combine': 'idle', 'entity_registry': 'idle', 'season_bundle': 'idle'}
+    with pytest.raises(ValueError):
+        run_pipeline.run_pipeline(force=['publish'])
+
+
+def test_no_op_run_does_not_import_pandas(offline_pipeline):
+    data_dir, _ = offline_pipeline
+    run_pipeline.run_pipeline(skip=['event_schedule'])
+
+    check = ("import sys; from src.data_prep import run_pipeline; "
+             "run_pipeline.main(['--skip', 'event_schedule']); assert 'pandas' not in sys.modules")
+    completed = subprocess.run([sys.executable, '-c', check], cwd=project_root, capture_output=True, text=True,
+                               env={**os.environ, DATA_DIR_ENV: str(data_dir)})
+    assert completed.returncode == 0, completed.stderr
+    assert 'nothing to do' in completed.stdout
+
+
+def test_stages_must_implement_every_hook():
+    class InputsOnlyStage(run_pipeline.PipelineStage):
+        name = 'inputs_only'
+
+        def inputs(self, context):
+            return {}
+
+    with pytest.raises(TypeError):
+        InputsOnlyStage()
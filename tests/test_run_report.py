@@ -0,0 +1,74 @@
+import json
+import os
+import sys
+
+import pytest
+
+# Add the project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.data_prep import run_report
+from src.data_prep.scoring_rules import DEFAULT_SCORING_RULES
+from tests.test_scoring_rules import build_session_dfs
+
+
+def test_stage_is_a_no_op_without_a_run_report(monkeypatch):
+    monkeypatch.delenv(run_report.RUN_REPORT_PATH_ENV, raising=False)
+    with run_report.recorded_run('test') as recorder:
+        with run_report.stage('score') as record:
+            pass
+    assert recorder is None and record is None
+    assert run_report.get_run_recorder().stages == []
+
+
+def test_recorded_run_writes_stage_timings_for_event_scoring(tmp_path, monkeypatch):
+    report_path = tmp_path / 'report.json'
+    monkeypatch.setenv(run_report.RUN_REPORT_PATH_ENV, str(report_path))
+
+    with run_report.recorded_run('test_entry_point'):
+        DEFAULT_SCORING_RULES.compile().score_event(build_session_dfs(), 'sprint_qualifying')
+
+    report = json.loads(report_path.read_text(encoding='utf-8'))
+    assert report['entry_point'] == 'test_entry_point' and report['status'] == 'success'
+    names = [record['name'] for record in report['stages']]
+    assert names[0] == 'run'
+    assert names.count('score_driver_session') == 3 and names.count('score_constructor_session') == 2
+    assert 'merge' in names
+    for record in report['stages']:
+        assert record['wall_seconds'] >= 0 and record['cpu_seconds'] >= 0 and record['peak_memory_bytes'] >= 0
+    merge = next(record for record in report['stages'] if record['name'] == 'merge')
+    assert merge['parent'] == 'run' and merge['event_format'] == 'sprint_qualifying'
+    assert report['totals']['score_driver_session']['count'] == 3
+    assert not run_report.get_run_recorder().enabled
+
+
+def test_failed_stage_is_reported_and_reraised(tmp_path, monkeypatch):
+    report_path = tmp_path / 'report.json'
+    monkeypatch.setenv(run_report.RUN_REPORT_PATH_ENV, str(report_path))
+
+    with pytest.raises(ValueError):
+        with run_report.recorded_run('test'):
+            with run_report.stage('write'):
+                raise ValueError("disk full")
+
+    report = json.loads(report_path.read_text(encoding='utf-8'))
+    assert report['status'] == 'failed'
+    assert report['stages'][1]['status'] == 'failed' and report['stages'][1]['error'] == 'ValueError: disk full'
+
+
+def test_cprofile_dumps_outermost_profiled_stage_only(tmp_path, monkeypatch):
+    monkeypatch.setenv(run_report.RUN_REPORT_PATH_ENV, str(tmp_path / 'report.json'))
+    monkeypatch.setenv(run_report.PROFILE_ENV, 'cprofile')
+    monkeypatch.setenv(run_report.PROFILE_DIR_ENV, str(tmp_path / 'profiles'))
+
+    @run_report.stage('inner')
+    def inner():
+        return sum(range(1000))
+
+    with run_report.recorded_run('test'):
+        with run_report.stage('outer'):
+            inner()
+        inner()
+
+    assert sorted(os.listdir(tmp_path / 'profiles')) == ['001_outer.prof', '003_inner.prof']
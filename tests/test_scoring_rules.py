@@ -0,0 +1,108 @@
+import json
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+# Add the project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.data_prep import functions
+from src.data_prep.scoring_rules import DEFAULT_SCORING_RULES, ScoringRuleSet, load_scoring_rules
+
+
+def build_session_dfs():
+    """Two teams of two drivers over a sprint weekend."""
+    drivers = pd.DataFrame({
+        'DriverId': ['a', 'b', 'c', 'd'],
+        'TeamId': ['red', 'red', 'blue', 'blue'],
+    })
+    sprint = drivers.assign(Position=[2.0, 1.0, 4.0, 3.0], GridPosition=[1.0, 4.0, 2.0, 3.0],
+                            Points=[7.0, 8.0, 5.0, 6.0], Status=['Finished', 'Finished', 'Retired', 'Finished'])
+    qualifying = drivers.assign(Position=[1.0, 2.0, 3.0, 4.0], GridPosition=[float('nan')] * 4,
+                                Points=[float('nan')] * 4, Status=[''] * 4)
+    race = drivers.assign(Position=[3.0, 1.0, 2.0, 4.0], GridPosition=[1.0, 2.0, 3.0, 4.0],
+                          Points=[15.0, 25.0, 18.0, 12.0], Status=['Finished', 'Finished', 'Retired', 'Retired'])
+    return {'Sprint': sprint, 'Qualifying': qualifying, 'Race': race}
+
+
+def test_compiled_plan_default_rules_match_per_session_helpers():
+    """The default plan should produce exactly what the individual helpers produce."""
+    session_dfs = build_session_dfs()
+    driver_dfs, constructor_dfs = {}, {}
+    for session_type, df in build_session_dfs().items():
+        driver_dfs[session_type] = functions.calculate_intermediate_driver_points(df, session_type)
+        if session_type != 'Qualifying':
+            constructor_dfs[session_type] = functions.calculate_constructor_points(df, session_type)
+    expected_drivers = functions.slim_driver_points_df(
+        functions.calculate_final_driver_points(functions.merge_points_dataframes(driver_dfs), 'sprint_qualifying'),
+        'sprint_qualifying')
+    expected_constructors = functions.slim_constructor_points_df(
+        functions.merge_points_dataframes(constructor_dfs, merge_key='TeamId'), 'sprint_qualifying')
+
+    drivers, constructors = DEFAULT_SCORING_RULES.compile().score_event(session_dfs, 'sprint_qualifying')
+
+    pd.testing.assert_frame_equal(drivers, expected_drivers)
+    pd.testing.assert_frame_equal(constructors, expected_constructors)
+    assert drivers.set_index('DriverId')['TotalDriverPoints'].to_dict() == {'a': 37.0, 'b': 48.0, 'c': 35.0, 'd': 23.0}
+
+
+def test_custom_rule_set_changes_values_and_reuses_compiled_plan():
+    """Overridden values flow through every step and compile() returns the cached plan."""
+    rules = ScoringRuleSet({'pole_points': 3, 'constructor_finishing_points': {'both_cars': 9}})
+    assert rules.compile() is rules.compile()
+
+    drivers, constructors = rules.compile().score_event(build_session_dfs(), 'sprint_qualifying')
+
+    assert drivers.set_index('DriverId')['PolePoints'].tolist() == [3, 0, 0, 0]
+    finishing = constructors.set_index('TeamId')
+    assert finishing.loc['red', 'ConstructorSprintFinishingPoints'] == 9
+    assert finishing.loc['blue', 'ConstructorSprintFinishingPoints'] == 2
+    assert finishing.loc['blue', 'ConstructorRaceFinishingPoints'] == 0
+
+
+def test_scoring_rule_set_rejects_unknown_rules():
+    with pytest.raises(ValueError):
+        ScoringRuleSet({'fastest_lap_points': 1})
+    with pytest.raises(ValueError):
+        ScoringRuleSet({'teammate_points': {'Practice 1': 5}})
+
+
+def test_load_scoring_rules_reads_json_file_and_caches(tmp_path, monkeypatch):
+    rules_path = tmp_path / 'rules.json'
+    rules_path.write_text(json.dumps({'places_gained_multiplier': {'Race': 3}}))
+    monkeypatch.setenv('F1_POINTS_SCORING_RULES', str(rules_path))
+
+    rules = load_scoring_rules()
+
+    assert rules.places_gained_multiplier == {'Sprint': 1, 'Race': 3}
+    assert load_scoring_rules() is rules
+    monkeypatch.delenv('F1_POINTS_SCORING_RULES')
+    assert load_scoring_rules() is DEFAULT_SCORING_RULES
+
+
+def test_score_season_matches_per_event_scoring():
+    """Stacked grouped scoring should reproduce score_event for every round."""
+    plan = DEFAULT_SCORING_RULES.compile()
+    sprint_dfs = build_session_dfs()
+    conventional_dfs = {session_type: df.copy() for session_type, df in build_session_dfs().items() if session_type != 'Sprint'}
+    # A reserve driver only takes part in the conventional race
+    conventional_dfs['Race'] = pd.concat([conventional_dfs['Race'], pd.DataFrame({
+        'DriverId': ['e'], 'TeamId': ['blue'], 'Position': [5.0], 'GridPosition': [5.0], 'Points': [0.0], 'Status': ['Finished']})],
+        ignore_index=True)
+
+    season_results = pd.concat(
+        [df.assign(SessionType=st, RoundNumber=1, EventName='Sprint GP', EventFormat='sprint_qualifying') for st, df in sprint_dfs.items()] +
+        [df.assign(SessionType=st, RoundNumber=2, EventName='Conventional GP', EventFormat='conventional') for st, df in conventional_dfs.items()],
+        ignore_index=True)
+    driver_points, constructor_points = plan.score_season(season_results)
+
+    for event_round, event_format, session_dfs in [(1, 'sprint_qualifying', build_session_dfs()), (2, 'conventional', conventional_dfs)]:
+        expected_drivers, expected_constructors = plan.score_event({st: df.copy() for st, df in session_dfs.items()}, event_format)
+        round_drivers = functions.slim_driver_points_df(driver_points[driver_points['RoundNumber'] == event_round], event_format)
+        round_constructors = functions.slim_constructor_points_df(
+            constructor_points[constructor_points['RoundNumber'] == event_round].copy(), event_format)
+        pd.testing.assert_frame_equal(round_drivers.reset_index(drop=True), expected_drivers.reset_index(drop=True), check_dtype=False)
+        pd.testing.assert_frame_equal(round_constructors.reset_index(drop=True), expected_constructors.reset_index(drop=True), check_dtype=False)
@@ -0,0 +1,95 @@
+import json
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+# Add the project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.data_prep import functions, run_pipeline
+from src.data_prep.points_schema import apply_points_schema, read_points_csv
+from src.data_prep.season_bundle import get_bundle_path, write_season_bundle
+
+
+@pytest.fixture
+def scored_season(synthetic_season):
+    """A synthetic 2099 season with every (past) round scored and two weekly price snapshots."""
+    data_dir, _, schedule = synthetic_season(n_events=3, n_teams=3)
+    run_pipeline.run_pipeline(skip=['event_schedule', 'season_bundle'])
+    for event_name in schedule['EventName'].unique()[:-1]:
+        functions.get_event_points(event_name, 2099)
+
+    price_files = []
+    for week, scraped_at in enumerate(['2099-03-02T09:00:00+00:00', '2099-03-09T09:00:00+00:00']):
+        prices = pd.DataFrame({
+            'EntityType': ['driver', 'constructor'],
+            'Name': ['Driver Zero', 'Team Zero'],
+            'NameKey': ['driver_0', 'team_0'],
+            'Price': [20.0 + week, 30.0 - week],
+            'ScrapedAtUtc': scraped_at,
+        })
+        price_files.append(f'fantasygp_prices_{scraped_at[:10]}.csv')
+        prices.to_csv(data_dir / price_files[-1], index=False)
+    prices.to_csv(data_dir / 'fantasygp_prices_current.csv', index=False)
+    # Listed newest first: the bundle orders snapshots by date, not by listing
+    (data_dir / 'fantasygp_price_files.json').write_text(json.dumps(price_files[::-1]))
+    return data_dir, schedule
+
+
+def table_frame(table):
+    return pd.DataFrame(table['data'], columns=table['columns'])
+
+
+def test_bundle_holds_everything_the_page_renders(scored_season):
+    data_dir, schedule = scored_season
+
+    bundle = json.loads(open(write_season_bundle(2099), encoding='utf-8').read())
+
+    assert bundle['year'] == 2099
+    assert table_frame(bundle['schedule'])['EventName'].tolist() == list(schedule['EventName'].unique())
+    assert [scored_round['RoundNumber'] for scored_round in bundle['rounds']] == [1, 2, 3]
+    first_round = bundle['rounds'][0]
+    expected = read_points_csv(data_dir / f"driver_points_2099_1_{first_round['EventName']}.csv")
+    pd.testing.assert_frame_equal(apply_points_schema(table_frame(first_round['driver'])), expected)
+    assert set(bundle['most_recent']) == {'driver', 'constructor'}
+    assert bundle['most_recent_provisional'] == {'driver': False, 'constructor': False}
+
+    # Every round precedes the first snapshot, so each takes the earliest one; unpriced entities are left out
+    by_round = table_frame(bundle['prices']['by_round'])
+    assert sorted(set(by_round['EntityId'])) == ['driver_0', 'team_0']
+    assert by_round['RoundNumber'].tolist() == [1, 1, 2, 2, 3, 3]
+    assert set(by_round['SnapshotDate']) == {'2099-03-02'}
+    driver_0 = by_round[by_round['EntityId'] == 'driver_0'].iloc[0]
+    assert driver_0['Price'] == 20_000_000
+    assert driver_0['PointsPerMillion'] == pytest.approx(driver_0['Points'] / 20)
+
+    value = table_frame(bundle['prices']['value'])
+    assert value.set_index('EntityId')['Price'].to_dict() == {'driver_0': 21_000_000, 'team_0': 29_000_000}
+
+
+def test_pipeline_rebuilds_the_bundle_when_prices_change(scored_season):
+    data_dir, _ = scored_season
+
+    assert run_pipeline.run_pipeline(skip=['event_schedule'])['season_bundle'] == 'ran'
+    assert os.path.exists(get_bundle_path(2099))
+    assert run_pipeline.run_pipeline(skip=['event_schedule'])['season_bundle'] == 'fresh'
+
+    (data_dir / 'fantasygp_prices_current.csv').write_text(
+        'EntityType,Name,NameKey,Price,ScrapedAtUtc\ndriver,Driver Zero,driver_0,25.0,2099-03-16T09:00:00+00:00\n')
+    assert run_pipeline.run_pipeline(skip=['event_schedule'])['season_bundle'] == 'ran'
+    bundle = json.loads(open(get_bundle_path(2099), encoding='utf-8').read())
+    assert table_frame(bundle['prices']['value'])['Price'].tolist() == [25_000_000]
+
+
+def test_current_prices_value_only_their_own_season(scored_season):
+    data_dir, _ = scored_season
+
+    # Prices scraped in a later season say nothing about what 2099's points were worth
+    (data_dir / 'fantasygp_prices_current.csv').write_text(
+        'EntityType,Name,NameKey,Price,ScrapedAtUtc\ndriver,Driver Zero,driver_0,25.0,2100-03-16T09:00:00+00:00\n')
+    bundle = json.loads(open(write_season_bundle(2099), encoding='utf-8').read())
+    assert bundle['prices']['value'] is None
+    assert bundle['prices']['by_round'] is not None
@@ -0,0 +1,90 @@
+import datetime
+import os
+import sys
+
+import pandas as pd
+
+# Add the project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.data_prep.season_schedule import load_season_schedule
+
+
+def write_sessions(data_dir, rows):
+    pd.DataFrame(rows, columns=['RoundNumber', 'EventDate', 'EventName', 'EventFormat', 'SessionName', 'SessionDateUtc']).to_csv(
+        os.path.join(data_dir, 'sessions_2030.csv'), index=False)
+
+
+def test_load_season_schedule_caches_until_file_changes(tmp_path):
+    write_sessions(tmp_path, [
+        [1, '2030-03-10', 'Opening GP', 'conventional', 'Qualifying', '2030-03-09 06:00:00'],
+        [1, '2030-03-10', 'Opening GP', 'conventional', 'Race', '2030-03-10 05:00:00'],
+        [2, '2030-03-24', 'Second GP', 'sprint_qualifying', 'Race', '2030-03-24 07:00:00'],
+    ])
+    schedule = load_season_schedule(2030, data_dir=str(tmp_path))
+    assert load_season_schedule(2030, data_dir=str(tmp_path)) is schedule
+    assert schedule.get_round_number('Second GP') == 2
+    assert schedule.get_race_by_round(1)['EventName'] == 'Opening GP'
+
+    write_sessions(tmp_path, [
+        [1, '2030-03-10', 'Renamed GP', 'conventional', 'Race', '2030-03-10 05:00:00'],
+    ])
+    stat = os.stat(tmp_path / 'sessions_2030.csv')
+    os.utime(tmp_path / 'sessions_2030.csv', ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    reloaded = load_season_schedule(2030, data_dir=str(tmp_path))
+    assert reloaded is not schedule
+    assert reloaded.get_race_by_event_name('Opening GP') is None
+    assert reloaded.get_round_number('Renamed GP') == 1
+
+
+def test_past_race_event_names_counts_races_from_end_of_event_day(tmp_path):
+    write_sessions(tmp_path, [
+        [1, '2030-03-10', 'Opening GP', 'conventional', 'Race', '2030-03-10 05:00:00'],
+        [2, '2030-03-24', 'Second GP', 'conventional', 'Race', '2030-03-24 07:00:00'],
+        [3, 'TBC', 'Unknown GP', 'conventional', 'Race', ''],
+    ])
+    schedule = load_season_schedule(2030, data_dir=str(tmp_path))
+    utc = datetime.timezone.utc
+
+    assert list(schedule.past_race_event_names(datetime.datetime(2030, 3, 10, 23, 0, tzinfo=utc))) == []
+    assert list(schedule.past_race_event_names(datetime.datetime(2030, 3, 11, tzinfo=utc))) == ['Opening GP']
+    assert list(schedule.past_race_event_names(datetime.datetime(2031, 1, 1, tzinfo=utc))) == ['Opening GP', 'Second GP']
+    assert not schedule.has_past_races(datetime.datetime(2030, 1, 1, tzinfo=utc))
+
+
+def test_session_time_index_matches_full_scan_for_many_times():
+    """searchsorted lookups agree with filtering and idxmax over the real schedule."""
+    from src.data_prep.season_schedule import SessionTimeIndex
+
+    sessions = pd.read_csv(os.path.join(project_root, 'data', 'sessions_2026.csv'))
+    time_index = SessionTimeIndex(sessions)
+    query_times = pd.date_range('2026-02-01', '2026-12-31', freq='D', tz='UTC')
+
+    latest = time_index.latest_before_many('Qualifying', query_times)
+
+    parsed = sessions[sessions['SessionName'] == 'Qualifying'].copy()
+    parsed['SessionDateUtc'] = pd.to_datetime(parsed['SessionDateUtc'], utc=True)
+    for query_time in query_times[::17]:
+        past = parsed[parsed['SessionDateUtc'] < query_time]
+        if past.empty:
+            assert query_time not in latest.index
+        else:
+            expected = past.loc[past['SessionDateUtc'].idxmax()]
+            assert latest.loc[query_time, 'EventName'] == expected['EventName']
+            pd.testing.assert_frame_equal(time_index.latest_before('Qualifying', query_time), past.loc[[expected.name]])
+    assert list(latest.columns) == list(sessions.columns)
+
+
+def test_session_time_index_ties_pick_first_row_like_idxmax():
+    from src.data_prep.season_schedule import SessionTimeIndex
+
+    sessions = pd.DataFrame({
+        'SessionName': ['Race', 'Race', 'Race'],
+        'SessionDateUtc': ['2030-03-10 05:00:00', '2030-03-10 05:00:00', '2030-03-01 05:00:00'],
+        'EventName': ['First', 'Second', 'Earlier'],
+    })
+    result = SessionTimeIndex(sessions).latest_before('Race', datetime.datetime(2030, 4, 1))
+    assert result['EventName'].tolist() == ['First']
+    assert SessionTimeIndex(sessions).latest_before('Sprint', datetime.datetime(2030, 4, 1)).empty
@@ -0,0 +1,73 @@
+import os
+import shutil
+import sys
+
+import pandas as pd
+
+# Add the project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.data_prep import combine_event_points, functions
+from src.data_prep.season_store import SeasonPointsStore, import_event_csvs
+
+DATA_DIR = os.path.join(project_root, 'data')
+EVENTS = [(4, 'Bahrain Grand Prix'), (5, 'Saudi Arabian Grand Prix'), (6, 'Miami Grand Prix')]
+
+
+def test_write_event_types_round_and_ids(tmp_path):
+    store = SeasonPointsStore(str(tmp_path))
+    points_df = pd.DataFrame({'DriverId': ['albon', 'alonso'], 'TotalDriverPoints': [22.0, 5.0], 'EventName': ['Australian Grand Prix'] * 2})
+    store.write_event('driver', 2025, 1, points_df)
+
+    stored = store.read_event('driver', 2025, 1)
+    assert stored['RoundNumber'].dtype == 'int16'
+    assert isinstance(stored['DriverId'].dtype, pd.CategoricalDtype)
+    assert stored['TotalDriverPoints'].tolist() == [22.0, 5.0]
+    assert store.read_event('driver', 2025, 2) is None
+
+
+def test_read_season_concatenates_rounds_in_order(tmp_path):
+    store = SeasonPointsStore(str(tmp_path))
+    for event_round in (10, 2, 1):
+        store.write_event('constructor', 2025, event_round, pd.DataFrame({'TeamId': [f'team_{event_round}'], 'EventName': [f'Event {event_round}']}))
+
+    assert store.rounds('constructor', 2025) == [1, 2, 10]
+    season_df = store.read_season('constructor', 2025)
+    assert season_df['RoundNumber'].tolist() == [1, 2, 10]
+    assert isinstance(season_df['TeamId'].dtype, pd.CategoricalDtype)
+    assert store.read_season('driver', 2025).empty
+
+
+def test_write_event_points_without_csv_export_only_writes_store(tmp_path):
+    store = SeasonPointsStore(str(tmp_path))
+    driver_df = pd.DataFrame({'DriverId': ['albon'], 'TotalDriverPoints': [1.0], 'EventName': ['Test Grand Prix']})
+    constructor_df = pd.DataFrame({'TeamId': ['williams'], 'TotalConstructorPoints': [1.0], 'EventName': ['Test Grand Prix']})
+
+    functions.write_event_points(driver_df, constructor_df, 1999, 1, 'Test Grand Prix', export_csv=False, store=store)
+
+    assert store.rounds('driver', 1999) == [1] and store.rounds('constructor', 1999) == [1]
+    assert not os.path.exists(os.path.join(DATA_DIR, 'driver_points_1999_1_Test Grand Prix.csv'))
+
+
+def test_combine_from_store_matches_csv_combine(tmp_path):
+    csv_dir = tmp_path / 'csv'
+    store_dir = tmp_path / 'store'
+    for data_dir in (csv_dir, store_dir):
+        data_dir.mkdir()
+    for event_round, event_name in EVENTS:
+        for entity_type in combine_event_points.ENTITY_TYPES:
+            shutil.copy(combine_event_points.get_event_points_path(entity_type, 2025, event_round, event_name, DATA_DIR), csv_dir)
+            shutil.copy(combine_event_points.get_event_points_path(entity_type, 2025, event_round, event_name, DATA_DIR), store_dir)
+    assert import_event_csvs(2025, SeasonPointsStore(str(store_dir / 'season_store')), data_dir=str(store_dir)) == 6
+    for file_name in os.listdir(store_dir):
+        if file_name.endswith('.csv'):
+            os.remove(store_dir / file_name)
+
+    combine_event_points.combine_points(2025, EVENTS, data_dir=str(csv_dir))
+    combine_event_points.combine_points(2025, EVENTS, data_dir=str(store_dir))
+
+    for entity_type in combine_event_points.ENTITY_TYPES:
+        expected = pd.read_csv(combine_event_points.get_current_points_path(entity_type, 2025, str(csv_dir)))
+        combined = pd.read_csv(combine_event_points.get_current_points_path(entity_type, 2025, str(store_dir)))
+        pd.testing.assert_frame_equal(combined, expected)
@@ -0,0 +1,108 @@
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+# Add the project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.data_prep import combine_event_points, functions
+from src.data_prep.season_store import SeasonPointsStore
+from src.data_prep.session_fixtures import (FixtureSessionProvider, RecordingSessionProvider, SyntheticSessionProvider,
+                                            slugify)
+
+
+@pytest.fixture
+def offline_season(synthetic_season):
+    """A synthetic 2099 season recorded as fixtures, with the pipeline pointed at a temporary data dir."""
+    season = synthetic_season(n_events=4, n_teams=5)
+    return season.data_dir, season.fixtures, season.schedule
+
+
+def test_fixture_provider_replays_recorded_results_and_rejects_missing(tmp_path):
+    fixtures = FixtureSessionProvider(str(tmp_path))
+    recorded = pd.DataFrame({'DriverId': ['albon'], 'TeamId': ['williams'], 'Q1': [pd.Timedelta(seconds=80.5)]})
+    path = fixtures.record(2025, 'São Paulo Grand Prix', 'Race', recorded)
+
+    assert path.endswith(os.path.join('2025', 'sao_paulo_grand_prix', 'race.parquet'))
+    pd.testing.assert_frame_equal(fixtures.load(2025, 'São Paulo Grand Prix', 'Race'), recorded)
+    with pytest.raises(ValueError):
+        fixtures.load(2025, 'São Paulo Grand Prix', 'Qualifying')
+
+
+def test_recording_provider_saves_what_the_inner_provider_returns(tmp_path):
+    fixtures = FixtureSessionProvider(str(tmp_path))
+    recording = RecordingSessionProvider(SyntheticSessionProvider(n_teams=3), fixtures)
+
+    loaded = recording.load(2099, 'Synthetic Grand Prix 1', 'Race')
+
+    pd.testing.assert_frame_equal(fixtures.load(2099, 'Synthetic Grand Prix 1', 'Race'), loaded)
+    assert not recording.cacheable
+    assert slugify('Sprint Shootout') == 'sprint_shootout'
+
+
+def test_get_event_points_runs_offline_against_fixtures(offline_season):
+    data_dir, fixtures, schedule = offline_season
+
+    for event_name in schedule['EventName'].unique():
+        driver_points, constructor_points = functions.get_event_points(event_name=event_name, year=2099, return_dfs=True)
+        assert len(driver_points) == 10 and len(constructor_points) == 5
+
+    assert SeasonPointsStore().rounds('driver', 2099) == [1, 2, 3, 4]
+    events = list(schedule[['RoundNumber', 'EventName']].drop_duplicates().itertuples(index=False, name=None))
+    assert combine_event_points.combine_points(2099, events, data_dir=str(data_dir))
+    combined = pd.read_csv(combine_event_points.get_current_points_path('driver', 2099, str(data_dir)))
+    assert len(combined) == 40
+    # Fixture sessions are not real results, so they never reach the local results store
+    assert not os.path.exists(os.environ['F1_POINTS_RESULTS_STORE_DIR'])
+
+
+def test_batch_and_per_event_scoring_agree_on_fixture_season(offline_season):
+    _, _, schedule = offline_season
+    event_names = schedule['EventName'].unique().tolist()
+
+    driver_points, _ = functions.get_season_points(year=2099, event_names=event_names, return_dfs=True)
+    event_driver_points, _ = functions.get_event_points(event_name=event_names[0], year=2099, return_dfs=True)
+
+    first_round = driver_points[driver_points['RoundNumber'] == 1]
+    assert (dict(zip(first_round['DriverId'], first_round['TotalDriverPoints'].astype(float))) ==
+            dict(zip(event_driver_points['DriverId'].astype(str), event_driver_points['TotalDriverPoints'].astype(float))))
+
+
+def test_synthetic_provider_is_deterministic_per_session():
+    provider = SyntheticSessionProvider(n_teams=4, seed=3)
+    first = provider.load(2099, 'Synthetic Grand Prix 1', 'Race')
+    pd.testing.assert_frame_equal(provider.load(2099, 'Synthetic Grand Prix 1', 'Race'), first)
+    assert not first.equals(provider.load(2099, 'Synthetic Grand Prix 2', 'Race'))
+
+
+def test_provider_without_load_fails_when_created():
+    class NamedOnlyProvider(functions.SessionProvider):
+        name = 'named_only'
+
+    with pytest.raises(TypeError):
+        NamedOnlyProvider()
+
+
+def test_event_with_an_unclassified_driver_is_still_scored(offline_season):
+    _, fixtures, schedule = offline_season
+
+    class UnclassifiedDriverProvider(functions.SessionProvider):
+        """A driver who did not start has no Position in the final results."""
+
+        cacheable = False
+
+        def load(self, year, event_name, session_type):
+            session_results = fixtures.load(year, event_name, session_type)
+            if session_type == 'Race':
+                session_results.loc[session_results.index[-1], 'Position'] = float('nan')
+            return session_results
+
+    functions.set_session_provider(UnclassifiedDriverProvider())
+    event_name = schedule['EventName'].iloc[0]
+    driver_points, constructor_points = functions.get_event_points(event_name=event_name, year=2099, return_dfs=True)
+
+    assert len(driver_points) == 10 and len(constructor_points) == 5
+    assert SeasonPointsStore().rounds('driver', 2099) == [1]
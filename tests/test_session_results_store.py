@@ -0,0 +1,58 @@
+import os
+import sys
+
+import pandas as pd
+
+# Add the project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.data_prep import functions
+from src.data_prep.session_results_store import SessionResultsStore
+
+
+def fake_fastf1_results(session_type):
+    return pd.DataFrame({
+        'DriverId': ['a', 'b'], 'TeamId': ['red', 'red'], 'Position': [1.0, 2.0], 'GridPosition': [2.0, 1.0],
+        'Points': [25.0, 18.0], 'Status': ['Finished', 'Finished'], 'Q1': ['1:30.0', '1:31.0'],
+    }, index=['1', '4'])
+
+
+def test_session_results_store_roundtrip_and_hash_check(tmp_path):
+    store = SessionResultsStore(str(tmp_path))
+    assert store.get(2026, 3, 'Race') is None
+
+    slim_results, content_hash = store.put(2026, 3, 'Race', fake_fastf1_results('Race'))
+
+    assert list(slim_results.columns) == functions.SESSION_RESULT_COLUMNS
+    pd.testing.assert_frame_equal(store.get(2026, 3, 'Race'), slim_results)
+    assert len(content_hash) == 64
+
+    with open(store.path_for(2026, 3, 'Race'), 'ab') as file:
+        file.write(b'corrupted')
+    assert store.get(2026, 3, 'Race') is None
+
+
+def test_load_event_session_results_reads_store_before_fastf1(tmp_path, monkeypatch):
+    """Only store misses (or forced refreshes) go through FastF1."""
+    monkeypatch.setenv('F1_POINTS_RESULTS_STORE_DIR', str(tmp_path))
+    fetched = []
+
+    def fake_load_session_results(year, event_name, session_type):
+        fetched.append(session_type)
+        return fake_fastf1_results(session_type)
+
+    monkeypatch.setattr(functions, 'load_session_results', fake_load_session_results)
+    SessionResultsStore(str(tmp_path)).put(2026, 7, 'Qualifying', fake_fastf1_results('Qualifying'))
+
+    session_dfs, timings = functions.load_event_session_results(2026, 'Test GP', ['Qualifying', 'Race'], event_round=7)
+    assert fetched == ['Race']
+    assert timings['stored_sessions'] == ['Qualifying']
+    assert list(session_dfs['Race'].columns) == functions.SESSION_RESULT_COLUMNS
+
+    fetched.clear()
+    functions.load_event_session_results(2026, 'Test GP', ['Qualifying', 'Race'], event_round=7)
+    assert fetched == []
+
+    functions.load_event_session_results(2026, 'Test GP', ['Qualifying', 'Race'], event_round=7, force_refresh=True)
+    assert sorted(fetched) == ['Qualifying', 'Race']
@@ -0,0 +1,59 @@
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+# Add the project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.data_prep.session_results_store import SESSION_RESULT_COLUMNS
+from src.data_prep.scoring_rules import DEFAULT_SCORING_RULES
+from src.data_prep.synthetic_season import generate_season, stack_season_results
+
+
+def test_generate_season_spreads_sprints_and_sizes_grids():
+    events = generate_season(n_events=8, n_teams=5, drivers_per_team=3, sprint_ratio=0.25, seed=1)
+
+    assert [event['RoundNumber'] for event in events] == list(range(1, 9))
+    assert [event['EventFormat'] for event in events].count('sprint_qualifying') == 2
+    for event in events:
+        for session_type, session_results in event['sessions'].items():
+            assert session_results.columns.tolist() == SESSION_RESULT_COLUMNS
+            assert len(session_results) == 15
+            assert session_results.groupby('TeamId').size().eq(3).all()
+        assert set(event['sessions']) == ({'Sprint', 'Qualifying', 'Race'} if event['EventFormat'] == 'sprint_qualifying'
+                                          else {'Qualifying', 'Race'})
+    assert events[0]['sessions']['Race']['Points'].tolist()[:3] == [25.0, 18.0, 15.0]
+
+
+def test_generated_season_scores_like_real_sessions():
+    events = generate_season(n_events=4, n_teams=10, sprint_ratio=0.5, seed=2)
+    driver_points, constructor_points = DEFAULT_SCORING_RULES.compile().score_season(stack_season_results(events))
+
+    assert len(driver_points) == 4 * 20 and len(constructor_points) == 4 * 10
+    expected_first = DEFAULT_SCORING_RULES.compile().score_event(
+        {session_type: df.copy() for session_type, df in events[0]['sessions'].items()}, events[0]['EventFormat'])[0]
+    first_round = driver_points[driver_points['RoundNumber'] == 1].set_index('DriverId')
+    pd.testing.assert_series_equal(first_round.loc[expected_first['DriverId'], 'TotalDriverPoints'].reset_index(drop=True),
+                                   expected_first['TotalDriverPoints'].reset_index(drop=True), check_dtype=False, check_names=False)
+
+
+def test_benchmark_suite_flags_regressions_against_baseline():
+    from benchmarks.bench_scoring_suite import compare_to_baseline, run_suite
+
+    current = run_suite(n_events=2, n_teams=4, repeat=1)
+    assert set(current['results']) == {'intermediate_driver_points', 'constructor_points', 'merge_points_dataframes',
+                                       'final_driver_points', 'score_season', 'combine'}
+
+    faster_baseline = {'config': current['config'], 'results': {name: seconds / 2 for name, seconds in current['results'].items()}}
+    assert all(regressed for *_, regressed in compare_to_baseline(current, faster_baseline, min_delta=0))
+    assert not any(regressed for *_, regressed in compare_to_baseline(current, current))
+    # A slowdown within the absolute floor is noise, whatever the ratio
+    floor = max(current['results'].values())
+    assert not any(regressed for *_, regressed in compare_to_baseline(current, faster_baseline, min_delta=floor))
+    # Timing more reliably does not invalidate a baseline
+    assert compare_to_baseline(current, {**faster_baseline, 'config': {**current['config'], 'repeat': 15}}, min_delta=0)
+    with pytest.raises(ValueError):
+        compare_to_baseline(current, {**faster_baseline, 'config': {**current['config'], 'teams': 99}})
@@ -0,0 +1,133 @@
+import datetime
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+# Add the project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.data_prep import functions
+from src.data_prep.points_schema import apply_points_schema
+from src.data_prep.scoring_rules import DEFAULT_SCORING_RULES
+from src.data_prep.season_store import SeasonPointsStore
+from src.data_prep.watch_weekend import WeekendWatcher, find_weekend, next_poll_at
+
+UTC = datetime.timezone.utc
+
+
+class SimulatedClock:
+    """A clock that only moves when the watcher sleeps."""
+
+    def __init__(self, now):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += datetime.timedelta(seconds=seconds)
+
+
+class PublishingProvider(functions.SessionProvider):
+    """
+    Replays fixtures, but only once each session's results are 'published' on the simulated clock.
+    Before that, loads fail as FastF1 does on a race weekend: no results, a network error, or a
+    partly classified results frame.
+    """
+
+    cacheable = False
+
+    def __init__(self, fixtures, clock, published_at):
+        self.fixtures = fixtures
+        self.clock = clock
+        self.published_at = published_at
+        self.loads = []
+
+    def load(self, year, event_name, session_type):
+        self.loads.append((session_type, self.clock()))
+        if self.clock() >= self.published_at[session_type]:
+            return self.fixtures.load(year, event_name, session_type)
+        failure = len(self.loads) % 3
+        if failure == 0:
+            raise ValueError(f"{session_type} results are not available yet")
+        if failure == 1:
+            raise ConnectionError(f"livetiming unreachable while loading {session_type}")
+        partial = self.fixtures.load(year, event_name, session_type)
+        partial.loc[partial.index[1:], 'Position'] = float('nan')
+        return partial
+
+
+@pytest.fixture
+def sprint_weekend(synthetic_season):
+    """A synthetic 2099 season whose first round is a sprint weekend on 2099-03-01."""
+    return synthetic_season(n_events=2, n_teams=4, sprint_ratio=1.0, first_race_date=datetime.date(2099, 3, 1)).fixtures
+
+
+def test_next_poll_waits_for_the_session_end_then_backs_off():
+    start = pd.Timestamp('2099-03-01 14:00', tz='UTC')
+
+    assert next_poll_at(start, 'Race', 0, start) == start + datetime.timedelta(hours=2)
+    after_end = start + datetime.timedelta(hours=2, minutes=1)
+    waits = [(next_poll_at(start, 'Race', attempts, after_end) - after_end).total_seconds() for attempts in range(6)]
+    assert waits == [60, 120, 240, 480, 900, 900]
+
+
+def test_watcher_scores_each_session_as_it_appears(sprint_weekend, capsys):
+    fixtures = sprint_weekend
+    clock = SimulatedClock(datetime.datetime(2099, 2, 28, 9, 0, tzinfo=UTC))
+    published_at = {
+        'Sprint': datetime.datetime(2099, 2, 28, 12, 5, tzinfo=UTC),
+        'Qualifying': datetime.datetime(2099, 2, 28, 16, 0, tzinfo=UTC),
+        'Race': datetime.datetime(2099, 3, 1, 16, 30, tzinfo=UTC),
+    }
+    provider = PublishingProvider(fixtures, clock, published_at)
+    functions.set_session_provider(provider)
+
+    weekend = find_weekend(year=2099, now=clock())
+    assert weekend['EventName'] == 'Synthetic Grand Prix 1'
+    assert list(weekend['SessionStartsUtc']) == ['Sprint', 'Qualifying', 'Race']
+
+    watcher = WeekendWatcher(weekend, clock=clock, sleep=clock.sleep)
+    scored_order = []
+    original_score_session = watcher.score_session
+
+    def record_score(session_type, session_results):
+        scored_order.append((session_type, clock()))
+        original_score_session(session_type, session_results)
+    watcher.score_session = record_score
+
+    driver_points, constructor_points = watcher.run()
+
+    # Each session is scored once, no later than one maximum poll interval after publication
+    assert [session_type for session_type, _ in scored_order] == ['Sprint', 'Qualifying', 'Race']
+    for session_type, scored_at in scored_order:
+        assert published_at[session_type] <= scored_at <= published_at[session_type] + datetime.timedelta(seconds=watcher.max_poll_seconds)
+    assert not any(loaded_at < weekend['SessionStartsUtc'][session_type] for session_type, loaded_at in provider.loads)
+    assert max(clock.sleeps) <= watcher.max_poll_seconds
+    # Polls check the schedule quietly; only loads and scores are logged
+    assert 'Most recent' not in capsys.readouterr().out
+
+    # Same points as scoring the whole weekend at once
+    session_dfs = {session_type: fixtures.load(2099, weekend['EventName'], session_type) for session_type in published_at}
+    expected_driver, expected_constructor = DEFAULT_SCORING_RULES.compile().score_event(session_dfs, weekend['EventFormat'])
+    pd.testing.assert_frame_equal(driver_points.drop(columns='EventName'), apply_points_schema(expected_driver))
+    pd.testing.assert_frame_equal(constructor_points.drop(columns='EventName'), apply_points_schema(expected_constructor))
+    assert SeasonPointsStore().rounds('driver', 2099) == [1]
+
+
+def test_watcher_gives_up_on_a_session_that_never_appears(sprint_weekend):
+    fixtures = sprint_weekend
+    clock = SimulatedClock(datetime.datetime(2099, 2, 28, 9, 0, tzinfo=UTC))
+    never = datetime.datetime(2100, 1, 1, tzinfo=UTC)
+    functions.set_session_provider(PublishingProvider(fixtures, clock, {'Sprint': never, 'Qualifying': never, 'Race': never}))
+
+    watcher = WeekendWatcher(find_weekend(year=2099, now=clock()), clock=clock, sleep=clock.sleep,
+                             give_up_after=datetime.timedelta(hours=6))
+
+    assert watcher.run() is None
+    assert watcher.abandoned == ['Sprint', 'Qualifying', 'Race']